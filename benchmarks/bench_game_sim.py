@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Simulated full-game benchmark on a virtual clock.
+
+Plays a scripted game (see live_client_standin.GameScript) through the real
+GameAutoLoader poll loop and TimerManager, with a VirtualClock standing in
+for time. Alerts go to VirtualAlertScheduler, a stand-in for AlertEngine
+that fires on the virtual clock in the advancing thread, so the due-time
+checks are deterministic; AlertEngine itself is not exercised (see
+tests/test_alert_audio.py). A simulated user starts ultimates and summoner
+spells as they come off cooldown, the UI tick reads every timer, and the
+loader applies level and haste updates on every poll. A 40-minute game
+runs in well under a second.
+
+Every ultimate that comes off cooldown is checked to have alerted exactly
+when due: `alert_threshold` seconds before it was ready, or right away when
+a cooldown or haste change moved that point into the past.
+
+Usage:
+    python benchmarks/bench_game_sim.py [--minutes 40] [--tick 1.0] [--seed 0]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from auto_loader import GameAutoLoader
+from champion_data import champion_data, summoner_spell_data
+from clock import VirtualClock
+from live_client_api import LiveClientAPI
+from live_client_standin import GameScript
+from slot_renderer import format_remaining
+from timer import TimerManager
+
+ALERT_THRESHOLD = 4
+ULT_USE_PER_SECOND = 0.05
+SPELL_USE_PER_SECOND = 0.02
+
+
+class ScriptedLiveClient(LiveClientAPI):
+    """LiveClientAPI answering allgamedata from a GameScript at the clock's time; no requests are made."""
+
+    def __init__(self, script: GameScript, clock, game_seconds: float):
+        super().__init__()
+        self.script = script
+        self.clock = clock
+        self.game_seconds = game_seconds
+        self.requests = 0
+
+    def get_all_game_data(self):
+        self.requests += 1
+        elapsed = self.clock.now()
+        if elapsed >= self.game_seconds:
+            return None
+        return self.script.snapshot(0, elapsed / self.game_seconds)
+
+    def is_game_active(self):
+        self.requests += 1
+        return self.clock.now() < self.game_seconds
+
+
+class VirtualAlertScheduler:
+    """Alert scheduler on the virtual clock that records when each alert fired."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.pending = {}
+        self.fired = []
+        self.cancelled = []
+
+    def schedule(self, key, deadline, cue=None, fallback=True, volume=None, on_fire=None):
+        self._drop(key)
+        # Like AlertEngine, a deadline that is already past fires right away.
+        due = max(deadline, self.clock.now())
+
+        def fire():
+            del self.pending[key]
+            self.fired.append((key, due, self.clock.now()))
+            if on_fire:
+                on_fire()
+
+        self.pending[key] = self.clock.call_at(deadline, fire)
+
+    def cancel(self, key):
+        """TimerManager cancels when a timer is no longer due to alert, e.g. it is already ready."""
+        self.cancelled.append((key, self.clock.now()))
+        self._drop(key)
+
+    def _drop(self, key):
+        handle = self.pending.pop(key, None)
+        if handle:
+            handle.cancel()
+
+
+class GameSimulation:
+    def __init__(self, minutes: float, tick: float, seed: int):
+        self.clock = VirtualClock()
+        self.game_seconds = minutes * 60
+        self.tick = tick
+        self.rng = random.Random(seed)
+        self.alerts = VirtualAlertScheduler(self.clock)
+        self.timer_manager = TimerManager(alert_scheduler=self.alerts, clock=self.clock)
+
+        self.loader = GameAutoLoader(poll_interval=3.0, clock=self.clock)
+        self.loader.api = ScriptedLiveClient(GameScript(seed), self.clock, self.game_seconds)
+        self.loader.set_callbacks(self._on_game_start, self._on_game_end, self._on_level_update)
+
+        self.ult_available = {}
+        self.ult_started_at = {}
+        self.counts = {"ticks": 0, "ult_starts": 0, "spell_starts": 0, "level_updates": 0, "ults_ready": 0, "alerts_cancelled": 0}
+        self.errors = []
+
+    def _on_game_start(self, enemy_team):
+        for slot, player in enumerate(enemy_team[:5]):
+            cooldowns = champion_data.get_all_cooldowns(player["champion"])
+            if cooldowns:
+                self.timer_manager.create_timer(slot, player["champion"], cooldowns, alert_threshold=ALERT_THRESHOLD,
+                                                ability_haste=player["ability_haste"], ultimate_haste=player["ultimate_haste"])
+                if player["level"] >= 0:
+                    self.timer_manager.set_level(slot, player["level"])
+            self.ult_available[slot] = player["level"] >= 0
+            for spell_slot, spell in enumerate((player["spell1"], player["spell2"])):
+                cooldown = summoner_spell_data.get_cooldown(spell)
+                if cooldown:
+                    self.timer_manager.create_summoner_spell_timer(slot, spell_slot, spell, cooldown, player["summoner_haste"])
+
+    def _on_level_update(self, levels_data):
+        self.counts["level_updates"] += 1
+        for slot, level_data in enumerate(levels_data[:5]):
+            timer = self.timer_manager.get_timer(slot)
+            self.ult_available[slot] = level_data["level"] >= 0
+            if timer and level_data["level"] >= 0:
+                if timer.level != level_data["level"]:
+                    self.timer_manager.set_level(slot, level_data["level"])
+                if timer.ability_haste != level_data["ability_haste"] or timer.ultimate_haste != level_data["ultimate_haste"]:
+                    self.timer_manager.update_haste(slot, level_data["ability_haste"], level_data["ultimate_haste"])
+            for spell_slot in (0, 1):
+                spell_timer = self.timer_manager.get_summoner_spell_timer(slot, spell_slot)
+                if spell_timer and spell_timer.summoner_haste != level_data["summoner_haste"]:
+                    self.timer_manager.update_summoner_haste(slot, spell_slot, level_data["summoner_haste"])
+
+    def _on_game_end(self):
+        for slot in list(self.timer_manager.timers):
+            self.timer_manager.remove_timer(slot)
+        for slot, spell_slot in list(self.timer_manager.summoner_spell_timers):
+            self.timer_manager.remove_summoner_spell_timer(slot, spell_slot)
+        self.loader.stop_async()
+
+    def _ui_tick(self):
+        """What the overlay update loop does per frame, plus a user clicking timers that are up."""
+        self.counts["ticks"] += 1
+        for slot, timer in self.timer_manager.timers.items():
+            was_active = timer.is_active
+            if not timer.is_ready():
+                format_remaining(timer.get_remaining_time())
+            elif was_active:
+                self._check_ult_alert(slot)
+            elif self.ult_available.get(slot) and self.rng.random() < ULT_USE_PER_SECOND * self.tick:
+                self.timer_manager.start_timer(slot)
+                self.ult_started_at[slot] = self.clock.now()
+                self.counts["ult_starts"] += 1
+
+        for (slot, spell_slot), timer in self.timer_manager.summoner_spell_timers.items():
+            if not timer.is_ready():
+                format_remaining(timer.get_remaining_time())
+            elif self.rng.random() < SPELL_USE_PER_SECOND * self.tick:
+                self.timer_manager.start_summoner_spell_timer(slot, spell_slot)
+                self.counts["spell_starts"] += 1
+
+        if self.loader.running:
+            self.clock.call_later(self.tick, self._ui_tick)
+
+    def _check_ult_alert(self, slot: int):
+        self.counts["ults_ready"] += 1
+        started_at = self.ult_started_at.pop(slot, None)
+        if started_at is None:
+            return
+        fired = [(due, at) for key, due, at in self.alerts.fired if key == ("ult", slot) and at >= started_at]
+        if not fired:
+            # A level-up can shorten a running cooldown so that it is over at
+            # once; TimerManager then cancels the alert instead of playing it.
+            if any(key == ("ult", slot) and at >= started_at for key, at in self.alerts.cancelled):
+                self.counts["alerts_cancelled"] += 1
+                return
+            self.errors.append(f"slot {slot}: ultimate started at {started_at:.1f} s became ready without an alert")
+        elif fired[-1][1] != fired[-1][0]:
+            self.errors.append(f"slot {slot}: alert due at {fired[-1][0]:.3f} s fired at {fired[-1][1]:.3f} s")
+
+    def run(self):
+        self.loader.running = True
+        self.clock.call_later(self.tick, self._ui_tick)
+        # The loader's own poll loop drives the clock: each wait between polls
+        # advances virtual time and runs the UI ticks and alerts that fall due.
+        self.loader._monitor_loop()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate a full game on a virtual clock.")
+    parser.add_argument("--minutes", type=float, default=40.0)
+    parser.add_argument("--tick", type=float, default=1.0, help="virtual seconds between UI ticks")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    champion_data.load()
+    summoner_spell_data.load()
+
+    simulation = GameSimulation(args.minutes, args.tick, args.seed)
+    start = time.perf_counter()
+    simulation.run()
+    elapsed = time.perf_counter() - start
+
+    counts = simulation.counts
+    print(f"{args.minutes:.0f} virtual minutes in {elapsed * 1000:.1f} ms ({simulation.clock.now() / elapsed:,.0f}x real time)")
+    print(f"  {simulation.loader.api.requests} polls, {counts['level_updates']} level updates, {counts['ticks']} UI ticks")
+    print(f"  {counts['ult_starts']} ultimate starts, {counts['spell_starts']} summoner spell starts, "
+          f"{len(simulation.alerts.fired)} alerts fired, {counts['ults_ready']} ultimates came back up "
+          f"({counts['alerts_cancelled']} early through a level-up, without an alert)")
+
+    if simulation.errors:
+        for error in simulation.errors[:20]:
+            print(f"✗ {error}")
+        return 1
+    print("✓ Every ultimate alerted exactly when due")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the normal and low-memory modes.
+
+Plays a headless session lifecycle under tracemalloc, once per mode and
+each in a fresh interpreter: load the game data, fill the five champion and
+ten summoner spell slots with icons, poll and parse allgamedata payloads
+(benchmarks/payloads) and render frames, keep a game's worth of per-second
+frame statistics and log lines, then end the game and clear the slots.
+Live traced memory is reported after startup, in game and after the game
+ended.
+
+Usage:
+    python benchmarks/bench_memory.py [--polls 200] [--minutes 30] [--top 10]
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+PAYLOAD_DIR = Path(__file__).resolve().parent / "payloads"
+PHASES = ("startup", "in_game", "after_game_end")
+CHAMPIONS = ("Garen", "Lee Sin", "Ahri", "Jinx", "Thresh")
+SPELLS = ("flash", "teleport", "smite", "ignite", "heal")
+
+
+def run_session(low_memory: bool, polls: int, minutes: float, top: int) -> dict:
+    """The lifecycle in this process; tracemalloc must not be running yet."""
+    profile_frames = 1
+    tracemalloc.start(profile_frames)
+
+    from app_logging import get_logger, setup_logging
+    from auto_loader import GameAutoLoader
+    from champion_data import champion_data, summoner_spell_data
+    from frame_stats import FrameStats
+    from memory_footprint import MemoryProfile, apply_low_memory, release_idle_memory
+    from slot_renderer import format_remaining, load_icon, render_champion, render_summoner_spell
+
+    profile = MemoryProfile(frames=profile_frames, top=top)
+    setup_logging("CRITICAL")
+    logger = get_logger("bench_memory")
+    frame_stats = FrameStats()
+    apply_low_memory(low_memory, frame_stats)
+
+    champion_data.load()
+    summoner_spell_data.load()
+    champion_data.set_icon_type(True)
+    gc.collect()
+    profile.take("startup")
+
+    payloads = [json.loads(path.read_text(encoding="utf-8")) for path in sorted(PAYLOAD_DIR.glob("allgamedata_*.json"))]
+    loader = GameAutoLoader()
+    loader.on_level_update = lambda levels_data: None
+    for payload in payloads:
+        loader._parse_enemy_team(loader.api.get_enemy_team(payload), payload)
+
+    base_images = [load_icon(champion_data.get_icon_path(name), 70) for name in CHAMPIONS]
+    base_images += [load_icon(summoner_spell_data.get_icon_path(name), 33) for name in SPELLS * 2]
+    displayed = [None] * len(base_images)
+    for poll in range(polls):
+        loader._handle_level_update(payloads[poll * len(payloads) // polls])
+        for index, base_image in enumerate(base_images):
+            text = format_remaining(float(poll % 180))
+            render = render_champion if index < len(CHAMPIONS) else render_summoner_spell
+            displayed[index] = render(base_image, text)
+            frame_stats.record("champion_slot" if index < len(CHAMPIONS) else "summoner_slot", 0.001)
+        frame_stats.record("frame", 0.004)
+    # A few log lines per second of the game, and a frame statistics row
+    # when recording (HUD shown or export requested; off by default).
+    for second in range(int(minutes * 60)):
+        if frame_stats.recording:
+            frame_stats.history.append(frame_stats.snapshot())
+        logger.info("Level update applied at %d s", second)
+    gc.collect()
+    profile.take("in_game")
+
+    base_images.clear()
+    displayed.clear()
+    if low_memory:
+        release_idle_memory()
+    gc.collect()
+    profile.take("after_game_end")
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    report = profile.report()
+    report["peak_bytes"] = peak
+    return report
+
+
+def run_child(mode: str, args) -> dict:
+    command = [sys.executable, __file__, "--child", mode, "--polls", str(args.polls), "--minutes", str(args.minutes),
+               "--top", str(args.top)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare traced memory of the normal and low-memory modes.")
+    parser.add_argument("--polls", type=int, default=200, help="level update polls and frames in the simulated game")
+    parser.add_argument("--minutes", type=float, default=30.0, help="game length for frame statistics and logs")
+    parser.add_argument("--top", type=int, default=10, help="source lines listed per phase")
+    parser.add_argument("--child", choices=("normal", "low_memory"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_session(args.child == "low_memory", args.polls, args.minutes, args.top)))
+        return 0
+
+    reports = {mode: run_child(mode, args) for mode in ("normal", "low_memory")}
+    phases = {mode: {phase["label"]: phase for phase in report["phases"]} for mode, report in reports.items()}
+
+    print(f"{'phase':16s} {'normal KiB':>11s} {'low memory KiB':>15s} {'saved':>8s}")
+    for label in PHASES:
+        normal = phases["normal"][label]["total_bytes"] / 1024
+        low = phases["low_memory"][label]["total_bytes"] / 1024
+        print(f"{label:16s} {normal:11.0f} {low:15.0f} {normal - low:+8.0f}")
+    print(f"{'peak':16s} {reports['normal']['peak_bytes'] / 1024:11.0f} {reports['low_memory']['peak_bytes'] / 1024:15.0f}")
+
+    print("\nLargest live allocations in game (normal mode):")
+    for entry in phases["normal"]["in_game"]["top_lines"][:args.top]:
+        print(f"  {entry['bytes'] / 1024:8.1f} KiB  {entry['module']}:{entry['line']}  {entry['code'][:60]}")
+
+    normal_after = phases["normal"]["after_game_end"]["total_bytes"]
+    low_after = phases["low_memory"]["after_game_end"]["total_bytes"]
+    if low_after > normal_after:
+        print(f"\n✗ Low memory mode holds more after the game ({low_after / 1024:.0f} KiB vs {normal_after / 1024:.0f} KiB)")
+        return 1
+    print(f"\n✓ Low memory mode holds {(normal_after - low_after) / 1024:.0f} KiB less after the game")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Headless render benchmark for the overlay slots.
+
+Renders champion and summoner spell frames through slot_renderer for every
+champion and spell, across UI scales, icon types and timer states, without
+Tk or a display. Reports per-frame timings and checks a pixel hash per case
+group against benchmarks/render_snapshots.json so optimizations cannot
+silently change the output.
+
+Snapshots depend on the timer font available on the machine; they are only
+compared when the font matches the one they were recorded with.
+
+Usage:
+    python benchmarks/bench_render.py [--repeat N] [--update-snapshots]
+"""
+
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from champion_data import champion_data, summoner_spell_data
+from slot_renderer import CHAMPION_TIMER_FONT_SIZE, get_timer_font, load_icon, render_champion, render_summoner_spell
+
+SNAPSHOT_PATH = Path(__file__).resolve().parent / "render_snapshots.json"
+
+SCALES = (0.5, 1.0, 1.1, 1.5, 2.0)
+ICON_TYPES = {"champion": True, "ult": False}
+
+CHAMPION_STATES = {
+    "ready": (None, True),
+    "cooldown": ("42", True),
+    "cooldown_long": ("2:05", True),
+    "unavailable": (None, False),
+    "unavailable_cooldown": ("1:30", False),
+}
+SUMMONER_STATES = {
+    "ready": None,
+    "cooldown": "7",
+    "cooldown_long": "4:10",
+}
+
+
+def font_id() -> str:
+    font = get_timer_font(CHAMPION_TIMER_FONT_SIZE)
+    getname = getattr(font, "getname", None)
+    return " ".join(getname()) if getname else "default"
+
+
+def load_base_images():
+    """Load every icon at every scale once; loading is not part of the frame timings."""
+    champions = {}
+    for icon_type, use_champion_icons in ICON_TYPES.items():
+        champion_data.set_icon_type(use_champion_icons)
+        for scale in SCALES:
+            size = int(64 * scale)
+            for champion in sorted(champion_data.get_champion_list()):
+                icon_path = champion_data.get_icon_path(champion)
+                if icon_path:
+                    champions.setdefault((icon_type, scale), []).append(load_icon(icon_path, size))
+
+    spells = {}
+    for scale in SCALES:
+        size = int(30 * scale)
+        for spell in sorted(summoner_spell_data.get_spell_list()):
+            icon_path = summoner_spell_data.get_icon_path(spell)
+            if icon_path:
+                spells.setdefault(scale, []).append(load_icon(icon_path, size))
+    return champions, spells
+
+
+def run_cases(champions, spells, repeat: int):
+    """Render every case `repeat` times; return (per-case hashes, per-kind frame times)."""
+    hashes = {}
+    timings = {"champion": [], "summoner_spell": []}
+
+    for (icon_type, scale), images in champions.items():
+        for state, (text, ult_available) in CHAMPION_STATES.items():
+            digest = hashlib.sha256()
+            for base_image in images:
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    frame = render_champion(base_image, text, ult_available)
+                    timings["champion"].append(time.perf_counter() - start)
+                digest.update(frame.tobytes())
+            hashes[f"champion/{icon_type}/{scale}/{state}"] = digest.hexdigest()
+
+    for scale, images in spells.items():
+        for state, text in SUMMONER_STATES.items():
+            digest = hashlib.sha256()
+            for base_image in images:
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    frame = render_summoner_spell(base_image, text)
+                    timings["summoner_spell"].append(time.perf_counter() - start)
+                digest.update(frame.tobytes())
+            hashes[f"summoner_spell/{scale}/{state}"] = digest.hexdigest()
+
+    return hashes, timings
+
+
+def compare_snapshots(hashes, font: str) -> int:
+    if not SNAPSHOT_PATH.exists():
+        print(f"No snapshots at {SNAPSHOT_PATH}; run with --update-snapshots to record them")
+        return 0
+
+    with open(SNAPSHOT_PATH, 'r', encoding='utf-8') as f:
+        snapshots = json.load(f)
+
+    if snapshots.get("font") != font:
+        print(f"Snapshots were recorded with font '{snapshots.get('font')}', this machine uses '{font}'; skipping pixel check")
+        return 0
+
+    expected = snapshots.get("cases", {})
+    changed = sorted(case for case, digest in hashes.items() if expected.get(case) != digest)
+    missing = sorted(set(expected) - set(hashes))
+    if changed or missing:
+        for case in changed:
+            print(f"✗ Pixels changed: {case}")
+        for case in missing:
+            print(f"✗ Case no longer rendered: {case}")
+        return 1
+
+    print(f"✓ {len(hashes)} case groups match the pixel snapshots")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render slot frames headlessly and check pixel snapshots.")
+    parser.add_argument("--repeat", type=int, default=3, help="renders per icon and state")
+    parser.add_argument("--update-snapshots", action="store_true", help="record the current output as the new snapshots")
+    args = parser.parse_args(argv)
+
+    champions, spells = load_base_images()
+    hashes, timings = run_cases(champions, spells, args.repeat)
+
+    for kind, samples in timings.items():
+        samples.sort()
+        p95 = samples[int(len(samples) * 0.95)]
+        print(f"{kind:15s} {len(samples):6d} frames  median {statistics.median(samples) * 1000:.3f} ms  "
+              f"p95 {p95 * 1000:.3f} ms  total {sum(samples):.2f} s")
+
+    font = font_id()
+    if args.update_snapshots:
+        with open(SNAPSHOT_PATH, 'w', encoding='utf-8') as f:
+            json.dump({"font": font, "cases": hashes}, f, indent=2, sort_keys=True)
+        print(f"Recorded {len(hashes)} case groups to {SNAPSHOT_PATH}")
+        return 0
+
+    return compare_snapshots(hashes, font)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Startup budget benchmark for the overlay.
+
+Launches the overlay in fresh processes, measures the wall time from process
+spawn to first paint, and fails if the median exceeds the startup budget.
+Requires a display (use Xvfb on headless Linux).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from config import STARTUP_BUDGET_MS
+
+CHILD_SCRIPT = """
+import sys
+sys.path.insert(0, {src!r})
+import startup_timing
+from overlay import OverlayApp
+
+app = OverlayApp()
+print("FIRST_PAINT", startup_timing.elapsed_ms("first_paint"), flush=True)
+app.root.destroy()
+"""
+
+
+def measure_once() -> tuple[float, float]:
+    """Return (spawn-to-first-paint ms, in-process first-paint ms) for one launch."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", CHILD_SCRIPT.format(src=str(SRC))],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    wall_ms = None
+    in_process_ms = None
+    for line in process.stdout:
+        if line.startswith("FIRST_PAINT"):
+            wall_ms = (time.perf_counter() - start) * 1000
+            in_process_ms = float(line.split()[1])
+            break
+
+    process.stdout.close()
+    stderr = process.stderr.read()
+    process.wait()
+
+    if wall_ms is None:
+        raise RuntimeError(f"overlay did not reach first paint:\n{stderr}")
+    return wall_ms, in_process_ms
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure process start to first paint.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print("No DISPLAY available; run under Xvfb (e.g. xvfb-run python benchmarks/bench_startup.py)")
+        return 2
+
+    wall_times = []
+    in_process_times = []
+    for _ in range(args.runs):
+        wall_ms, in_process_ms = measure_once()
+        wall_times.append(wall_ms)
+        in_process_times.append(in_process_ms)
+
+    median_wall = statistics.median(wall_times)
+    print(f"first paint (spawn -> paint): median {median_wall:.0f} ms, min {min(wall_times):.0f} ms, max {max(wall_times):.0f} ms")
+    print(f"first paint (after imports):  median {statistics.median(in_process_times):.0f} ms")
+    print(f"budget: {args.budget_ms:.0f} ms")
+
+    if median_wall > args.budget_ms:
+        print("✗ Startup budget exceeded")
+        return 1
+
+    print("✓ Within startup budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark suite with stored baselines.
+
+Times the hot paths of the tracker offline: haste math, enemy team parsing
+on allgamedata payloads (benchmarks/payloads), name normalization,
+timer ticks, icon loading, settings I/O and full frame renders. Results are
+compared against a JSON baseline and the run fails if any case's best time
+got slower than the regression threshold.
+
+Timings are machine specific; record a baseline on the machine you compare
+on, e.g. before starting a change.
+
+Usage:
+    python benchmarks/bench_suite.py                    # run and compare against benchmarks/baseline.json
+    python benchmarks/bench_suite.py --save-baseline    # run and record the baseline
+    python benchmarks/bench_suite.py --threshold 10 --filter timer_tick
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from config import BENCH_REGRESSION_THRESHOLD
+from auto_loader import GameAutoLoader
+from champion_data import champion_data, summoner_spell_data
+import haste_calculator
+from haste_calculator import apply_haste, calculate_summoner_spell_haste, calculate_ability_haste_from_items, calculate_ultimate_haste_from_items
+from settings import load_settings, write_settings_file
+from slot_renderer import format_remaining, load_icon, render_champion, render_summoner_spell
+from timer import TimerManager
+from quality_governor import QUALITY_TIERS
+
+BENCH_DIR = Path(__file__).resolve().parent
+PAYLOAD_DIR = BENCH_DIR / "payloads"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+TIMER_COUNTS = (15, 150, 1500)
+
+
+def measure(func, rounds: int, min_batch: float) -> dict:
+    """
+    Time `func` in batches of at least `min_batch` seconds, with the garbage
+    collector paused like timeit does.
+
+    Returns:
+        Median and best per-call time in microseconds, and calls per batch
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        return _measure(func, rounds, min_batch)
+    finally:
+        gc.enable()
+
+
+def _measure(func, rounds: int, min_batch: float) -> dict:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_batch:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_batch / elapsed) + 1))
+
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        per_call.append((time.perf_counter() - start) / loops * 1e6)
+
+    return {"median_us": statistics.median(per_call), "min_us": min(per_call), "loops": loops}
+
+
+def load_payloads() -> dict:
+    return {path.stem.removeprefix("allgamedata_"): json.loads(path.read_text(encoding="utf-8"))
+            for path in sorted(PAYLOAD_DIR.glob("allgamedata_*.json"))}
+
+
+def haste_cases(payloads):
+    item_sets = [[item["itemID"] for item in player.get("items", []) if item.get("itemID")]
+                 for payload in payloads.values() for player in payload["allPlayers"]]
+    runes = [8010, 9111, 9104, 8299, 8345, 8347]
+
+    def aggregate():
+        for items in item_sets:
+            calculate_summoner_spell_haste(items, runes)
+            calculate_ability_haste_from_items(items)
+            calculate_ultimate_haste_from_items(items)
+
+    def aggregate_cold():
+        haste_calculator._ITEM_TOTALS_CACHE.clear()
+        aggregate()
+
+    def apply():
+        for haste in (0, 20, 45, 90, 150):
+            apply_haste(120.0, haste)
+
+    return {
+        "haste/apply_haste_x5": apply,
+        "haste/aggregate_warm": aggregate,
+        "haste/aggregate_cold": aggregate_cold,
+    }
+
+
+def parse_cases(payloads):
+    loader = GameAutoLoader()
+    loader.on_level_update = lambda levels_data: None
+    cases = {}
+    for name, payload in payloads.items():
+        enemy_team = loader.api.get_enemy_team(payload)
+        cases[f"parse/enemy_team_{name}"] = lambda team=enemy_team, payload=payload: loader._parse_enemy_team(team, payload)
+        cases[f"parse/level_update_{name}"] = lambda payload=payload: loader._handle_level_update(payload)
+    return cases
+
+
+def normalize_cases(payloads):
+    loader = GameAutoLoader()
+    players = [player for payload in payloads.values() for player in payload["allPlayers"]]
+    champion_names = [player["championName"] for player in players]
+    spell_names = [spell["displayName"] for player in players for spell in player["summonerSpells"].values()]
+
+    def champions():
+        for name in champion_names:
+            loader._normalize_champion_name(name)
+
+    def spells():
+        for name in spell_names:
+            loader._normalize_spell_name(name)
+
+    return {
+        "normalize/champion_names": champions,
+        "normalize/spell_names": spells,
+    }
+
+
+def build_timer_manager(count: int) -> TimerManager:
+    """One champion timer per two summoner spell timers, as on the overlay; all running."""
+    manager = TimerManager()
+    champions = sorted(champion_data.get_champion_list())
+    spells = sorted(summoner_spell_data.get_spell_list())
+    for slot in range(count // 3):
+        champion = champions[slot % len(champions)]
+        manager.create_timer(slot, champion, champion_data.get_all_cooldowns(champion), level=slot % 3, ability_haste=slot % 60)
+        manager.start_timer(slot)
+        for spell_slot in range(2):
+            spell = spells[(slot * 2 + spell_slot) % len(spells)]
+            manager.create_summoner_spell_timer(slot, spell_slot, spell, summoner_spell_data.get_cooldown(spell), summoner_haste=slot % 30)
+            manager.start_summoner_spell_timer(slot, spell_slot)
+    return manager
+
+
+def timer_cases():
+    cases = {}
+    for count in TIMER_COUNTS:
+        manager = build_timer_manager(count)
+
+        def tick(manager=manager):
+            for timer in manager.timers.values():
+                if not timer.is_ready():
+                    format_remaining(timer.get_remaining_time())
+            for timer in manager.summoner_spell_timers.values():
+                if not timer.is_ready():
+                    format_remaining(timer.get_remaining_time())
+
+        cases[f"timer_tick/{count}"] = tick
+    return cases
+
+
+def icon_cases():
+    champion_data.set_icon_type(True)
+    champion_icon = champion_data.get_icon_path("Ahri")
+    spell_icon = summoner_spell_data.get_icon_path("flash")
+    return {
+        "icon/load_champion_70px": lambda: load_icon(champion_icon, 70),
+        "icon/load_spell_33px": lambda: load_icon(spell_icon, 33),
+    }
+
+
+def settings_cases(tmp_dir: Path):
+    settings_file = tmp_dir / "settings.json"
+    settings = load_settings(settings_file)
+    write_settings_file(settings_file, settings)
+    return {
+        "settings/load": lambda: load_settings(settings_file),
+        "settings/save": lambda: write_settings_file(settings_file, settings),
+    }
+
+
+def render_cases():
+    """A full overlay frame: five champion slots and ten summoner spell slots."""
+    champion_data.set_icon_type(True)
+    champions = [load_icon(champion_data.get_icon_path(name), 70) for name in ("Garen", "Lee Sin", "Ahri", "Jinx", "Thresh")]
+    spells = [load_icon(summoner_spell_data.get_icon_path(name), 33) for name in ("flash", "teleport", "smite", "ignite", "heal")] * 2
+
+    def frame(champion_texts, spell_texts, quality=QUALITY_TIERS[0]):
+        for base_image, text in zip(champions, champion_texts):
+            render_champion(base_image, text, outline=quality.outline_text, dim=quality.dimming)
+        for base_image, text in zip(spells, spell_texts):
+            if text is not None and not quality.summoner_text:
+                text = ""
+            render_summoner_spell(base_image, text, outline=quality.outline_text, dim=quality.dimming)
+
+    cooldowns = (["42", "1:05", "7", "2:30", "18"], ["4:10", "59", "3", "1:12", "30"] * 2)
+    cases = {
+        "render/frame_cooldowns": lambda: frame(*cooldowns),
+        "render/frame_ready": lambda: frame([None] * 5, [None] * 10),
+    }
+    # The same frame at each lower render quality tier (redraw rate aside).
+    for quality in QUALITY_TIERS[2:]:
+        cases[f"render/frame_cooldowns_tier{quality.level}"] = lambda quality=quality: frame(*cooldowns, quality)
+    return cases
+
+
+def collect_cases(payloads, tmp_dir: Path) -> dict:
+    cases = {}
+    cases.update(haste_cases(payloads))
+    cases.update(parse_cases(payloads))
+    cases.update(normalize_cases(payloads))
+    cases.update(timer_cases())
+    cases.update(icon_cases())
+    cases.update(settings_cases(tmp_dir))
+    cases.update(render_cases())
+    return cases
+
+
+def compare(results: dict, baseline: dict, threshold: float, filtered: bool = False) -> int:
+    """Print the change per case against the baseline; return the number of regressions."""
+    previous = baseline.get("results", {})
+    regressions = 0
+    print(f"\nComparison with baseline from {baseline.get('created', 'unknown')} (threshold {threshold:.0f}%):")
+    for name, result in results.items():
+        if name not in previous:
+            print(f"  {name:32s} new case")
+            continue
+        # Best-of-rounds is the least noisy estimate of a case's cost.
+        old = previous[name]["min_us"]
+        change = (result["min_us"] - old) / old * 100 if old else 0.0
+        if change > threshold:
+            regressions += 1
+            marker = "✗"
+        else:
+            marker = "✓"
+        print(f"{marker} {name:32s} {old:12.2f} → {result['min_us']:12.2f} µs  {change:+7.1f}%")
+    for name in sorted(set(previous) - set(results)):
+        if not filtered:
+            print(f"  {name:32s} not run")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and compare against a stored baseline.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON to compare against or record")
+    parser.add_argument("--save-baseline", action="store_true", help="record this run as the baseline instead of comparing")
+    parser.add_argument("--output", type=Path, help="also write this run's results to a JSON file")
+    parser.add_argument("--threshold", type=float, default=BENCH_REGRESSION_THRESHOLD, help="allowed slowdown in percent")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--rounds", type=int, default=7, help="timed batches per case")
+    parser.add_argument("--min-batch", type=float, default=0.05, help="minimum seconds per batch")
+    args = parser.parse_args(argv)
+
+    payloads = load_payloads()
+    with tempfile.TemporaryDirectory(prefix="spell-tracker-bench-") as tmp:
+        cases = collect_cases(payloads, Path(tmp))
+        results = {}
+        for name, func in cases.items():
+            if args.filter not in name:
+                continue
+            results[name] = measure(func, args.rounds, args.min_batch)
+            result = results[name]
+            print(f"{name:34s} median {result['median_us']:12.2f} µs  best {result['min_us']:12.2f} µs  ({result['loops']} loops)")
+
+    run = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results
+    }
+    if args.output:
+        args.output.write_text(json.dumps(run, indent=2, sort_keys=True), encoding="utf-8")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(run, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"\nRecorded {len(results)} cases to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("python") != run["python"]:
+        print(f"\nNote: baseline was recorded with Python {baseline.get('python')}, this run uses {run['python']}")
+    regressions = compare(results, baseline, args.threshold, filtered=bool(args.filter))
+    if regressions:
+        print(f"\n✗ {regressions} case(s) slower than the baseline by more than {args.threshold:.0f}%")
+        return 1
+    print("\n✓ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Stand-in for the League client's Live Client Data API.
+
+Serves /liveclientdata/allgamedata over plain HTTP from a scripted sequence
+of games so the overlay's real auto-loader, parser and UI can be driven
+without the game. Each cycle is a game of `game_seconds` followed by
+`gap_seconds` without a game (404, as between games). Within a game,
+levels rise from 1 to 18 and players buy items as the game progresses;
+every game uses a different set of champions and summoner spells.
+
+Point LiveClientAPI.BASE_URL at `standin.base_url` in the overlay process.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+CHAMPIONS_PATH = ROOT / "data" / "game_data" / "champions_ult_cooldowns.json"
+ITEMS_PATH = ROOT / "data" / "game_data" / "items_haste.json"
+
+POSITIONS = ("TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY")
+SPELLS = ("Flash", "Ignite", "Teleport", "Unleashed Teleport", "Heal", "Barrier", "Exhaust", "Smite", "Ghost", "Cleanse")
+FILLER_ITEMS = (1001, 1036, 1052, 2003, 3340, 3363, 3364)
+RUNES = ((8010, "Conqueror"), (9111, "Triumph"), (9104, "Legend: Alacrity"), (8299, "Last Stand"),
+         (8345, "Biscuit Delivery"), (8347, "Cosmic Insight"))
+
+
+class GameScript:
+    """Deterministic allgamedata snapshots for game `index` at `progress` in [0, 1]."""
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        with open(CHAMPIONS_PATH, 'r', encoding='utf-8') as f:
+            self.champions = sorted(json.load(f))
+        with open(ITEMS_PATH, 'r', encoding='utf-8') as f:
+            self.items = sorted(int(item_id) for item_id in json.load(f))
+        self._rosters = {}
+
+    def _roster(self, index: int):
+        roster = self._rosters.get(index)
+        if roster is None:
+            roster = self._rosters[index] = self._build_roster(index)
+        return roster
+
+    def _build_roster(self, index: int):
+        rng = random.Random(self.seed * 100003 + index)
+        champions = rng.sample(self.champions, 10)
+        players = []
+        for i, champion in enumerate(champions):
+            spells = ["Flash", rng.choice([spell for spell in SPELLS if spell != "Flash"])]
+            rng.shuffle(spells)
+            players.append({
+                "champion": champion,
+                "team": "ORDER" if i < 5 else "CHAOS",
+                "position": POSITIONS[i % 5],
+                "spells": spells,
+                "build": rng.sample(self.items, 5) + [rng.choice(FILLER_ITEMS)],
+                "level_rate": rng.uniform(0.85, 1.0)
+            })
+        return players
+
+    def snapshot(self, index: int, progress: float) -> Dict[str, Any]:
+        players = []
+        for i, player in enumerate(self._roster(index)):
+            level = max(1, min(18, 1 + int(17 * progress * player["level_rate"])))
+            owned = player["build"][:int(len(player["build"]) * progress) + 1]
+            summoner = f"{player['team'].title()}Player{i % 5 + 1}"
+            players.append({
+                "championName": player["champion"],
+                "isBot": False,
+                "isDead": False,
+                "items": [{"itemID": item_id, "slot": slot, "count": 1} for slot, item_id in enumerate(owned)],
+                "level": level,
+                "position": player["position"],
+                "summonerName": summoner,
+                "riotIdGameName": summoner,
+                "summonerSpells": {
+                    "summonerSpellOne": {"displayName": player["spells"][0]},
+                    "summonerSpellTwo": {"displayName": player["spells"][1]}
+                },
+                "team": player["team"]
+            })
+
+        runes = RUNES if index % 2 else RUNES[:-1]
+        return {
+            "activePlayer": {
+                "summonerName": "OrderPlayer1",
+                "level": players[0]["level"],
+                "championStats": {"abilityHaste": round(40.0 * progress, 1)},
+                "fullRunes": {"generalRunes": [{"id": rune_id, "displayName": name} for rune_id, name in runes]}
+            },
+            "allPlayers": players,
+            "gameData": {"gameMode": "CLASSIC", "gameTime": round(progress * 1800.0, 2)}
+        }
+
+
+class LiveClientStandIn:
+    """
+    HTTP server playing a GameScript on the wall clock.
+
+    Game `n` runs from start + n * cycle for `game_seconds`, where cycle is
+    game_seconds + gap_seconds.
+    """
+
+    def __init__(self, game_seconds: float, gap_seconds: float, seed: int = 0, host: str = "127.0.0.1", port: int = 0):
+        self.script = GameScript(seed)
+        self.game_seconds = game_seconds
+        self.gap_seconds = gap_seconds
+        self.started_at = time.time()
+        self.requests = 0
+
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                standin.requests += 1
+                body = None
+                path = self.path.rstrip("/")
+                if path in ("/liveclientdata/allgamedata", "/liveclientdata/gamestats"):
+                    snapshot = standin.current_snapshot()
+                    if snapshot is not None:
+                        payload = snapshot if path.endswith("allgamedata") else snapshot["gameData"]
+                        body = json.dumps(payload).encode("utf-8")
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://{host}:{self.server.server_address[1]}/liveclientdata"
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def cycle_seconds(self) -> float:
+        return self.game_seconds + self.gap_seconds
+
+    def phase_at(self, timestamp: float):
+        """(game index, progress) at a wall-clock time; progress is None between games."""
+        elapsed = max(0.0, timestamp - self.started_at)
+        index = int(elapsed // self.cycle_seconds)
+        into_cycle = elapsed - index * self.cycle_seconds
+        if into_cycle < self.game_seconds:
+            return index, into_cycle / self.game_seconds
+        return index, None
+
+    def current_snapshot(self) -> Optional[Dict[str, Any]]:
+        index, progress = self.phase_at(time.time())
+        if progress is None:
+            return None
+        return self.script.snapshot(index, progress)
+
+    def start(self):
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self.server.serve_forever, name="live-client-standin", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
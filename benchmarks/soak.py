@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Soak test for long sessions.
+
+Runs the overlay in a child process against the Live Client stand-in
+(benchmarks/live_client_standin.py) through many scripted games: game
+start, level-ups and item purchases, game end and the cleared overlay
+between games. While it runs, timers are clicked and the UI is rebuilt at
+a new scale every so often, as a user would. The child samples its RSS,
+Tcl image count, widget count, thread count and CPU use.
+
+After the warm-up games, each metric is reduced to one value per game
+(the cleared state after the game for RSS, images, widgets and threads;
+the in-game mean for CPU) and a least-squares slope is fitted. The run
+fails if any metric's projected growth over the measured games exceeds
+its tolerance, e.g. leaked PhotoImages or widgets left behind by rebuilds.
+
+Linux only; needs Xvfb when there is no display. The overlay uses a
+temporary home directory, so real settings are not touched.
+
+Usage:
+    python benchmarks/soak.py [--games N] [--game-seconds S] [--report soak_report.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from live_client_standin import LiveClientStandIn
+
+# Allowed growth over the measured games, per metric.
+TOLERANCES = {
+    "rss_mb": 10.0,
+    "tcl_images": 0.5,
+    "widgets": 0.5,
+    "threads": 0.5,
+    "cpu_percent": 5.0,
+}
+PER_GAME_REDUCTION = {
+    "rss_mb": "idle",
+    "tcl_images": "idle",
+    "widgets": "idle",
+    "threads": "idle",
+    "cpu_percent": "game",
+}
+
+CHILD_SCRIPT = """
+import json, os, random, sys, threading, time
+sys.path.insert(0, {src!r})
+from app_logging import setup_logging
+import overlay
+from live_client_api import LiveClientAPI
+
+setup_logging("WARNING")
+LiveClientAPI.BASE_URL = {base_url!r}
+overlay.AUTO_LOAD_POLL_INTERVAL = {poll_interval!r}
+
+app = overlay.OverlayApp()
+rng = random.Random(0)
+page_size = os.sysconf("SC_PAGE_SIZE")
+last_cpu = [time.process_time(), time.perf_counter()]
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+def os_threads():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("Threads:"):
+                return int(line.split()[1])
+    return threading.active_count()
+
+def sample():
+    with open("/proc/self/statm") as f:
+        rss = int(f.read().split()[1]) * page_size
+    cpu, wall = time.process_time(), time.perf_counter()
+    cpu_percent = (cpu - last_cpu[0]) / max(wall - last_cpu[1], 1e-6) * 100
+    last_cpu[:] = [cpu, wall]
+    print("SAMPLE " + json.dumps({{
+        "t": time.time(),
+        "rss_mb": rss / 1048576,
+        "tcl_images": len(app.root.tk.call("image", "names")),
+        "widgets": count_widgets(app.root),
+        "threads": os_threads(),
+        "cpu_percent": cpu_percent,
+    }}), flush=True)
+    app.root.after({sample_ms}, sample)
+
+def click():
+    slots = [slot for slot in app.slots.values() if slot.champion]
+    if slots:
+        slot = rng.choice(slots)
+        if rng.random() < 0.5:
+            slot._on_click(None)
+        else:
+            rng.choice(list(slot.summoner_spell_slots.values()))._on_click(None)
+    app.root.after({click_ms}, click)
+
+def rebuild():
+    app.ui_scale = 1.0 if app.ui_scale != 1.0 else 1.2
+    app._apply_scale_change()
+    app.root.after({rebuild_ms}, rebuild)
+
+app.root.after({sample_ms}, sample)
+app.root.after({click_ms}, click)
+app.root.after({rebuild_ms}, rebuild)
+app.root.after({duration_ms}, app._exit_app)
+app.run()
+print("SOAK_DONE", flush=True)
+"""
+
+
+def slope(xs, ys) -> float:
+    """Least-squares slope of ys over xs; 0.0 with fewer than two points."""
+    if len(xs) < 2:
+        return 0.0
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    if not denominator:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
+
+
+def start_xvfb():
+    """Start Xvfb on a free display; return (process, display) or (None, None) if unavailable."""
+    if not shutil.which("Xvfb"):
+        return None, None
+    for number in range(99, 120):
+        if os.path.exists(f"/tmp/.X{number}-lock"):
+            continue
+        display = f":{number}"
+        process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        time.sleep(1.0)
+        if process.poll() is None:
+            return process, display
+    return None, None
+
+
+def run_child(standin, args, env):
+    duration = args.games * standin.cycle_seconds
+    script = CHILD_SCRIPT.format(
+        src=str(SRC),
+        base_url=standin.base_url,
+        poll_interval=args.poll_interval,
+        sample_ms=int(args.sample_interval * 1000),
+        click_ms=int(args.click_interval * 1000),
+        rebuild_ms=int(args.rebuild_interval * 1000),
+        duration_ms=int(duration * 1000)
+    )
+    process = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, env=env)
+
+    samples = []
+    output_tail = []
+    finished = False
+    for line in process.stdout:
+        if line.startswith("SAMPLE "):
+            samples.append(json.loads(line[len("SAMPLE "):]))
+            if len(samples) % 60 == 0:
+                index, _ = standin.phase_at(samples[-1]["t"])
+                print(f"  game {index + 1}/{args.games}: rss {samples[-1]['rss_mb']:.1f} MB, "
+                      f"{samples[-1]['tcl_images']} images, {samples[-1]['widgets']} widgets, {samples[-1]['threads']} threads")
+        elif line.startswith("SOAK_DONE"):
+            finished = True
+        else:
+            output_tail = (output_tail + [line.rstrip()])[-40:]
+    process.wait()
+    return samples, finished, process.returncode, output_tail
+
+
+def per_game_series(samples, standin, warmup_games: int):
+    """One value per game and metric; idle values come from the second half of the gap after the game."""
+    idle = {}
+    in_game = {}
+    for sample in samples:
+        index, progress = standin.phase_at(sample["t"])
+        if index < warmup_games:
+            continue
+        if progress is None:
+            into_gap = sample["t"] - standin.started_at - index * standin.cycle_seconds - standin.game_seconds
+            if into_gap >= standin.gap_seconds / 2:
+                idle.setdefault(index, []).append(sample)
+        else:
+            in_game.setdefault(index, []).append(sample)
+
+    series = {}
+    for metric, reduction in PER_GAME_REDUCTION.items():
+        groups = idle if reduction == "idle" else in_game
+        series[metric] = [(index, statistics.median(sample[metric] for sample in group))
+                          for index, group in sorted(groups.items()) if group]
+    return series
+
+
+def analyse(samples, standin, warmup_games: int):
+    measured = [sample for sample in samples if standin.phase_at(sample["t"])[0] >= warmup_games]
+    series = per_game_series(samples, standin, warmup_games)
+    results = {}
+    for metric, tolerance in TOLERANCES.items():
+        points = series[metric]
+        per_game = slope([index for index, _ in points], [value for _, value in points])
+        growth = per_game * (len(points) - 1) if points else 0.0
+        per_hour = slope([sample["t"] / 3600 for sample in measured], [sample[metric] for sample in measured])
+        results[metric] = {
+            "games": len(points),
+            "first": points[0][1] if points else None,
+            "last": points[-1][1] if points else None,
+            "slope_per_game": per_game,
+            "slope_per_hour": per_hour,
+            "projected_growth": growth,
+            "tolerance": tolerance,
+            "ok": len(points) >= 3 and growth <= tolerance
+        }
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the overlay through many simulated games and check for growth.")
+    parser.add_argument("--games", type=int, default=24)
+    parser.add_argument("--game-seconds", type=float, default=40.0)
+    parser.add_argument("--gap-seconds", type=float, default=6.0)
+    parser.add_argument("--warmup-games", type=int, default=2, help="games excluded from the slopes")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="auto-loader poll interval in the child")
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--click-interval", type=float, default=0.7, help="seconds between simulated timer clicks")
+    parser.add_argument("--rebuild-interval", type=float, default=97.0, help="seconds between UI scale rebuilds")
+    parser.add_argument("--report", help="write samples and results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        print("The soak test reads /proc and runs on Linux only")
+        return 2
+
+    xvfb = None
+    env = dict(os.environ)
+    if not env.get("DISPLAY"):
+        xvfb, display = start_xvfb()
+        if not xvfb:
+            print("No DISPLAY and Xvfb is not installed; install Xvfb or run under xvfb-run")
+            return 2
+        env["DISPLAY"] = display
+
+    standin = LiveClientStandIn(args.game_seconds, args.gap_seconds)
+    home = tempfile.mkdtemp(prefix="spell-tracker-soak-")
+    env["HOME"] = home
+    env["APPDATA"] = home
+    print(f"Soaking {args.games} games of {args.game_seconds:.0f} s (+{args.gap_seconds:.0f} s between), "
+          f"about {args.games * standin.cycle_seconds / 60:.0f} min")
+    standin.start()
+    try:
+        samples, finished, returncode, output_tail = run_child(standin, args, env)
+    finally:
+        standin.stop()
+        if xvfb:
+            xvfb.terminate()
+        shutil.rmtree(home, ignore_errors=True)
+
+    if not finished or not samples:
+        print(f"✗ Overlay exited early (code {returncode}):")
+        print("\n".join(output_tail))
+        return 1
+
+    results = analyse(samples, standin, args.warmup_games)
+    print(f"\n{len(samples)} samples, {standin.requests} Live Client requests")
+    print(f"{'metric':14s} {'games':>5s} {'first':>9s} {'last':>9s} {'per game':>10s} {'per hour':>10s} {'growth':>9s} {'limit':>7s}")
+    for metric, result in results.items():
+        if not result["games"]:
+            print(f"✗ {metric:12s} no samples")
+            continue
+        marker = "✓" if result["ok"] else "✗"
+        print(f"{marker} {metric:12s} {result['games']:5d} {result['first']:9.2f} {result['last']:9.2f} "
+              f"{result['slope_per_game']:+10.3f} {result['slope_per_hour']:+10.2f} "
+              f"{result['projected_growth']:+9.2f} {result['tolerance']:7.1f}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"args": vars(args), "results": results, "samples": samples}, f, indent=2)
+        print(f"Report written to {args.report}")
+
+    failed = [metric for metric, result in results.items() if not result["ok"]]
+    if failed:
+        print(f"\n✗ Sustained growth or too few games for: {', '.join(failed)}")
+        return 1
+    print("\n✓ No sustained growth")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -65,6 +65,59 @@ def apply_current_settings():
         print(f"Warning: Could not apply settings: {e}")
         print("Continuing with existing config.py defaults")
 
+def compile_game_data():
+    """Compile the JSON game data into the binary bundle shipped with the build."""
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    from game_data_bundle import compile_bundle, GAME_DATA_BUNDLE_PATH
+
+    size = compile_bundle()
+    print(f"✓ Compiled game data bundle: {GAME_DATA_BUNDLE_PATH} ({size} bytes)")
+
+def build_asset_manifest():
+    """Generate the icon manifest so the packaged app does not probe for icons."""
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    from asset_manifest import build_manifest, verify_manifest, ASSET_MANIFEST_PATH
+
+    manifest = build_manifest()
+    print(f"✓ Generated asset manifest: {ASSET_MANIFEST_PATH} ({len(manifest['champions'])} champions)")
+
+    problems = verify_manifest()
+    if problems:
+        raise RuntimeError("Asset manifest check failed:\n  " + "\n  ".join(problems))
+    print("✓ Verified icon sizes and hashes against the manifest")
+
+PACKED_RESOURCES = [
+    "data/game_data/champions_ult_cooldowns.json",
+    "data/game_data/summoner_spells_cooldowns.json",
+    "data/game_data/items_haste.json",
+    "data/game_data/game_data.bin",
+    "data/icons/champions",
+    "data/icons/champion_ults",
+    "data/icons/summoner_spells",
+    "data/sounds/ult_ready.wav",
+    "data/sounds/voice",
+    "data/assets/logo.ico",
+    "data/assets/asset_manifest.json",
+]
+
+def append_resources(exe_file):
+    """Append the resource archive to the executable so nothing is extracted at launch."""
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    from resources import ResourceArchive, collect_resource_files, pack_resources
+
+    files = collect_resource_files(PACKED_RESOURCES, str(Path(__file__).parent))
+    # Not opened in append mode: zipfile seeks back to patch local headers.
+    with open(exe_file, 'r+b') as f:
+        f.seek(0, 2)
+        count = pack_resources(f, files, str(Path(__file__).parent))
+
+    archive = ResourceArchive(str(exe_file))
+    missing = sorted(set(files) - set(archive.names()))
+    archive.close()
+    if missing:
+        raise RuntimeError(f"Resource archive in {exe_file.name} is missing {len(missing)} file(s), e.g. {missing[0]}")
+    print(f"✓ Appended {count} resources to {exe_file.name}")
+
 def build():
     spec_file = Path(__file__).parent / "spell-tracker.spec"
 
@@ -73,6 +126,8 @@ def build():
         return False
 
     apply_current_settings()
+    compile_game_data()
+    build_asset_manifest()
 
     print("Building executable...")
     subprocess.check_call([sys.executable, "-m", "PyInstaller", "--clean", str(spec_file)])
@@ -81,6 +136,7 @@ def build():
     exe_file = dist_dir / "Spell-Tracker.exe"
 
     if exe_file.exists():
+        append_resources(exe_file)
         print(f"\n✓ Build successful!")
         print(f"Executable: {exe_file}")
         print(f"Size: {exe_file.stat().st_size / 1024 / 1024:.1f} MB")
@@ -4,6 +4,7 @@ League of Legends Spell Tracker
 Entry point for the application.
 """
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -11,7 +12,15 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-from overlay import main
+import startup_timing  # records process start before heavy imports
+
+if any(arg.startswith("--profile-startup") for arg in sys.argv[1:]):
+    startup_timing.enable_profiling()
+
+with startup_timing.phase("import_overlay"):
+    from overlay import main
 
 if __name__ == "__main__":
+    # Needed for the optional poll worker process in the frozen build.
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -6,17 +6,8 @@ a = Analysis(
     ['run.py'],
     pathex=['src'],
     binaries=[],
-    datas=[
-        ('data/game_data/champions_ult_cooldowns.json', 'data/game_data'),
-        ('data/game_data/summoner_spells_cooldowns.json', 'data/game_data'),
-        ('data/game_data/items_haste.json', 'data/game_data'),
-        ('data/icons/champions', 'data/icons/champions'),
-        ('data/icons/champion_ults', 'data/icons/champion_ults'),
-        ('data/icons/summoner_spells', 'data/icons/summoner_spells'),
-        ('data/sounds/ult_ready.wav', 'data/sounds'),
-        ('data/assets/logo.ico', 'data/assets'),
-    ],
-    hiddenimports=['overlay', 'champion_data', 'timer', 'config', 'settings', 'auto_loader', 'live_client_api', 'haste_calculator', 'requests', 'urllib3', 'pystray', 'pystray._win32'],
+    datas=[],
+    hiddenimports=['overlay', 'champion_data', 'timer', 'config', 'settings', 'auto_loader', 'live_client_api', 'haste_calculator', 'game_data_bundle', 'data_watcher', 'asset_manifest', 'resources', 'alert_audio', 'ui_dispatch', 'poll_worker', 'metrics', 'app_logging', 'tracing', 'stall_detector', 'frame_stats', 'sampling_profiler', 'slot_renderer', 'clock', 'memory_footprint', 'quality_governor', 'lazy_import', 'startup_timing', 'requests', 'urllib3', 'pystray', 'pystray._win32', 'pygame', 'PIL.Image', 'PIL.ImageTk', 'PIL.ImageDraw', 'PIL.ImageFont', 'PIL.ImageEnhance'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
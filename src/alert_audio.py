@@ -0,0 +1,331 @@
+"""
+Alert audio engine for the overlay application.
+
+This module plays cooldown alerts from its own scheduler thread. Alerts are
+scheduled with an absolute deadline and fire at that deadline regardless of
+how busy the UI thread is. Sounds are decoded once into PCM in the mixer's
+format and kept in memory; overlapping alerts are mixed on separate mixer
+channels. The audio backend is initialized on the scheduler thread the first
+time an alert is scheduled, so it stays off the startup path.
+
+Optional voice cues are looked up by champion or summoner spell name in
+VOICE_CUES_DIR, with the file stem made by icon_key() (e.g.
+"data/sounds/voice/LeeSin.wav", and "flash.wav" since summoner spell names
+are lowercase), and played instead of the generic ready sound when present.
+Packaged builds read them from the resource archive (see build.py).
+"""
+
+import heapq
+import io
+import itertools
+import os
+import threading
+import wave
+from array import array
+from typing import Callable, Dict, Hashable, Iterable, Optional
+from lazy_import import lazy_import
+from app_logging import get_logger
+from config import SOUND_FILE_PATH, VOICE_CUES_DIR, ALERT_MIXER_CHANNELS
+from asset_manifest import icon_key
+from clock import SYSTEM_CLOCK
+from resources import read_resource, resource_exists
+
+pygame = lazy_import("pygame")
+
+logger = get_logger(__name__)
+
+
+def _to_16bit(frames: bytes, sample_width: int) -> array:
+    """Convert little-endian PCM samples of any common width to signed 16-bit."""
+    if sample_width == 2:
+        return array('h', frames)
+    if sample_width == 1:
+        return array('h', ((sample - 128) << 8 for sample in frames))
+
+    # Keep the two most significant bytes of each sample.
+    out = bytearray(len(frames) // sample_width * 2)
+    out[0::2] = frames[sample_width - 2::sample_width]
+    out[1::2] = frames[sample_width - 1::sample_width]
+    return array('h', bytes(out))
+
+
+def _convert_channels(samples: array, channels: int, target_channels: int) -> array:
+    if channels == target_channels:
+        return samples
+    frame_count = len(samples) // channels
+    if target_channels == 1:
+        return array('h', samples[0::channels])
+
+    out = array('h', bytes(frame_count * target_channels * 2))
+    for channel in range(target_channels):
+        out[channel::target_channels] = samples[min(channel, channels - 1)::channels]
+    return out
+
+
+def _resample(samples: array, channels: int, rate: int, target_rate: int) -> array:
+    """Nearest-neighbour resampling; alert sounds are short, so quality loss is inaudible."""
+    if rate == target_rate:
+        return samples
+    frame_count = len(samples) // channels
+    target_count = frame_count * target_rate // rate
+    step = rate / target_rate
+    if channels == 1:
+        return array('h', (samples[int(i * step)] for i in range(target_count)))
+
+    out = array('h')
+    for i in range(target_count):
+        start = int(i * step) * channels
+        out.extend(samples[start:start + channels])
+    return out
+
+
+def decode_wav(data: bytes, target_rate: int, target_channels: int) -> bytes:
+    """
+    Decode an uncompressed WAV file into signed 16-bit PCM for the mixer.
+
+    Args:
+        data: WAV file contents
+        target_rate: Mixer sample rate
+        target_channels: Mixer channel count (1 or 2)
+
+    Returns:
+        Raw interleaved PCM bytes
+    """
+    with wave.open(io.BytesIO(data), 'rb') as wav:
+        channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    samples = _to_16bit(frames, sample_width)
+    samples = _convert_channels(samples, channels, target_channels)
+    samples = _resample(samples, target_channels, rate, target_rate)
+    return samples.tobytes()
+
+
+class _Alert:
+    __slots__ = ("deadline", "seq", "cue", "fallback", "volume", "on_fire")
+
+    def __init__(self, deadline: float, seq: int, cue: Optional[str], fallback: bool, volume: Optional[float], on_fire: Optional[Callable]):
+        self.deadline = deadline
+        self.seq = seq
+        self.cue = cue
+        self.fallback = fallback
+        self.volume = volume
+        self.on_fire = on_fire
+
+
+class AlertEngine:
+    """
+    Schedules and plays cooldown alerts on a dedicated thread.
+
+    Each alert is keyed (e.g. by timer slot), so rescheduling a key replaces
+    its previous deadline and cancelling a key drops it. Deadlines are on
+    the timeline of `clock`, which must be the clock the timers use. With a
+    real-time clock the thread sleeps until the next deadline; otherwise
+    (VirtualClock) it is woken by a clock.call_at() callback at that
+    deadline, so alerts fire as the clock is advanced.
+    """
+
+    def __init__(self, sound_path: str = SOUND_FILE_PATH, volume: float = 1.0, enabled: bool = True, voice_cue_dir: Optional[str] = VOICE_CUES_DIR, clock=SYSTEM_CLOCK):
+        self.sound_path = sound_path
+        self.clock = clock
+        self.voice_cue_dir = voice_cue_dir
+        self.volume = volume
+        self.enabled = enabled
+
+        self._heap = []
+        self._pending: Dict[Hashable, _Alert] = {}
+        self._to_prepare = []
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+        self._wakeup = None
+
+        self._backend_attempted = False
+        self._mixer_format = None
+        self._ready_sound = None
+        self._voice_cues: Dict[str, object] = {}
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="alert-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._pending.clear()
+            self._cancel_wakeup()
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def schedule(self, key: Hashable, deadline: float, cue: Optional[str] = None, fallback: bool = True, volume: Optional[float] = None, on_fire: Optional[Callable] = None):
+        """
+        Schedule an alert, replacing any pending alert with the same key.
+
+        Args:
+            key: Identifies the alert, e.g. ("ult", slot)
+            deadline: Clock time at which to play; past deadlines play immediately
+            cue: Champion or spell name whose voice cue should be played
+            fallback: Play the generic ready sound when no voice cue exists
+            volume: Volume override for this alert
+            on_fire: Called on the scheduler thread when the alert fires
+        """
+        with self._condition:
+            alert = _Alert(deadline, next(self._seq), cue, fallback, volume, on_fire)
+            self._pending[key] = alert
+            heapq.heappush(self._heap, (deadline, alert.seq, key))
+            self._to_prepare.append(cue)
+            self._condition.notify()
+
+    def cancel(self, key: Hashable):
+        with self._condition:
+            # The heap entry is left behind and skipped when it surfaces.
+            self._pending.pop(key, None)
+
+    def cancel_all(self):
+        with self._condition:
+            self._pending.clear()
+            self._heap.clear()
+            self._cancel_wakeup()
+            self._condition.notify()
+
+    def release_voice_cues(self, keep: Iterable[str] = ()):
+        """Drop decoded voice cues except `keep` and those of pending alerts; they are decoded again when needed."""
+        with self._condition:
+            keep = set(keep) | {alert.cue for alert in self._pending.values() if alert.cue}
+        for cue in list(self._voice_cues):
+            if cue not in keep:
+                self._voice_cues.pop(cue, None)
+
+    def play_now(self, volume: Optional[float] = None):
+        """Play the ready sound as soon as possible, even when alerts are disabled."""
+        self.schedule(("test",), self.clock.now(), volume=self.volume if volume is None else volume)
+
+    def set_volume(self, volume: float):
+        self.volume = volume
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = enabled
+
+    def _run(self):
+        while True:
+            with self._condition:
+                to_prepare, self._to_prepare = self._to_prepare, []
+            for cue in to_prepare:
+                self._prepare(cue)
+
+            due = None
+            with self._condition:
+                if not self._running:
+                    return
+                if self._to_prepare:
+                    continue
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                deadline, seq, key = self._heap[0]
+                alert = self._pending.get(key)
+                if alert is None or alert.seq != seq:
+                    heapq.heappop(self._heap)
+                    continue
+
+                timeout = deadline - self.clock.now()
+                if timeout > 0:
+                    if self.clock.realtime:
+                        self._condition.wait(timeout)
+                    else:
+                        self._arm_wakeup(deadline)
+                        # The clock may have passed the deadline before the wakeup was armed.
+                        if deadline > self.clock.now():
+                            self._condition.wait()
+                    continue
+
+                heapq.heappop(self._heap)
+                del self._pending[key]
+                due = (key, alert)
+
+            self._fire(*due)
+
+    def _arm_wakeup(self, deadline: float):
+        """Have the clock wake the thread at `deadline`; called with the condition held."""
+        if self._wakeup is not None and self._wakeup.when == deadline and not self._wakeup.cancelled:
+            return
+        self._cancel_wakeup()
+        self._wakeup = self.clock.call_at(deadline, self._wake)
+
+    def _cancel_wakeup(self):
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+    def _wake(self):
+        with self._condition:
+            self._condition.notify()
+
+    def _fire(self, key: Hashable, alert: _Alert):
+        forced = alert.volume is not None
+        if self.enabled or forced:
+            sound = self._voice_cues.get(alert.cue) if alert.cue else None
+            if sound is None and alert.fallback:
+                sound = self._ready_sound
+            if sound is not None:
+                try:
+                    channel = pygame.mixer.find_channel(True)
+                    channel.set_volume(self.volume if alert.volume is None else alert.volume)
+                    channel.play(sound)
+                except Exception as e:
+                    logger.error("Error playing alert: %s", e, extra={"key": "play"})
+
+        if alert.on_fire:
+            alert.on_fire()
+
+    def _prepare(self, cue: Optional[str]):
+        """Initialize the backend and decode the sounds an alert needs ahead of its deadline."""
+        if not self._backend_attempted:
+            self._backend_attempted = True
+            self._init_backend()
+        if cue and self._mixer_format and cue not in self._voice_cues:
+            self._voice_cues[cue] = self._load_voice_cue(cue)
+
+    def _init_backend(self):
+        try:
+            pygame.mixer.init()
+            pygame.mixer.set_num_channels(ALERT_MIXER_CHANNELS)
+            self._mixer_format = pygame.mixer.get_init()
+        except Exception as e:
+            logger.error("Error initializing sound: %s", e)
+            return
+
+        if resource_exists(self.sound_path):
+            self._ready_sound = self._load_sound(self.sound_path)
+
+    def _load_sound(self, path: str):
+        data = read_resource(path)
+        rate, size, channels = self._mixer_format
+        try:
+            if size == -16 and channels in (1, 2):
+                return pygame.mixer.Sound(buffer=decode_wav(data, rate, channels))
+        except (wave.Error, EOFError) as e:
+            logger.warning("Could not pre-decode %s, letting the mixer decode it: %s", os.path.basename(path), e, extra={"key": path})
+        try:
+            return pygame.mixer.Sound(file=io.BytesIO(data))
+        except Exception as e:
+            logger.error("Error loading sound %s: %s", path, e, extra={"key": path})
+            return None
+
+    def _load_voice_cue(self, cue: str):
+        if not self.voice_cue_dir:
+            return None
+        path = os.path.join(self.voice_cue_dir, f"{icon_key(cue)}.wav")
+        if not resource_exists(path):
+            return None
+        return self._load_sound(path)
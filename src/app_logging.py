@@ -0,0 +1,163 @@
+"""
+Logging setup for the overlay application.
+
+Messages go to the console (when there is one) and to a bounded in-memory
+ring buffer that can be viewed from the tray menu. A rate limit keyed by
+message drops repeats of the same message within LOG_RATE_LIMIT_INTERVAL
+and counts them, so a failure that recurs on every poll produces one line
+per interval instead of one per poll.
+
+Usage:
+    logger = app_logging.get_logger(__name__)
+    logger.warning("Unknown spell from API: %r", name, extra={"key": name})
+
+Pass arguments separately rather than formatting the message: the message is
+only built when the level is enabled and the message passes the rate limit.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from config import LOG_LEVEL, LOG_BUFFER_SIZE, LOG_RATE_LIMIT_INTERVAL
+import metrics
+
+
+ROOT_LOGGER_NAME = "spell_tracker"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+LOG_DATE_FORMAT = "%H:%M:%S"
+
+SUPPRESSED = metrics.counter("log_messages_suppressed_total", "Log messages dropped by the rate limit")
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let each message key through at most once per `interval` seconds.
+
+    The key is the logger name plus the unformatted message, or the `key`
+    passed via `extra`. When a key is let through again after repeats were
+    dropped, the record notes how many were suppressed.
+    """
+
+    def __init__(self, interval: float = LOG_RATE_LIMIT_INTERVAL):
+        super().__init__()
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._last_emit: Dict[Tuple[str, str], float] = {}
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self.suppressed: Dict[Tuple[str, str], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # The same filter instance is shared by every handler; decide once per record.
+        decision = getattr(record, "_rate_limit_allowed", None)
+        if decision is not None:
+            return decision
+
+        key = (record.name, str(getattr(record, "key", record.msg)))
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emit.get(key)
+            if last is not None and now - last < self.interval:
+                self._pending[key] = self._pending.get(key, 0) + 1
+                self.suppressed[key] = self.suppressed.get(key, 0) + 1
+                allowed = False
+            else:
+                self._last_emit[key] = now
+                dropped = self._pending.pop(key, 0)
+                record.suppressed_note = f" ({dropped} similar suppressed)" if dropped else ""
+                allowed = True
+
+        if not allowed:
+            SUPPRESSED.inc()
+        record._rate_limit_allowed = allowed
+        return allowed
+
+    def stats(self) -> List[Tuple[str, str, int]]:
+        """(logger, message key, suppressed count) for every key that was rate limited, most first."""
+        with self._lock:
+            return sorted(((name, key, count) for (name, key), count in self.suppressed.items()), key=lambda item: -item[2])
+
+
+class RingBufferHandler(logging.Handler):
+    """Keep the last `capacity` formatted log lines in memory."""
+
+    def __init__(self, capacity: int = LOG_BUFFER_SIZE):
+        super().__init__()
+        self.records: Deque[str] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.records.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def lines(self) -> List[str]:
+        return list(self.records)
+
+
+class _Formatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        return super().format(record) + getattr(record, "suppressed_note", "")
+
+
+_rate_limit: Optional[RateLimitFilter] = None
+_ring_buffer: Optional[RingBufferHandler] = None
+
+
+def setup_logging(level=LOG_LEVEL, rate_limit_interval: float = LOG_RATE_LIMIT_INTERVAL, buffer_size: int = LOG_BUFFER_SIZE):
+    """
+    Configure the application loggers; safe to call more than once.
+
+    A console handler is only added when the process has a stdout, so a
+    windowed build does not format messages nobody can see.
+    """
+    global _rate_limit, _ring_buffer
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(level)
+    root.propagate = False
+
+    formatter = _Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+    _rate_limit = RateLimitFilter(rate_limit_interval)
+
+    _ring_buffer = RingBufferHandler(buffer_size)
+    _ring_buffer.setFormatter(formatter)
+    _ring_buffer.addFilter(_rate_limit)
+    root.addHandler(_ring_buffer)
+
+    if sys.stdout is not None:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(formatter)
+        console.addFilter(_rate_limit)
+        root.addHandler(console)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a child of the application logger, e.g. get_logger("auto_loader")."""
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def get_log_lines() -> List[str]:
+    return _ring_buffer.lines() if _ring_buffer else []
+
+
+def set_buffer_size(size: int):
+    """Resize the in-memory log buffer, keeping the most recent lines."""
+    if _ring_buffer:
+        _ring_buffer.records = deque(_ring_buffer.records, maxlen=size)
+
+
+def format_suppressed() -> str:
+    if not _rate_limit:
+        return ""
+    stats = _rate_limit.stats()
+    if not stats:
+        return "No messages were rate limited."
+    lines = ["Rate limited messages:"]
+    for name, key, count in stats:
+        lines.append(f"  {count:6d}  {name}: {key}")
+    return "\n".join(lines)
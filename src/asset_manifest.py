@@ -0,0 +1,283 @@
+"""
+Asset manifest for champion and summoner spell icons.
+
+This module builds and reads a manifest mapping canonical champion and
+summoner spell names to their icon files, with image dimensions, file sizes
+and content hashes. The manifest is generated at build time so runtime icon
+lookups are dictionary hits instead of filesystem probes.
+
+Manifest layout:
+    {
+        "version": 1,
+        "champions":       {name: entry},
+        "champion_ults":   {name: entry},
+        "summoner_spells": {name: entry}
+    }
+where each entry is {"file", "width", "height", "size", "sha256"} and
+"file" is relative to the resource root.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+from config import get_resource_path, ASSET_MANIFEST_PATH, CHAMPIONS_DATA_PATH, SUMMONER_SPELLS_DATA_PATH
+from resources import open_resource, read_resource, resource_exists, resource_size
+
+
+MANIFEST_VERSION = 1
+
+CHAMPION_ICONS_RELATIVE_DIR = "data/icons/champions"
+CHAMPION_ULT_ICONS_RELATIVE_DIR = "data/icons/champion_ults"
+SUMMONER_SPELLS_RELATIVE_DIR = "data/icons/summoner_spells"
+
+CHAMPION_ICON_MAPPING = {
+    "NunuWillump": "Nunu",
+    "RenataGlasc": "Renata",
+    "Wukong": "MonkeyKing",
+}
+
+ULT_ICON_MAPPING = {
+    "NunuWillump": "Nunu&Willump",
+}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def icon_key(champion: str) -> str:
+    """Strip spaces and punctuation from a champion name to form its icon file stem."""
+    return champion.replace(" ", "").replace("'", "").replace(".", "").replace("&", "")
+
+
+def probe_champion_icon(champion: str, use_champion_icons: bool, champion_icons_dir: str, ult_icons_dir: str) -> Optional[str]:
+    """
+    Find a champion icon by probing the filesystem.
+
+    Used when no manifest is available, e.g. when running from source.
+
+    Returns:
+        Path to the icon, or None if no candidate file exists
+    """
+    name = icon_key(champion)
+
+    if use_champion_icons:
+        icon_path = os.path.join(champion_icons_dir, f"{CHAMPION_ICON_MAPPING.get(name, name)}.png")
+        icon_path_alt = os.path.join(champion_icons_dir, f"{champion.replace(' ', '')}.png")
+    else:
+        icon_path = os.path.join(ult_icons_dir, f"{ULT_ICON_MAPPING.get(name, name)}_r.png")
+        icon_path_alt = os.path.join(ult_icons_dir, f"{champion.replace(' ', '')}_r.png")
+
+    if resource_exists(icon_path):
+        return icon_path
+    if resource_exists(icon_path_alt):
+        return icon_path_alt
+    return None
+
+
+def read_png_size(path: str) -> Tuple[int, int]:
+    """Read the width and height from a PNG header without decoding the image."""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if len(header) < 24 or not header.startswith(PNG_SIGNATURE):
+        raise ValueError(f"{path} is not a PNG file")
+    return struct.unpack(">II", header[16:24])
+
+
+def _describe_file(relative_path: str) -> Dict[str, object]:
+    path = get_resource_path(relative_path)
+    with open(path, 'rb') as f:
+        content = f.read()
+    width, height = read_png_size(path)
+    return {
+        "file": relative_path,
+        "width": width,
+        "height": height,
+        "size": len(content),
+        "sha256": hashlib.sha256(content).hexdigest()
+    }
+
+
+def _index_dir(relative_dir: str) -> Dict[str, str]:
+    """Map lowercase file names to real file names so lookups are case-insensitive."""
+    directory = get_resource_path(relative_dir)
+    if not os.path.isdir(directory):
+        return {}
+    return {name.lower(): name for name in os.listdir(directory) if name.lower().endswith(".png")}
+
+
+def _canonical_names() -> Tuple[List[str], List[str]]:
+    with open(CHAMPIONS_DATA_PATH, 'r', encoding='utf-8') as f:
+        champions = sorted(json.load(f))
+    with open(SUMMONER_SPELLS_DATA_PATH, 'r', encoding='utf-8') as f:
+        spells = sorted(json.load(f))
+    return champions, spells
+
+
+def build_manifest(output_path: str = ASSET_MANIFEST_PATH) -> Dict[str, Dict[str, dict]]:
+    """
+    Scan the icon directories and write the asset manifest.
+
+    Champion names come from the champion cooldown data so the manifest is
+    keyed by the same canonical names the overlay uses.
+
+    Args:
+        output_path: Destination path of the manifest
+
+    Returns:
+        The generated manifest
+    """
+    champions, spells = _canonical_names()
+
+    champion_files = _index_dir(CHAMPION_ICONS_RELATIVE_DIR)
+    ult_files = _index_dir(CHAMPION_ULT_ICONS_RELATIVE_DIR)
+    spell_files = _index_dir(SUMMONER_SPELLS_RELATIVE_DIR)
+
+    manifest = {"version": MANIFEST_VERSION, "champions": {}, "champion_ults": {}, "summoner_spells": {}}
+
+    for champion in champions:
+        name = icon_key(champion)
+
+        candidates = [f"{CHAMPION_ICON_MAPPING.get(name, name)}.png", f"{champion.replace(' ', '')}.png"]
+        for candidate in candidates:
+            if candidate.lower() in champion_files:
+                manifest["champions"][champion] = _describe_file(f"{CHAMPION_ICONS_RELATIVE_DIR}/{champion_files[candidate.lower()]}")
+                break
+
+        candidates = [f"{ULT_ICON_MAPPING.get(name, name)}_r.png", f"{champion.replace(' ', '')}_r.png"]
+        for candidate in candidates:
+            if candidate.lower() in ult_files:
+                manifest["champion_ults"][champion] = _describe_file(f"{CHAMPION_ULT_ICONS_RELATIVE_DIR}/{ult_files[candidate.lower()]}")
+                break
+
+    for spell in spells:
+        candidate = f"{spell}.png"
+        if candidate.lower() in spell_files:
+            manifest["summoner_spells"][spell] = _describe_file(f"{SUMMONER_SPELLS_RELATIVE_DIR}/{spell_files[candidate.lower()]}")
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, output_path)
+
+    return manifest
+
+
+class AssetManifest:
+    """
+    In-memory asset manifest for icon lookups.
+
+    Resolves canonical champion and summoner spell names to absolute icon
+    paths without touching the filesystem.
+    """
+
+    def __init__(self, data: Dict[str, Dict[str, dict]]):
+        self.data = data
+        self._paths: Dict[str, Dict[str, str]] = {
+            section: {name: get_resource_path(entry["file"]) for name, entry in data.get(section, {}).items()}
+            for section in ("champions", "champion_ults", "summoner_spells")
+        }
+
+    def champion_icon(self, champion: str, use_champion_icons: bool) -> Optional[str]:
+        section = "champions" if use_champion_icons else "champion_ults"
+        return self._paths[section].get(champion)
+
+    def summoner_spell_icon(self, spell: str) -> Optional[str]:
+        return self._paths["summoner_spells"].get(spell)
+
+    def get_entry(self, section: str, name: str) -> Optional[dict]:
+        return self.data.get(section, {}).get(name)
+
+    def self_check(self, champions: List[str], spells: List[str], verify_hashes: bool = False) -> List[str]:
+        """
+        Report missing or mismatched icons.
+
+        An icon is missing if it has no manifest entry or its file is gone,
+        and mismatched if its file size differs from the manifest, or with
+        verify_hashes, its SHA-256. Hashing reads every icon, so the startup
+        check only compares sizes and the build verifies hashes.
+
+        Returns:
+            One human-readable line per problem
+        """
+        problems = []
+        expected = [("champions", name) for name in champions]
+        expected += [("champion_ults", name) for name in champions]
+        expected += [("summoner_spells", name) for name in spells]
+
+        for section, name in expected:
+            entry = self.get_entry(section, name)
+            if entry is None:
+                problems.append(f"missing {section} icon for {name}")
+                continue
+            size = resource_size(entry["file"])
+            if size is None:
+                problems.append(f"missing file {entry['file']} for {name}")
+                continue
+            if size != entry.get("size"):
+                problems.append(f"mismatched {entry['file']} for {name} (size {size}, manifest {entry.get('size')})")
+            elif verify_hashes and hashlib.sha256(read_resource(entry["file"])).hexdigest() != entry.get("sha256"):
+                problems.append(f"mismatched {entry['file']} for {name} (content differs from manifest sha256)")
+
+        return problems
+
+
+_manifest: Optional[AssetManifest] = None
+_manifest_checked = False
+_manifest_lock = threading.Lock()
+
+
+def load_asset_manifest() -> Optional[AssetManifest]:
+    """
+    Load the asset manifest once per process.
+
+    Returns:
+        The manifest, or None if it is missing or unreadable and callers
+        should fall back to probing the filesystem
+    """
+    global _manifest, _manifest_checked
+    with _manifest_lock:
+        if _manifest_checked:
+            return _manifest
+        _manifest_checked = True
+
+        try:
+            with open_resource(ASSET_MANIFEST_PATH) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Ignoring asset manifest: {e}")
+            return None
+
+        if data.get("version") != MANIFEST_VERSION:
+            print(f"Ignoring asset manifest with unsupported version {data.get('version')}")
+            return None
+
+        _manifest = AssetManifest(data)
+        return _manifest
+
+
+def verify_manifest() -> List[str]:
+    """Check every icon against the manifest on disk, including content hashes."""
+    manifest = load_asset_manifest()
+    if manifest is None:
+        return [f"no usable asset manifest at {ASSET_MANIFEST_PATH}"]
+    champions, spells = _canonical_names()
+    return manifest.self_check(champions, spells, verify_hashes=True)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--check" in sys.argv:
+        problems = verify_manifest()
+        for problem in problems:
+            print(f"  {problem}")
+        print(f"Asset manifest check: {len(problems)} problem(s)")
+        sys.exit(1 if problems else 0)
+
+    manifest = build_manifest()
+    counts = ", ".join(f"{len(manifest[section])} {section}" for section in ("champions", "champion_ults", "summoner_spells"))
+    print(f"Wrote {ASSET_MANIFEST_PATH} ({counts})")
@@ -2,16 +2,31 @@
 Automatic game data loader for League of Legends overlay.
 
 This module monitors the League of Legends client for active games and
-automatically populates the overlay with enemy team information.
+automatically populates the overlay with enemy team information. The poll
+loop waits on events through an injectable clock rather than sleeping, so
+stopping or reconfiguring the loader takes effect immediately and tests can
+run the loop on a VirtualClock.
 """
 
 import threading
 import time
 from typing import Callable, Optional, List, Dict, Any
 from live_client_api import LiveClientAPI
+import metrics
+import tracing
+from app_logging import get_logger
+from clock import SYSTEM_CLOCK
+from config import GAME_END_CONFIRM_POLLS
 from champion_data import champion_data
 from haste_calculator import calculate_summoner_spell_haste, calculate_ability_haste_from_items, calculate_ultimate_haste_from_items
 
+logger = get_logger("auto_loader")
+
+POLL_SECONDS = metrics.histogram("autoloader_poll_seconds", "Duration of one auto-loader poll, including the request")
+PARSE_SECONDS = metrics.histogram("autoloader_parse_seconds", "Time spent turning a snapshot into slot data", ("kind",))
+EVENTS_DISPATCHED = metrics.counter("autoloader_events_dispatched_total", "Loader events delivered to the overlay", ("event",))
+UPDATES_SKIPPED = metrics.counter("autoloader_updates_skipped_total", "Level updates skipped while the UI was behind")
+
 
 class GameAutoLoader:
     """
@@ -19,16 +34,27 @@ class GameAutoLoader:
 
     Periodically checks if a game is active and provides callbacks
     with parsed enemy team information (champions and summoner spells).
+
+    A poll without a snapshot (timeout, error status, bad JSON) only ends
+    the game after `game_end_polls` such polls in a row, and only if the
+    lighter `gamestats` endpoint does not answer either, so one slow
+    late-game response does not clear the overlay mid-game.
     """
 
-    def __init__(self, poll_interval: float = 3.0):
+    def __init__(self, poll_interval: float = 3.0, clock=SYSTEM_CLOCK, game_end_polls: int = GAME_END_CONFIRM_POLLS):
         self.api = LiveClientAPI()
         self.poll_interval = poll_interval
+        self.game_end_polls = game_end_polls
+        self.missed_polls = 0
+        self.clock = clock
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
         self.on_game_start: Optional[Callable[[List[Dict[str, Any]]], None]] = None
         self.on_game_end: Optional[Callable[[], None]] = None
         self.on_level_update: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self.is_ui_behind: Optional[Callable[[], bool]] = None
         self.game_active = False
 
     def start(self):
@@ -36,51 +62,103 @@ class GameAutoLoader:
             return
 
         self.running = True
-        self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._monitor_loop, name="auto-loader", daemon=True)
         self.thread.start()
 
-    def stop(self):
+    def stop_async(self):
+        """Signal the loader to stop without waiting for its thread; returns immediately."""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=5)
-        self.api.close()
+        self._stop_event.set()
+        self._wake_event.set()
+        self.api.cancel()
+
+    def stop(self, timeout: float = 1.0):
+        self.stop_async()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
+
+    def reconfigure(self, poll_interval: Optional[float] = None):
+        """Apply new settings; the loop wakes up and uses them right away."""
+        if poll_interval is not None:
+            self.poll_interval = poll_interval
+        self._wake_event.set()
+
+    def _wait(self, timeout: float):
+        self.clock.wait(self._wake_event, timeout)
+        self._wake_event.clear()
 
     def _monitor_loop(self):
-        while self.running:
-            try:
-                is_active = self.api.is_game_active()
-
-                if is_active and not self.game_active:
-                    self._handle_game_start()
-                elif not is_active and self.game_active:
-                    self._handle_game_end()
-                elif is_active and self.game_active:
-                    self._handle_level_update()
-
-                time.sleep(self.poll_interval)
-            except Exception as e:
-                print(f"Auto-loader error: {e}")
-                time.sleep(self.poll_interval)
-
-    def _handle_game_start(self):
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    with POLL_SECONDS.time():
+                        self._poll()
+                except Exception as e:
+                    logger.warning("Auto-loader error: %s", e, extra={"key": type(e).__name__})
+                self._wait(self.poll_interval)
+        finally:
+            self.api.close()
+
+    def _poll(self):
+        trace = tracing.start("poll")
+        snapshot = self.api.get_all_game_data()
+        trace.mark("api_response")
+        if self._stop_event.is_set():
+            return
+        is_active = snapshot is not None
+        if is_active:
+            self.missed_polls = 0
+
+        if is_active and not self.game_active:
+            self._handle_game_start(snapshot)
+        elif not is_active and self.game_active:
+            if self._game_end_confirmed():
+                self._handle_game_end()
+        elif is_active and self.game_active:
+            # While the UI is behind, skip level updates; the next poll carries newer data.
+            if not (self.is_ui_behind and self.is_ui_behind()):
+                self._handle_level_update(snapshot)
+            else:
+                UPDATES_SKIPPED.inc()
+
+    def _game_end_confirmed(self) -> bool:
+        self.missed_polls += 1
+        if self.missed_polls < self.game_end_polls:
+            logger.info("No game data (%d/%d), keeping the game", self.missed_polls, self.game_end_polls)
+            return False
+        if self.api.is_game_active():
+            logger.info("Game data unavailable but the game is still running")
+            return False
+        return True
+
+    def _handle_game_start(self, snapshot: Dict[str, Any]):
         self.game_active = True
-        print("Game detected - loading enemy team...")
+        logger.info("Game detected - loading enemy team...")
 
-        enemy_team = self.api.get_enemy_team()
+        enemy_team = self.api.get_enemy_team(snapshot)
         if enemy_team and self.on_game_start:
-            parsed_data = self._parse_enemy_team(enemy_team)
+            with PARSE_SECONDS.labels("game_start").time():
+                parsed_data = self._parse_enemy_team(enemy_team, snapshot)
+            trace = tracing.current()
+            trace.set_kind("game_start")
+            trace.mark("parsed")
             self.on_game_start(parsed_data)
+            EVENTS_DISPATCHED.labels("game_start").inc()
 
     def _handle_game_end(self):
         self.game_active = False
-        print("Game ended")
+        self.missed_polls = 0
+        logger.info("Game ended")
 
         if self.on_game_end:
             self.on_game_end()
+            EVENTS_DISPATCHED.labels("game_end").inc()
 
-    def _handle_level_update(self):
-        enemy_team = self.api.get_enemy_team()
+    def _handle_level_update(self, snapshot: Dict[str, Any]):
+        enemy_team = self.api.get_enemy_team(snapshot)
         if enemy_team and self.on_level_update:
+            parse_start = time.perf_counter()
             sorted_enemy_team = self._sort_by_position(enemy_team)
             levels_data = []
             for player in sorted_enemy_team:
@@ -91,7 +169,7 @@ class GameAutoLoader:
                 items = player.get("items", [])
                 item_ids = [item.get("itemID", 0) for item in items if item.get("itemID")]
 
-                champion_stats = self.api.get_player_stats(summoner_name)
+                champion_stats = self.api.get_player_stats(summoner_name, snapshot)
                 base_ability_haste = 0.0
                 if champion_stats:
                     base_ability_haste = champion_stats.get("abilityHaste", 0.0)
@@ -99,7 +177,7 @@ class GameAutoLoader:
                 items_ability_haste = calculate_ability_haste_from_items(item_ids)
                 ability_haste = int(base_ability_haste) + items_ability_haste
 
-                rune_ids = self.api.get_player_runes(summoner_name)
+                rune_ids = self.api.get_player_runes(summoner_name, snapshot)
 
                 summoner_haste = calculate_summoner_spell_haste(item_ids, rune_ids)
                 ultimate_haste = calculate_ultimate_haste_from_items(item_ids)
@@ -110,9 +188,15 @@ class GameAutoLoader:
                     "ability_haste": int(ability_haste),
                     "ultimate_haste": ultimate_haste
                 })
+            PARSE_SECONDS.labels("level_update").observe(time.perf_counter() - parse_start)
+            trace = tracing.current()
+            trace.set_kind("level_update")
+            trace.mark("parsed")
             self.on_level_update(levels_data)
+            EVENTS_DISPATCHED.labels("level_update").inc()
 
-    def _parse_enemy_team(self, enemy_team: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _parse_enemy_team(self, enemy_team: List[Dict[str, Any]], snapshot: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        snapshot = snapshot if snapshot is not None else self.api.get_all_game_data()
         sorted_enemy_team = self._sort_by_position(enemy_team)
         parsed = []
 
@@ -134,7 +218,7 @@ class GameAutoLoader:
             items = player.get("items", [])
             item_ids = [item.get("itemID", 0) for item in items if item.get("itemID")]
 
-            champion_stats = self.api.get_player_stats(summoner_name)
+            champion_stats = self.api.get_player_stats(summoner_name, snapshot)
             base_ability_haste = 0.0
             if champion_stats:
                 base_ability_haste = champion_stats.get("abilityHaste", 0.0)
@@ -142,7 +226,7 @@ class GameAutoLoader:
             items_ability_haste = calculate_ability_haste_from_items(item_ids)
             ability_haste = int(base_ability_haste) + items_ability_haste
 
-            rune_ids = self.api.get_player_runes(summoner_name)
+            rune_ids = self.api.get_player_runes(summoner_name, snapshot)
 
             summoner_haste = calculate_summoner_spell_haste(item_ids, rune_ids)
             ultimate_haste = calculate_ultimate_haste_from_items(item_ids)
@@ -162,7 +246,7 @@ class GameAutoLoader:
     def _sort_by_position(self, team: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         has_positions = any(player.get("position", "").strip() for player in team)
         if not has_positions:
-            print("⚠️ No position data available, skipping sort")
+            logger.warning("No position data available, skipping sort")
             return team
 
         position_order = {
@@ -221,7 +305,7 @@ class GameAutoLoader:
 
         result = spell_mapping.get(display_name, display_name.lower())
         if display_name and display_name not in spell_mapping:
-            print(f"⚠️ Unknown spell from API: '{display_name}' (mapped to '{result}')")
+            logger.warning("Unknown spell from API: %r (mapped to %r)", display_name, result, extra={"key": display_name})
         return result
 
     def set_callbacks(self,
@@ -233,10 +317,11 @@ class GameAutoLoader:
         self.on_level_update = on_level_update
 
     def force_reload(self):
-        if self.api.is_game_active():
-            enemy_team = self.api.get_enemy_team()
+        snapshot = self.api.get_all_game_data()
+        if snapshot is not None:
+            enemy_team = self.api.get_enemy_team(snapshot)
             if enemy_team and self.on_game_start:
-                parsed_data = self._parse_enemy_team(enemy_team)
+                parsed_data = self._parse_enemy_team(enemy_team, snapshot)
                 self.on_game_start(parsed_data)
                 return True
         return False
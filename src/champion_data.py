@@ -1,14 +1,26 @@
 """
 Champion data loader for League of Legends overlay.
 
-This module handles loading champion ultimate cooldown data from JSON
-and provides utilities for accessing champion icons.
+This module handles loading champion ultimate cooldown data from the
+compiled game data bundle (falling back to JSON) and provides utilities
+for accessing champion icons. Data is loaded lazily: either on a background
+thread via load_game_data_async() or on first access.
 """
 
 import json
 import os
+import threading
+from concurrent.futures import Future
 from typing import Dict, List, Optional
 from config import CHAMPIONS_DATA_PATH, CHAMPION_ULT_ICONS_DIR, CHAMPION_ICONS_DIR, SUMMONER_SPELLS_DATA_PATH, SUMMONER_SPELLS_DIR, DEBUG_MODE, DEBUG_COOLDOWN
+from haste_calculator import preload_items_data
+from game_data_bundle import load_current_bundle
+from asset_manifest import load_asset_manifest, probe_champion_icon
+from resources import open_resource, resource_exists
+from app_logging import get_logger
+import startup_timing
+
+logger = get_logger(__name__)
 
 
 class ChampionData:
@@ -17,17 +29,40 @@ class ChampionData:
 
     Loads champion ultimate cooldown data from JSON file and provides
     methods to access cooldowns and icon file paths for all champions.
+    The `ready` future resolves once data has been loaded.
     """
 
     def __init__(self):
         self.cooldowns: Dict[str, List[float]] = {}
         self.champions: List[str] = []
         self.use_champion_icons = False
-        self._load_data()
+        self.ready: Future = Future()
+        self._load_lock = threading.Lock()
+
+    def load(self):
+        with self._load_lock:
+            if self.ready.done():
+                return
+            self._load_data()
+            self.ready.set_result(self)
+
+    def _ensure_loaded(self):
+        if not self.ready.done():
+            self.load()
 
     def _load_data(self):
+        bundle = load_current_bundle()
+        if bundle:
+            self.cooldowns = bundle.champion_cooldowns()
+            self.champions = sorted([
+                champ for champ, cd in self.cooldowns.items()
+                if cd is not None
+            ])
+            logger.info("Loaded %d champions from bundle", len(self.champions))
+            return
+
         try:
-            with open(CHAMPIONS_DATA_PATH, 'r', encoding='utf-8') as f:
+            with open_resource(CHAMPIONS_DATA_PATH) as f:
                 self.cooldowns = json.load(f)
 
             self.champions = sorted([
@@ -35,15 +70,34 @@ class ChampionData:
                 if cd is not None
             ])
 
-            print(f"Loaded {len(self.champions)} champions")
+            logger.info("Loaded %d champions", len(self.champions))
         except FileNotFoundError:
-            print(f"Error: {CHAMPIONS_DATA_PATH} not found")
+            logger.error("%s not found", CHAMPIONS_DATA_PATH)
             self.champions = []
         except json.JSONDecodeError:
-            print(f"Error: Failed to parse {CHAMPIONS_DATA_PATH}")
+            logger.error("Failed to parse %s", CHAMPIONS_DATA_PATH)
             self.champions = []
 
+    def reload(self) -> bool:
+        """Re-read cooldowns from JSON and swap them in, keeping current data on failure."""
+        self._ensure_loaded()
+        try:
+            with open_resource(CHAMPIONS_DATA_PATH) as f:
+                cooldowns = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Error reloading %s: %s", CHAMPIONS_DATA_PATH, e, extra={"key": CHAMPIONS_DATA_PATH})
+            return False
+
+        champions = sorted([
+            champ for champ, cd in cooldowns.items()
+            if cd is not None
+        ])
+        self.cooldowns, self.champions = cooldowns, champions
+        logger.info("Reloaded %d champions", len(self.champions))
+        return True
+
     def get_cooldown(self, champion: str, level: int = 0) -> Optional[float]:
+        self._ensure_loaded()
         cooldowns = self.cooldowns.get(champion)
         if cooldowns is None or level >= len(cooldowns):
             return None
@@ -52,50 +106,23 @@ class ChampionData:
     def get_all_cooldowns(self, champion: str) -> Optional[List[float]]:
         if DEBUG_MODE:
             return [DEBUG_COOLDOWN, DEBUG_COOLDOWN, DEBUG_COOLDOWN]
+        self._ensure_loaded()
         return self.cooldowns.get(champion)
 
     def set_icon_type(self, use_champion_icons: bool):
         self.use_champion_icons = use_champion_icons
 
     def get_icon_path(self, champion: str) -> Optional[str]:
-        icon_name = champion.replace(" ", "").replace("'", "").replace(".", "").replace("&", "")
-
-        champion_icon_mapping = {
-            "NunuWillump": "Nunu",
-            "RenataGlasc": "Renata",
-            "Wukong": "MonkeyKing",
-        }
-
-        ult_icon_mapping = {
-            "NunuWillump": "Nunu&Willump",
-        }
-
-        if self.use_champion_icons:
-            icons_dir = CHAMPION_ICONS_DIR
-            icon_filename = champion_icon_mapping.get(icon_name, icon_name)
-            icon_path = os.path.join(icons_dir, f"{icon_filename}.png")
-
-            if os.path.exists(icon_path):
-                return icon_path
-
-            icon_path_alt = os.path.join(icons_dir, f"{champion.replace(' ', '')}.png")
-            if os.path.exists(icon_path_alt):
-                return icon_path_alt
-        else:
-            icons_dir = CHAMPION_ULT_ICONS_DIR
-            icon_filename = ult_icon_mapping.get(icon_name, icon_name)
-            icon_path = os.path.join(icons_dir, f"{icon_filename}_r.png")
-
-            if os.path.exists(icon_path):
+        manifest = load_asset_manifest()
+        if manifest:
+            icon_path = manifest.champion_icon(champion, self.use_champion_icons)
+            if icon_path:
                 return icon_path
 
-            icon_path_alt = os.path.join(icons_dir, f"{champion.replace(' ', '')}_r.png")
-            if os.path.exists(icon_path_alt):
-                return icon_path_alt
-
-        return None
+        return probe_champion_icon(champion, self.use_champion_icons, CHAMPION_ICONS_DIR, CHAMPION_ULT_ICONS_DIR)
 
     def get_champion_list(self) -> List[str]:
+        self._ensure_loaded()
         return self.champions.copy()
 
 
@@ -105,16 +132,39 @@ class SummonerSpellData:
 
     Loads summoner spell cooldown data from JSON file and provides
     methods to access cooldowns and icon file paths for all summoner spells.
+    The `ready` future resolves once data has been loaded.
     """
 
     def __init__(self):
         self.cooldowns: Dict[str, float] = {}
         self.spells: List[str] = []
-        self._load_data()
+        self.ready: Future = Future()
+        self._load_lock = threading.Lock()
+
+    def load(self):
+        with self._load_lock:
+            if self.ready.done():
+                return
+            self._load_data()
+            self.ready.set_result(self)
+
+    def _ensure_loaded(self):
+        if not self.ready.done():
+            self.load()
 
     def _load_data(self):
+        bundle = load_current_bundle()
+        if bundle:
+            self.cooldowns = bundle.summoner_spell_cooldowns()
+            self.spells = sorted([
+                spell for spell, cd in self.cooldowns.items()
+                if cd is not None
+            ])
+            logger.info("Loaded %d summoner spells from bundle", len(self.spells))
+            return
+
         try:
-            with open(SUMMONER_SPELLS_DATA_PATH, 'r', encoding='utf-8') as f:
+            with open_resource(SUMMONER_SPELLS_DATA_PATH) as f:
                 self.cooldowns = json.load(f)
 
             self.spells = sorted([
@@ -122,28 +172,99 @@ class SummonerSpellData:
                 if cd is not None
             ])
 
-            print(f"Loaded {len(self.spells)} summoner spells")
+            logger.info("Loaded %d summoner spells", len(self.spells))
         except FileNotFoundError:
-            print(f"Error: {SUMMONER_SPELLS_DATA_PATH} not found")
+            logger.error("%s not found", SUMMONER_SPELLS_DATA_PATH)
             self.spells = []
         except json.JSONDecodeError:
-            print(f"Error: Failed to parse {SUMMONER_SPELLS_DATA_PATH}")
+            logger.error("Failed to parse %s", SUMMONER_SPELLS_DATA_PATH)
             self.spells = []
 
+    def reload(self) -> bool:
+        """Re-read cooldowns from JSON and swap them in, keeping current data on failure."""
+        self._ensure_loaded()
+        try:
+            with open_resource(SUMMONER_SPELLS_DATA_PATH) as f:
+                cooldowns = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Error reloading %s: %s", SUMMONER_SPELLS_DATA_PATH, e, extra={"key": SUMMONER_SPELLS_DATA_PATH})
+            return False
+
+        spells = sorted([
+            spell for spell, cd in cooldowns.items()
+            if cd is not None
+        ])
+        self.cooldowns, self.spells = cooldowns, spells
+        logger.info("Reloaded %d summoner spells", len(self.spells))
+        return True
+
     def get_cooldown(self, spell: str) -> Optional[float]:
         if DEBUG_MODE:
             return DEBUG_COOLDOWN
+        self._ensure_loaded()
         return self.cooldowns.get(spell)
 
     def get_icon_path(self, spell: str) -> Optional[str]:
+        manifest = load_asset_manifest()
+        if manifest:
+            icon_path = manifest.summoner_spell_icon(spell)
+            if icon_path:
+                return icon_path
+
         icon_path = os.path.join(SUMMONER_SPELLS_DIR, f"{spell}.png")
-        if os.path.exists(icon_path):
+        if resource_exists(icon_path):
             return icon_path
         return None
 
     def get_spell_list(self) -> List[str]:
+        self._ensure_loaded()
         return self.spells.copy()
 
 
 champion_data = ChampionData()
-summoner_spell_data = SummonerSpellData()
\ No newline at end of file
+summoner_spell_data = SummonerSpellData()
+
+_game_data_ready: Optional[Future] = None
+
+
+def load_game_data_async() -> Future:
+    """
+    Load champion, summoner spell and item data on a background thread.
+
+    Safe to call more than once; subsequent calls return the same future.
+
+    Returns:
+        Future resolved when all game data has been loaded
+    """
+    global _game_data_ready
+    if _game_data_ready is not None:
+        return _game_data_ready
+
+    _game_data_ready = Future()
+
+    def worker():
+        try:
+            with startup_timing.phase("load_champion_data"):
+                champion_data.load()
+            with startup_timing.phase("load_summoner_spell_data"):
+                summoner_spell_data.load()
+            with startup_timing.phase("load_items_data"):
+                preload_items_data()
+            startup_timing.mark("data_ready")
+            _game_data_ready.set_result(True)
+            _check_assets()
+        except Exception as e:
+            _game_data_ready.set_exception(e)
+
+    threading.Thread(target=worker, name="game-data-loader", daemon=True).start()
+    return _game_data_ready
+
+
+def _check_assets():
+    manifest = load_asset_manifest()
+    if not manifest:
+        return
+
+    problems = manifest.self_check(champion_data.get_champion_list(), summoner_spell_data.get_spell_list())
+    if problems:
+        logger.warning("Asset self-check found %d problem(s):\n  %s", len(problems), "\n  ".join(problems))
@@ -0,0 +1,146 @@
+"""
+Clock abstraction for timers, the auto-loader and UI scheduling.
+
+Everything that measures cooldowns or waits between polls takes a clock
+instead of calling the time module directly:
+
+- SystemClock: monotonic time, real sleeps, call_at on a timer thread
+- TkClock: SystemClock whose call_at runs callbacks on the Tk thread
+- VirtualClock: time only moves when advance() (or sleep/wait) is called,
+  so a whole game of cooldowns can be simulated in milliseconds
+
+Times are seconds on the clock's own timeline and are only comparable with
+other times from the same clock. `realtime` tells threads that block on
+their own (e.g. on a Condition) whether a timeout in real seconds matches
+the clock; for a VirtualClock they should wait for a call_at() callback.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+
+class ScheduledCall:
+    """Handle returned by call_at(); cancel() stops the callback if it has not run yet."""
+
+    __slots__ = ("when", "callback", "cancelled", "_cancel")
+
+    def __init__(self, when: float, callback: Callable, cancel: Optional[Callable] = None):
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+        self._cancel = cancel
+
+    def cancel(self):
+        self.cancelled = True
+        if self._cancel:
+            self._cancel()
+
+
+class SystemClock:
+    """Real time from time.monotonic()."""
+
+    realtime = True
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        """Sleep until `event` is set or `timeout` elapses; returns whether the event is set."""
+        return event.wait(timeout)
+
+    def call_at(self, when: float, callback: Callable) -> ScheduledCall:
+        """Run callback at clock time `when` on a timer thread."""
+        timer = threading.Timer(max(0.0, when - self.now()), callback)
+        timer.daemon = True
+        handle = ScheduledCall(when, callback, timer.cancel)
+        timer.start()
+        return handle
+
+    def call_later(self, delay: float, callback: Callable) -> ScheduledCall:
+        return self.call_at(self.now() + delay, callback)
+
+
+class TkClock(SystemClock):
+    """SystemClock that schedules callbacks with root.after, so they run on the Tk thread."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def call_at(self, when: float, callback: Callable) -> ScheduledCall:
+        delay_ms = max(0, int(round((when - self.now()) * 1000)))
+        after_id = self.root.after(delay_ms, callback)
+        return ScheduledCall(when, callback, lambda: self.root.after_cancel(after_id))
+
+
+class VirtualClock:
+    """
+    Manually advanced clock for tests, simulations and benchmarks.
+
+    Callbacks scheduled with call_at run on the thread that advances the
+    clock, in deadline order, with now() set to their deadline. sleep() and
+    wait() advance the clock instead of blocking.
+    """
+
+    realtime = False
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._queue: List[Tuple[float, int, ScheduledCall]] = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+
+    def now(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        if not event.is_set() and timeout:
+            self.advance(timeout)
+        return event.is_set()
+
+    def call_at(self, when: float, callback: Callable) -> ScheduledCall:
+        handle = ScheduledCall(when, callback)
+        with self._lock:
+            heapq.heappush(self._queue, (when, next(self._seq), handle))
+        return handle
+
+    def call_later(self, delay: float, callback: Callable) -> ScheduledCall:
+        return self.call_at(self._now + delay, callback)
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(1 for _, _, handle in self._queue if not handle.cancelled)
+
+    def advance(self, seconds: float) -> int:
+        """
+        Move time forward, running every callback that falls due on the way.
+
+        Returns:
+            Number of callbacks run
+        """
+        return self.advance_to(self._now + seconds)
+
+    def advance_to(self, target: float) -> int:
+        ran = 0
+        while True:
+            with self._lock:
+                if not self._queue or self._queue[0][0] > target:
+                    self._now = max(self._now, target)
+                    return ran
+                when, _, handle = heapq.heappop(self._queue)
+                self._now = max(self._now, when)
+            if not handle.cancelled:
+                handle.callback()
+                ran += 1
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -10,14 +10,20 @@ import os
 from pathlib import Path
 
 
-def get_resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller."""
+def _get_resource_base_path():
     try:
-        base_path = sys._MEIPASS
+        return sys._MEIPASS
     except Exception:
-        base_path = Path(__file__).parent.parent
+        return str(Path(__file__).parent.parent)
+
+
+RESOURCE_BASE_PATH = _get_resource_base_path()
+RESOURCE_ARCHIVE_NAME = "resources.zip"
+
 
-    return os.path.join(base_path, relative_path)
+def get_resource_path(relative_path):
+    """Get absolute path to resource, works for dev and for PyInstaller."""
+    return os.path.join(RESOURCE_BASE_PATH, relative_path)
 
 OVERLAY_ALPHA = 0.95
 OVERLAY_BG_COLOR = "#0a0a0a"
@@ -74,10 +80,20 @@ CHAMPION_ICONS_DIR = get_resource_path("data/icons/champions")
 SUMMONER_SPELLS_DATA_PATH = get_resource_path("data/game_data/summoner_spells_cooldowns.json")
 SUMMONER_SPELLS_DIR = get_resource_path("data/icons/summoner_spells")
 
+ITEMS_HASTE_DATA_PATH = get_resource_path("data/game_data/items_haste.json")
+GAME_DATA_BUNDLE_PATH = get_resource_path("data/game_data/game_data.bin")
+
+ASSET_MANIFEST_PATH = get_resource_path("data/assets/asset_manifest.json")
+
+DATA_HOT_RELOAD_ENABLED = True
+DATA_RELOAD_INTERVAL = 5.0
+
 SOUND_FILE_PATH = get_resource_path("data/sounds/ult_ready.wav")
 SOUND_ALERT_THRESHOLD = 1
 SOUND_ENABLED = True
 SOUND_VOLUME = 1.0
+VOICE_CUES_DIR = get_resource_path("data/sounds/voice")
+ALERT_MIXER_CHANNELS = 8
 
 USE_CHAMPION_ICONS = True
 
@@ -87,9 +103,54 @@ SETTINGS_BUTTON_COLOR = "#888888"
 CLOSE_BUTTON_SIZE = 24
 CLOSE_BUTTON_COLOR = "#888888"
 
+STARTUP_BUDGET_MS = 800
+BENCH_REGRESSION_THRESHOLD = 20.0
+
 DEBUG_MODE = False
 DEBUG_COOLDOWN = 10
 
+METRICS_PORT = None
+METRICS_DUMP_PATH = None
+
+LOG_LEVEL = "INFO"
+LOG_BUFFER_SIZE = 500
+LOG_RATE_LIMIT_INTERVAL = 30.0
+
+TRACING_ENABLED = True
+TRACE_BUFFER_SIZE = 200
+
+STALL_DETECTOR_ENABLED = True
+STALL_THRESHOLD = 0.25
+STALL_HEARTBEAT_MS = 50
+STALL_LOG_SIZE = 20
+
+SHOW_PERF_HUD = False
+FRAME_STATS_WINDOW = 1000
+FRAME_STATS_HISTORY = 3600
+
+PROFILER_SAMPLE_INTERVAL = 0.01
+PROFILER_OUTPUT_FORMAT = "speedscope"
+
+ITEM_TOTALS_CACHE_SIZE = 1024
+MEMORY_PROFILE_FRAMES = 1
+MEMORY_PROFILE_TOP = 25
+MEMORY_PROFILE_IN_GAME_DELAY = 10.0
+
+LOW_MEMORY_MODE = False
+LOW_MEMORY_ITEM_TOTALS_CACHE_SIZE = 64
+LOW_MEMORY_LOG_BUFFER_SIZE = 100
+LOW_MEMORY_TRACE_BUFFER_SIZE = 20
+LOW_MEMORY_FRAME_STATS_HISTORY = 300
+
+QUALITY_OVERRIDE = None          # None = automatic, or a fixed tier 0-4
+QUALITY_EVAL_INTERVAL = 2.0
+QUALITY_FRAME_BUDGET_MS = 20.0   # full quality frame p95 is ~12-17 ms (text redrawn every second)
+QUALITY_CPU_BUDGET = 5.0         # percent of one core
+QUALITY_HEADROOM = 0.5
+QUALITY_STEP_UP_HOLD = 10.0
+QUALITY_RETRY_HOLD = 60.0        # seconds a measured tier cost blocks stepping back up
+QUALITY_RETRY_HOLD_MAX = 600.0   # the hold doubles after each failed step up, up to this
+
 UI_SCALE = 1.1
 UI_SCALE_MIN = 0.5
 UI_SCALE_MAX = 2.0
@@ -102,9 +163,25 @@ DEFAULT_SLOT_SPACING = 2
 
 DEFAULT_POSITION = {'x': 848, 'y': 730}
 DEFAULT_LOCKED = False
+SETTINGS_WRITE_DELAY = 0.5
 
 AUTO_LOAD_ENABLED = True
 AUTO_LOAD_POLL_INTERVAL = 3.0
+LIVE_CLIENT_CONNECT_TIMEOUT = 0.5
+LIVE_CLIENT_READ_TIMEOUT = 3.0             # allgamedata; late-game payloads can be slow
+LIVE_CLIENT_GAMESTATS_READ_TIMEOUT = 2.0
+GAME_END_CONFIRM_POLLS = 2                 # consecutive failed polls before a game counts as ended
+
+AUTO_LOAD_OUT_OF_PROCESS = False
+POLL_WORKER_RING_SLOTS = 4
+POLL_WORKER_READ_INTERVAL = 0.25
+POLL_WORKER_HEARTBEAT_TIMEOUT = 10.0
+POLL_WORKER_RESTART_BACKOFF_MAX = 30.0
+
+UI_DISPATCH_INTERVAL_MS = 20
+UI_DISPATCH_MAX_BATCH = 50
+UI_DISPATCH_HIGH_WATER = 20
+UI_DISPATCH_MAX_LATENCY = 0.5
 
 AUTO_LOAD_INDICATOR_SIZE = 10
 AUTO_LOAD_INDICATOR_COLOR_INACTIVE = "#555555"
@@ -0,0 +1,75 @@
+"""
+Game data file watcher for hot reloading cooldown and haste data.
+
+This module polls the game data JSON files on a slow cadence and reloads
+the in-memory tables when one of them changes, so a patch can be applied
+without restarting the overlay and losing running timers.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from config import CHAMPIONS_DATA_PATH, SUMMONER_SPELLS_DATA_PATH, ITEMS_HASTE_DATA_PATH, DATA_RELOAD_INTERVAL
+from champion_data import champion_data, summoner_spell_data
+from haste_calculator import reload_items_data
+
+
+class GameDataWatcher:
+    """
+    Watches game data files and hot-reloads them on change.
+
+    Compares file modification time and size on every check, reloads the
+    matching data table, then notifies a callback with the changed paths.
+    """
+
+    def __init__(self, interval: float = DATA_RELOAD_INTERVAL):
+        self.interval = interval
+        self.reloaders: Dict[str, Callable[[], bool]] = {
+            CHAMPIONS_DATA_PATH: champion_data.reload,
+            SUMMONER_SPELLS_DATA_PATH: summoner_spell_data.reload,
+            ITEMS_HASTE_DATA_PATH: reload_items_data,
+        }
+        self.on_change: Optional[Callable[[List[str]], None]] = None
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def _signature(self, path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+
+        self._signatures = {path: self._signature(path) for path in self.reloaders}
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._watch_loop, name="game-data-watcher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _watch_loop(self):
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def check(self) -> List[str]:
+        """Reload any changed data files and return the paths that were reloaded."""
+        reloaded = []
+        for path, reload in self.reloaders.items():
+            signature = self._signature(path)
+            if signature is None or signature == self._signatures.get(path):
+                continue
+
+            if reload():
+                self._signatures[path] = signature
+                reloaded.append(path)
+
+        if reloaded and self.on_change:
+            self.on_change(reloaded)
+
+        return reloaded
@@ -0,0 +1,126 @@
+"""
+Rolling frame-time statistics for the overlay application.
+
+The timer update loop records how long each frame and each slot redraw
+took, and how many PIL images and PhotoImages were created. Once per
+second the counters are turned into per-second rates. While `recording`
+is set (the performance HUD is shown or an export was requested), a row
+with the percentiles is also added to a bounded history, which
+export_csv() writes out together with the display settings in effect (UI
+scale, icon type, layout) so render cost can be compared across
+configurations.
+"""
+
+import csv
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from config import FRAME_STATS_WINDOW, FRAME_STATS_HISTORY
+
+
+SAMPLE_KINDS = ("frame", "champion_slot", "summoner_slot")
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list; 0.0 when empty."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, int(round(pct / 100 * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+
+class FrameStats:
+    """
+    Frame and slot render timings over the last `window` samples per kind.
+
+    record() and the count_* methods are called from the Tk thread on every
+    frame and only append to deques or bump integers. History rows, which
+    sort every sample window, are only built while `recording` is set.
+    """
+
+    def __init__(self, window: int = FRAME_STATS_WINDOW, history: int = FRAME_STATS_HISTORY):
+        self.samples: Dict[str, Deque[float]] = {kind: deque(maxlen=window) for kind in SAMPLE_KINDS}
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self.context: Dict[str, Any] = {}
+        self.recording = False
+
+        self.pil_images = 0
+        self.photo_images = 0
+        self.frames = 0
+        self.rates = {"fps": 0.0, "pil_images_per_s": 0.0, "photo_images_per_s": 0.0}
+        self._period_start = time.perf_counter()
+
+    def set_history_size(self, history: int):
+        self.history = deque(self.history, maxlen=history)
+
+    def record(self, kind: str, seconds: float):
+        self.samples[kind].append(seconds)
+
+    def count_pil_images(self, count: int = 1):
+        self.pil_images += count
+
+    def count_photo_image(self):
+        self.photo_images += 1
+
+    def set_context(self, **context):
+        """Display settings stored with every history row, e.g. ui_scale=1.1."""
+        self.context.update(context)
+
+    def end_frame(self) -> bool:
+        """
+        Count a finished frame; once per second, roll the counters into rates
+        and, while recording, add a history row.
+
+        Returns:
+            True if the rates were rolled (the HUD should refresh)
+        """
+        self.frames += 1
+        now = time.perf_counter()
+        elapsed = now - self._period_start
+        if elapsed < 1.0:
+            return False
+
+        self.rates = {
+            "fps": self.frames / elapsed,
+            "pil_images_per_s": self.pil_images / elapsed,
+            "photo_images_per_s": self.photo_images / elapsed,
+        }
+        self.frames = self.pil_images = self.photo_images = 0
+        self._period_start = now
+        if self.recording:
+            self.history.append(self.snapshot())
+        return True
+
+    def percentiles(self, kind: str) -> Dict[int, float]:
+        ordered = sorted(self.samples[kind])
+        return {pct: percentile(ordered, pct) for pct in PERCENTILES}
+
+    def snapshot(self) -> Dict[str, Any]:
+        row: Dict[str, Any] = {"time": round(time.time(), 3)}
+        row.update(self.context)
+        for kind in SAMPLE_KINDS:
+            for pct, value in self.percentiles(kind).items():
+                row[f"{kind}_p{pct}_ms"] = round(value * 1000, 3)
+        row.update({key: round(value, 2) for key, value in self.rates.items()})
+        return row
+
+    def format_hud(self) -> str:
+        frame = self.percentiles("frame")
+        champion = self.percentiles("champion_slot")
+        summoner = self.percentiles("summoner_slot")
+        return (f"frame p50/p95/p99 {frame[50] * 1000:.1f}/{frame[95] * 1000:.1f}/{frame[99] * 1000:.1f} ms  "
+                f"champ p95 {champion[95] * 1000:.2f} ms  spell p95 {summoner[95] * 1000:.2f} ms  "
+                f"PIL {self.rates['pil_images_per_s']:.0f}/s  Photo {self.rates['photo_images_per_s']:.0f}/s")
+
+    def export_csv(self, path: str, rows: Optional[List[Dict[str, Any]]] = None):
+        rows = list(self.history) if rows is None else rows
+        if not rows:
+            rows = [self.snapshot()]
+        fieldnames = []
+        for row in rows:
+            fieldnames += [key for key in row if key not in fieldnames]
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
@@ -0,0 +1,291 @@
+"""
+Compiled binary bundle of game data for League of Legends overlay.
+
+This module compiles the champion, summoner spell and item haste JSON files
+into a single versioned, checksummed binary bundle with fixed-width records
+and a shared string table, and reads it back through a memory map (or from
+memory when the bundle is packed in the resource archive).
+
+The JSON files remain the source of truth: the bundle stores a hash of its
+sources and is ignored when that hash no longer matches.
+
+Layout (little-endian):
+    header        HEADER_FORMAT
+    champions     CHAMPION_RECORD_FORMAT * champion_count
+    spells        SPELL_RECORD_FORMAT * spell_count
+    items         ITEM_RECORD_FORMAT * item_count
+    strings       UTF-8 blob referenced by (offset, length) pairs
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+from config import CHAMPIONS_DATA_PATH, SUMMONER_SPELLS_DATA_PATH, ITEMS_HASTE_DATA_PATH, GAME_DATA_BUNDLE_PATH
+from resources import read_resource, resource_exists
+
+
+BUNDLE_MAGIC = b"STGD"
+BUNDLE_VERSION = 1
+
+# magic, version, reserved, payload crc32, source sha256,
+# champion/spell/item counts, strings offset, strings size
+HEADER_FORMAT = "<4sHHI32sIIIII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+MAX_CHAMPION_COOLDOWNS = 6
+NO_COOLDOWNS = 0xFF
+
+# name offset, name length, cooldown count, padding, cooldowns
+CHAMPION_RECORD_FORMAT = f"<IHBx{MAX_CHAMPION_COOLDOWNS}f"
+CHAMPION_RECORD_SIZE = struct.calcsize(CHAMPION_RECORD_FORMAT)
+
+# name offset, name length, padding, cooldown
+SPELL_RECORD_FORMAT = "<IH2xf"
+SPELL_RECORD_SIZE = struct.calcsize(SPELL_RECORD_FORMAT)
+
+# item id, name offset, name length, ability/summoner/ultimate haste
+ITEM_RECORD_FORMAT = "<IIHhhh"
+ITEM_RECORD_SIZE = struct.calcsize(ITEM_RECORD_FORMAT)
+
+SOURCE_PATHS = (CHAMPIONS_DATA_PATH, SUMMONER_SPELLS_DATA_PATH, ITEMS_HASTE_DATA_PATH)
+
+
+class BundleError(Exception):
+    """Raised when a game data bundle is missing, corrupt or unsupported."""
+
+
+def compute_source_hash(source_paths=SOURCE_PATHS) -> Optional[bytes]:
+    """
+    Hash the JSON source files a bundle is compiled from.
+
+    Args:
+        source_paths: Paths of the source JSON files
+
+    Returns:
+        SHA-256 digest of the sources, or None if any source is missing
+    """
+    digest = hashlib.sha256()
+    for path in source_paths:
+        try:
+            content = read_resource(path)
+        except OSError:
+            return None
+        digest.update(os.path.basename(path).encode('utf-8'))
+        digest.update(struct.pack("<Q", len(content)))
+        digest.update(content)
+    return digest.digest()
+
+
+class _StringTable:
+    def __init__(self):
+        self.blob = bytearray()
+        self.offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, text: str) -> Tuple[int, int]:
+        if text not in self.offsets:
+            encoded = text.encode('utf-8')
+            self.offsets[text] = (len(self.blob), len(encoded))
+            self.blob.extend(encoded)
+        return self.offsets[text]
+
+
+def compile_bundle(output_path: str = GAME_DATA_BUNDLE_PATH, source_paths=SOURCE_PATHS) -> int:
+    """
+    Compile the JSON game data files into a binary bundle.
+
+    Args:
+        output_path: Destination path of the bundle
+        source_paths: Champion, summoner spell and item haste JSON paths
+
+    Returns:
+        Size of the written bundle in bytes
+    """
+    champions_path, spells_path, items_path = source_paths
+    with open(champions_path, 'r', encoding='utf-8') as f:
+        champions = json.load(f)
+    with open(spells_path, 'r', encoding='utf-8') as f:
+        spells = json.load(f)
+    with open(items_path, 'r', encoding='utf-8') as f:
+        items = json.load(f)
+
+    strings = _StringTable()
+    body = bytearray()
+
+    for name in sorted(champions):
+        cooldowns = champions[name]
+        offset, length = strings.add(name)
+        if cooldowns is None:
+            count = NO_COOLDOWNS
+            values = [0.0] * MAX_CHAMPION_COOLDOWNS
+        else:
+            if len(cooldowns) > MAX_CHAMPION_COOLDOWNS:
+                raise BundleError(f"{name} has {len(cooldowns)} cooldowns, max is {MAX_CHAMPION_COOLDOWNS}")
+            count = len(cooldowns)
+            values = list(cooldowns) + [0.0] * (MAX_CHAMPION_COOLDOWNS - count)
+        body.extend(struct.pack(CHAMPION_RECORD_FORMAT, offset, length, count, *values))
+
+    for name in sorted(spells):
+        offset, length = strings.add(name)
+        body.extend(struct.pack(SPELL_RECORD_FORMAT, offset, length, spells[name] or 0.0))
+
+    for item_id in sorted(items, key=int):
+        item = items[item_id]
+        offset, length = strings.add(item.get("name", ""))
+        body.extend(struct.pack(
+            ITEM_RECORD_FORMAT,
+            int(item_id), offset, length,
+            item.get("ability_haste", 0),
+            item.get("summoner_haste", 0),
+            item.get("ultimate_haste", 0)
+        ))
+
+    strings_offset = HEADER_SIZE + len(body)
+    payload = bytes(body) + bytes(strings.blob)
+
+    source_hash = compute_source_hash(source_paths)
+    header = struct.pack(
+        HEADER_FORMAT,
+        BUNDLE_MAGIC, BUNDLE_VERSION, 0,
+        zlib.crc32(payload), source_hash,
+        len(champions), len(spells), len(items),
+        strings_offset, len(strings.blob)
+    )
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp_path, output_path)
+
+    return len(header) + len(payload)
+
+
+class GameDataBundle:
+    """
+    Read-only view of a compiled game data bundle.
+
+    Memory-maps the bundle file (or reads it from the resource archive),
+    validates its header and checksum, and decodes records on demand
+    through typed accessors.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._buffer = read_resource(path)
+
+        if len(self._buffer) < HEADER_SIZE:
+            raise BundleError(f"{path} is too small to be a game data bundle")
+
+        (magic, version, _, crc, self.source_hash,
+         self.champion_count, self.spell_count, self.item_count,
+         self._strings_offset, self._strings_size) = struct.unpack_from(HEADER_FORMAT, self._buffer, 0)
+
+        if magic != BUNDLE_MAGIC:
+            raise BundleError(f"{path} is not a game data bundle")
+        if version != BUNDLE_VERSION:
+            raise BundleError(f"{path} has unsupported version {version}")
+        if zlib.crc32(self._buffer[HEADER_SIZE:]) != crc:
+            raise BundleError(f"{path} failed checksum verification")
+
+        self._champions_offset = HEADER_SIZE
+        self._spells_offset = self._champions_offset + self.champion_count * CHAMPION_RECORD_SIZE
+        self._items_offset = self._spells_offset + self.spell_count * SPELL_RECORD_SIZE
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._buffer[start:start + length].decode('utf-8')
+
+    def is_current(self, source_paths=SOURCE_PATHS) -> bool:
+        """Check whether the bundle still matches its JSON sources."""
+        source_hash = compute_source_hash(source_paths)
+        if source_hash is None:
+            # Sources are not shipped alongside the bundle; trust it.
+            return True
+        return source_hash == self.source_hash
+
+    def champion_cooldowns(self) -> Dict[str, Optional[List[float]]]:
+        cooldowns = {}
+        for i in range(self.champion_count):
+            record = struct.unpack_from(CHAMPION_RECORD_FORMAT, self._buffer, self._champions_offset + i * CHAMPION_RECORD_SIZE)
+            offset, length, count = record[:3]
+            name = self._string(offset, length)
+            cooldowns[name] = None if count == NO_COOLDOWNS else list(record[3:3 + count])
+        return cooldowns
+
+    def summoner_spell_cooldowns(self) -> Dict[str, float]:
+        cooldowns = {}
+        for i in range(self.spell_count):
+            offset, length, cooldown = struct.unpack_from(SPELL_RECORD_FORMAT, self._buffer, self._spells_offset + i * SPELL_RECORD_SIZE)
+            cooldowns[self._string(offset, length)] = cooldown
+        return cooldowns
+
+    def item_haste_table(self) -> Dict[int, Dict[str, int]]:
+        items = {}
+        for i in range(self.item_count):
+            item_id, offset, length, ability_haste, summoner_haste, ultimate_haste = struct.unpack_from(
+                ITEM_RECORD_FORMAT, self._buffer, self._items_offset + i * ITEM_RECORD_SIZE
+            )
+            items[item_id] = {
+                "name": self._string(offset, length),
+                "ability_haste": ability_haste,
+                "summoner_haste": summoner_haste,
+                "ultimate_haste": ultimate_haste
+            }
+        return items
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+_bundle: Optional[GameDataBundle] = None
+_bundle_checked = False
+_bundle_lock = threading.Lock()
+
+
+def load_current_bundle() -> Optional[GameDataBundle]:
+    """
+    Open the compiled bundle if it exists and matches its JSON sources.
+
+    The result is cached, so the bundle is opened and validated once per
+    process.
+
+    Returns:
+        The bundle, or None when callers should fall back to JSON
+    """
+    global _bundle, _bundle_checked
+    with _bundle_lock:
+        if _bundle_checked:
+            return _bundle
+        _bundle_checked = True
+
+        if not resource_exists(GAME_DATA_BUNDLE_PATH):
+            return None
+
+        try:
+            bundle = GameDataBundle(GAME_DATA_BUNDLE_PATH)
+        except (OSError, ValueError, struct.error, BundleError) as e:
+            print(f"Ignoring game data bundle: {e}")
+            return None
+
+        if not bundle.is_current():
+            print("Game data bundle is stale, falling back to JSON")
+            bundle.close()
+            return None
+
+        _bundle = bundle
+        return _bundle
+
+
+if __name__ == "__main__":
+    size = compile_bundle()
+    print(f"Compiled {GAME_DATA_BUNDLE_PATH} ({size} bytes)")
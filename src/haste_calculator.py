@@ -6,32 +6,115 @@ ability haste, summoner spell haste, and ultimate ability haste.
 """
 
 import json
-import os
-from pathlib import Path
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Tuple
+from config import ITEMS_HASTE_DATA_PATH, ITEM_TOTALS_CACHE_SIZE
+from game_data_bundle import load_current_bundle
+from resources import open_resource
+from app_logging import get_logger
+import metrics
 
+logger = get_logger(__name__)
 
 COSMIC_INSIGHT_ID = 8347
 COSMIC_INSIGHT_SUMMONER_HASTE = 18
 
 _ITEMS_DATA = None
+_ITEMS_DATA_LOCK = threading.Lock()
+
+# Haste totals per item build; builds rarely change between polls.
+_ITEM_TOTALS_CACHE: Dict[Tuple[int, ...], Dict[str, int]] = {}
+_ITEM_TOTALS_CACHE_SIZE = ITEM_TOTALS_CACHE_SIZE
+
+CACHE_HITS = metrics.counter("haste_item_cache_hits_total", "Item haste lookups served from the per-build cache")
+CACHE_MISSES = metrics.counter("haste_item_cache_misses_total", "Item haste lookups computed from the item table")
 
 
 def _load_items_data():
     global _ITEMS_DATA
     if _ITEMS_DATA is None:
-        try:
-            base_path = Path(__file__).parent.parent
-            items_file = base_path / "data" / "game_data" / "items_haste.json"
-            with open(items_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                _ITEMS_DATA = {int(k): v for k, v in data.items()}
-        except Exception as e:
-            print(f"Error loading items data: {e}")
-            _ITEMS_DATA = {}
+        with _ITEMS_DATA_LOCK:
+            if _ITEMS_DATA is None:
+                bundle = load_current_bundle()
+                if bundle:
+                    _ITEMS_DATA = bundle.item_haste_table()
+                    return _ITEMS_DATA
+                try:
+                    with open_resource(ITEMS_HASTE_DATA_PATH) as f:
+                        data = json.load(f)
+                        _ITEMS_DATA = {int(k): v for k, v in data.items()}
+                except Exception as e:
+                    logger.error("Error loading items data: %s", e)
+                    _ITEMS_DATA = {}
     return _ITEMS_DATA
 
 
+def preload_items_data():
+    """Load the item haste table ahead of the first haste calculation."""
+    _load_items_data()
+
+
+def release_items_data():
+    """Drop the decoded item haste table and the totals cache; the next lookup loads them again."""
+    global _ITEMS_DATA
+    with _ITEMS_DATA_LOCK:
+        _ITEMS_DATA = None
+        _ITEM_TOTALS_CACHE.clear()
+
+
+def set_item_totals_cache_size(size: int):
+    global _ITEM_TOTALS_CACHE_SIZE
+    _ITEM_TOTALS_CACHE_SIZE = size
+    if len(_ITEM_TOTALS_CACHE) > size:
+        _ITEM_TOTALS_CACHE.clear()
+
+
+def reload_items_data() -> bool:
+    """
+    Re-read the item haste table from JSON and swap it in.
+
+    The current table is kept if the file cannot be read or parsed.
+
+    Returns:
+        True if the table was replaced
+    """
+    global _ITEMS_DATA
+    try:
+        with open_resource(ITEMS_HASTE_DATA_PATH) as f:
+            data = json.load(f)
+        items_data = {int(k): v for k, v in data.items()}
+    except (OSError, ValueError) as e:
+        logger.error("Error reloading items data: %s", e, extra={"key": "reload"})
+        return False
+
+    _ITEMS_DATA = items_data
+    _ITEM_TOTALS_CACHE.clear()
+    logger.info("Reloaded %d items", len(items_data))
+    return True
+
+
+def _item_totals(items: List[int]) -> Dict[str, int]:
+    key = tuple(items)
+    totals = _ITEM_TOTALS_CACHE.get(key)
+    if totals is not None:
+        CACHE_HITS.inc()
+        return totals
+
+    CACHE_MISSES.inc()
+    items_data = _load_items_data()
+    totals = {"summoner_haste": 0, "ability_haste": 0, "ultimate_haste": 0}
+    for item_id in items:
+        entry = items_data.get(item_id)
+        if entry:
+            for name in totals:
+                totals[name] += entry.get(name, 0)
+
+    if len(_ITEM_TOTALS_CACHE) >= _ITEM_TOTALS_CACHE_SIZE:
+        _ITEM_TOTALS_CACHE.clear()
+    _ITEM_TOTALS_CACHE[key] = totals
+    return totals
+
+
 def calculate_summoner_spell_haste(items: List[int], runes: List[int]) -> int:
     """
     Calculate total summoner spell haste from items and runes.
@@ -43,12 +126,7 @@ def calculate_summoner_spell_haste(items: List[int], runes: List[int]) -> int:
     Returns:
         Total summoner spell haste value
     """
-    items_data = _load_items_data()
-    total_haste = 0
-
-    for item_id in items:
-        if item_id in items_data:
-            total_haste += items_data[item_id].get("summoner_haste", 0)
+    total_haste = _item_totals(items)["summoner_haste"]
 
     if COSMIC_INSIGHT_ID in runes:
         total_haste += COSMIC_INSIGHT_SUMMONER_HASTE
@@ -66,14 +144,7 @@ def calculate_ability_haste_from_items(items: List[int]) -> int:
     Returns:
         Total ability haste value from items
     """
-    items_data = _load_items_data()
-    total_haste = 0
-
-    for item_id in items:
-        if item_id in items_data:
-            total_haste += items_data[item_id].get("ability_haste", 0)
-
-    return total_haste
+    return _item_totals(items)["ability_haste"]
 
 
 def calculate_ultimate_haste_from_items(items: List[int]) -> int:
@@ -86,14 +157,7 @@ def calculate_ultimate_haste_from_items(items: List[int]) -> int:
     Returns:
         Additional ultimate ability haste value from items
     """
-    items_data = _load_items_data()
-    total_haste = 0
-
-    for item_id in items:
-        if item_id in items_data:
-            total_haste += items_data[item_id].get("ultimate_haste", 0)
-
-    return total_haste
+    return _item_totals(items)["ultimate_haste"]
 
 
 def apply_haste(base_cooldown: float, haste: int) -> float:
@@ -0,0 +1,363 @@
+"""
+Item haste compiler for the wiki item data dump.
+
+This module parses `item_data.json`, a Lua module dump of the League of
+Legends wiki item table, and regenerates `items_haste.json` from it. It is a
+build-time tool; the overlay never reads the dump at runtime.
+
+Compilation is incremental: a stamp file records the hash of the dump the
+output was generated from, and nothing is rewritten unless it changes.
+
+Usage:
+    python src/item_data_compiler.py [--force] [--dry-run] [--bundle]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, List, Tuple
+from config import get_resource_path
+
+
+ITEM_DATA_DUMP_PATH = get_resource_path("data/game_data/item_data.json")
+ITEMS_HASTE_OUTPUT_PATH = get_resource_path("data/game_data/items_haste.json")
+ITEMS_HASTE_STAMP_PATH = ITEMS_HASTE_OUTPUT_PATH + ".stamp"
+
+COMPILER_VERSION = 1
+
+SUMMONER_HASTE_PATTERN = re.compile(r"(\d+)\s*\[\[Haste#Summoner spell haste")
+ULTIMATE_HASTE_PATTERN = re.compile(r"(\d+)\s*\[\[Haste#Ultimate haste")
+
+HASTE_FIELDS = ("ability_haste", "summoner_haste", "ultimate_haste")
+
+
+class LuaParseError(Exception):
+    """Raised when the Lua table dump cannot be parsed."""
+
+
+class LuaTableParser:
+    """
+    Minimal parser for the Lua table literals used in wiki data modules.
+
+    Supports `return { ... }`, `["key"] = value` and `key = value` fields,
+    positional entries, strings, numbers, booleans, nil and `--` comments.
+    Tables with only positional entries become lists, others become dicts.
+    """
+
+    _ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\", '"': '"', "'": "'", "\n": "\n"}
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def parse(self) -> Any:
+        self._skip_whitespace()
+        if self.text.startswith("return", self.pos):
+            self.pos += len("return")
+        value = self._parse_value()
+        self._skip_whitespace()
+        if self.pos != len(self.text):
+            raise self._error("unexpected trailing content")
+        return value
+
+    def _error(self, message: str) -> LuaParseError:
+        line = self.text.count("\n", 0, self.pos) + 1
+        return LuaParseError(f"line {line}: {message}")
+
+    def _skip_whitespace(self):
+        text = self.text
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char.isspace():
+                self.pos += 1
+            elif text.startswith("--", self.pos):
+                end = text.find("\n", self.pos)
+                self.pos = len(text) if end == -1 else end + 1
+            else:
+                break
+
+    def _parse_value(self) -> Any:
+        self._skip_whitespace()
+        if self.pos >= len(self.text):
+            raise self._error("unexpected end of input")
+
+        char = self.text[self.pos]
+        if char == "{":
+            return self._parse_table()
+        if char in "\"'":
+            return self._parse_string()
+        if char == "-" or char.isdigit():
+            return self._parse_number()
+
+        word = self._parse_identifier()
+        if word == "true":
+            return True
+        if word == "false":
+            return False
+        if word == "nil":
+            return None
+        raise self._error(f"unexpected token '{word}'")
+
+    def _parse_table(self) -> Any:
+        self.pos += 1
+        fields: Dict[Any, Any] = {}
+        items: List[Any] = []
+
+        while True:
+            self._skip_whitespace()
+            if self.pos >= len(self.text):
+                raise self._error("unterminated table")
+            char = self.text[self.pos]
+
+            if char == "}":
+                self.pos += 1
+                break
+
+            if char == "[":
+                self.pos += 1
+                key = self._parse_value()
+                self._skip_whitespace()
+                self._expect("]")
+                self._skip_whitespace()
+                self._expect("=")
+                fields[key] = self._parse_value()
+            elif char.isalpha() or char == "_":
+                start = self.pos
+                name = self._parse_identifier()
+                self._skip_whitespace()
+                if self.text.startswith("=", self.pos) and not self.text.startswith("==", self.pos):
+                    self.pos += 1
+                    fields[name] = self._parse_value()
+                else:
+                    self.pos = start
+                    items.append(self._parse_value())
+            else:
+                items.append(self._parse_value())
+
+            self._skip_whitespace()
+            if self.pos < len(self.text) and self.text[self.pos] in ",;":
+                self.pos += 1
+
+        if fields:
+            for index, value in enumerate(items, start=1):
+                fields[index] = value
+            return fields
+        return items
+
+    def _parse_string(self) -> str:
+        quote = self.text[self.pos]
+        self.pos += 1
+        chunks = []
+        start = self.pos
+
+        while True:
+            if self.pos >= len(self.text):
+                raise self._error("unterminated string")
+            char = self.text[self.pos]
+            if char == quote:
+                chunks.append(self.text[start:self.pos])
+                self.pos += 1
+                return "".join(chunks)
+            if char == "\\":
+                chunks.append(self.text[start:self.pos])
+                escaped = self.text[self.pos + 1:self.pos + 2]
+                chunks.append(self._ESCAPES.get(escaped, escaped))
+                self.pos += 2
+                start = self.pos
+            else:
+                self.pos += 1
+
+    def _parse_number(self) -> Any:
+        match = re.compile(r"-?(0[xX][0-9a-fA-F]+|\d+(\.\d*)?([eE][-+]?\d+)?|\.\d+)").match(self.text, self.pos)
+        if not match:
+            raise self._error("invalid number")
+        self.pos = match.end()
+        literal = match.group(0)
+        if literal.lstrip("-").lower().startswith("0x"):
+            return int(literal, 16)
+        number = float(literal)
+        return int(number) if number.is_integer() and "." not in literal and "e" not in literal.lower() else number
+
+    def _parse_identifier(self) -> str:
+        match = re.compile(r"[A-Za-z_][A-Za-z0-9_]*").match(self.text, self.pos)
+        if not match:
+            raise self._error(f"unexpected character '{self.text[self.pos]}'")
+        self.pos = match.end()
+        return match.group(0)
+
+    def _expect(self, token: str):
+        if not self.text.startswith(token, self.pos):
+            raise self._error(f"expected '{token}'")
+        self.pos += len(token)
+
+
+def _sum_effect_haste(effects: Any, pattern: re.Pattern) -> int:
+    if not isinstance(effects, dict):
+        return 0
+    total = 0
+    for effect in effects.values():
+        if isinstance(effect, dict):
+            description = effect.get("description", "")
+            if isinstance(description, str):
+                total += sum(int(value) for value in pattern.findall(description))
+    return total
+
+
+def extract_item_haste(items: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract haste values and game modes for every item granting haste.
+
+    Args:
+        items: Parsed wiki item table keyed by item name
+
+    Returns:
+        Mapping of item ID (as string) to name, haste values and modes
+    """
+    result = {}
+    for name, item in items.items():
+        if not isinstance(item, dict) or "id" not in item:
+            continue
+
+        stats = item.get("stats") or {}
+        effects = item.get("effects") or {}
+        ability_haste = stats.get("ah", 0) if isinstance(stats, dict) else 0
+        if not isinstance(ability_haste, (int, float)):
+            # Transforming items reference their upgrade instead of a value.
+            ability_haste = 0
+        summoner_haste = _sum_effect_haste(effects, SUMMONER_HASTE_PATTERN)
+        ultimate_haste = _sum_effect_haste(effects, ULTIMATE_HASTE_PATTERN)
+
+        if not (ability_haste or summoner_haste or ultimate_haste):
+            continue
+
+        modes = item.get("modes") or {}
+        result[str(item["id"])] = {
+            "name": name,
+            "ability_haste": int(ability_haste),
+            "summoner_haste": summoner_haste,
+            "ultimate_haste": ultimate_haste,
+            "modes": sorted(mode for mode, enabled in modes.items() if enabled) if isinstance(modes, dict) else []
+        }
+
+    return dict(sorted(result.items(), key=lambda entry: int(entry[0])))
+
+
+def diff_items(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Describe added, removed and changed items between two haste tables."""
+    lines = []
+    for item_id in sorted(set(old) | set(new), key=int):
+        before = old.get(item_id)
+        after = new.get(item_id)
+        if before is None:
+            lines.append(f"+ {item_id} {after['name']}: " + ", ".join(f"{field}={after[field]}" for field in HASTE_FIELDS))
+        elif after is None:
+            lines.append(f"- {item_id} {before.get('name', '')}")
+        else:
+            # Tables compiled before modes were recorded have none; that alone is not a change.
+            fields = ("name",) + HASTE_FIELDS + (("modes",) if "modes" in before else ())
+            changes = [
+                f"{field} {before.get(field)} -> {after.get(field)}"
+                for field in fields
+                if before.get(field) != after.get(field)
+            ]
+            if changes:
+                lines.append(f"~ {item_id} {after['name']}: " + "; ".join(changes))
+    return lines
+
+
+def _source_stamp(dump_path: str) -> str:
+    with open(dump_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return f"{digest} v{COMPILER_VERSION}"
+
+
+def _format_items(items: Dict[str, Dict[str, Any]]) -> str:
+    lines = [f"  {json.dumps(item_id)}: {json.dumps(item, ensure_ascii=False)}" for item_id, item in items.items()]
+    return "{\n" + ",\n".join(lines) + "\n}\n"
+
+
+def compile_items(dump_path: str = ITEM_DATA_DUMP_PATH, output_path: str = ITEMS_HASTE_OUTPUT_PATH,
+                  stamp_path: str = ITEMS_HASTE_STAMP_PATH, force: bool = False, dry_run: bool = False) -> Tuple[bool, List[str]]:
+    """
+    Regenerate the item haste table from the wiki dump if the dump changed.
+
+    Args:
+        dump_path: Path of the Lua item data dump
+        output_path: Path of the generated items_haste.json
+        stamp_path: Path of the stamp file recording the compiled dump hash
+        force: Recompile even if the stamp matches
+        dry_run: Report the diff without writing anything
+
+    Returns:
+        Tuple of (whether the output was or would be rewritten, diff lines)
+    """
+    stamp = _source_stamp(dump_path)
+    if not force and os.path.exists(output_path) and os.path.exists(stamp_path):
+        with open(stamp_path, 'r', encoding='utf-8') as f:
+            if f.read().strip() == stamp:
+                return False, []
+
+    with open(dump_path, 'r', encoding='utf-8') as f:
+        parsed = LuaTableParser(f.read()).parse()
+    if not isinstance(parsed, dict):
+        raise LuaParseError("item data dump does not contain a keyed table")
+
+    new_items = extract_item_haste(parsed)
+
+    old_items = {}
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            old_items = json.load(f)
+
+    changes = diff_items(old_items, new_items)
+    if dry_run:
+        return bool(changes), changes
+
+    if changes or not os.path.exists(output_path):
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(_format_items(new_items))
+        os.replace(tmp_path, output_path)
+
+    with open(stamp_path, 'w', encoding='utf-8') as f:
+        f.write(stamp + "\n")
+
+    return bool(changes), changes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate items_haste.json from the wiki item data dump.")
+    parser.add_argument("--force", action="store_true", help="recompile even if the dump is unchanged")
+    parser.add_argument("--dry-run", action="store_true", help="report the diff without writing files")
+    parser.add_argument("--bundle", action="store_true", help="also recompile the binary game data bundle")
+    args = parser.parse_args(argv)
+
+    try:
+        changed, changes = compile_items(force=args.force, dry_run=args.dry_run)
+    except (OSError, LuaParseError, json.JSONDecodeError) as e:
+        print(f"Error compiling item data: {e}")
+        return 1
+
+    for line in changes:
+        print(line)
+
+    if args.dry_run:
+        print(f"{len(changes)} item change(s) pending")
+    elif changed:
+        print(f"✓ Updated {ITEMS_HASTE_OUTPUT_PATH} ({len(changes)} item change(s))")
+    else:
+        print("Item data is up to date")
+
+    if args.bundle and not args.dry_run:
+        from game_data_bundle import compile_bundle, GAME_DATA_BUNDLE_PATH
+        size = compile_bundle()
+        print(f"✓ Compiled {GAME_DATA_BUNDLE_PATH} ({size} bytes)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Lazy module imports for the overlay application.
+
+This module provides a proxy that defers importing a module until one of
+its attributes is first used, so heavy optional stacks (audio, tray, HTTP)
+stay off the startup path until their feature is needed.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Callable, Optional
+
+
+class LazyModule:
+    """
+    Proxy that imports the named module on first attribute access.
+
+    An optional `on_import` hook runs once with the real module, which is
+    useful for one-time configuration such as silencing warnings.
+    """
+
+    def __init__(self, name: str, on_import: Optional[Callable[[ModuleType], None]] = None):
+        self.__dict__["_name"] = name
+        self.__dict__["_on_import"] = on_import
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is not None:
+            return module
+
+        with self.__dict__["_lock"]:
+            module = self.__dict__["_module"]
+            if module is None:
+                module = importlib.import_module(self.__dict__["_name"])
+                on_import = self.__dict__["_on_import"]
+                if on_import:
+                    on_import(module)
+                self.__dict__["_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name: str, on_import: Optional[Callable[[ModuleType], None]] = None) -> LazyModule:
+    """
+    Create a proxy for a module that is imported on first use.
+
+    Args:
+        name: Fully qualified module name, e.g. "PIL.ImageDraw"
+        on_import: Optional hook called once with the imported module
+
+    Returns:
+        Proxy forwarding attribute access to the module
+    """
+    return LazyModule(name, on_import)
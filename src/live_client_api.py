@@ -5,11 +5,21 @@ This module provides access to the League of Legends Live Client Data API
 which runs locally during active games at https://127.0.0.1:2999.
 """
 
-import requests
-import urllib3
+import threading
+import time
 from typing import Optional, Dict, List, Any
+from lazy_import import lazy_import
+from config import LIVE_CLIENT_CONNECT_TIMEOUT, LIVE_CLIENT_READ_TIMEOUT, LIVE_CLIENT_GAMESTATS_READ_TIMEOUT
+import metrics
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# The HTTP stack is only needed once auto-load starts polling.
+requests = lazy_import("requests")
+urllib3 = lazy_import("urllib3")
+
+REQUESTS = metrics.counter("live_client_requests_total", "Live Client API requests", ("endpoint",))
+FAILURES = metrics.counter("live_client_failures_total", "Live Client API requests that failed or returned an error status", ("endpoint",))
+LATENCY = metrics.histogram("live_client_request_seconds", "Live Client API request latency", ("endpoint",))
+RESPONSE_BYTES = metrics.counter("live_client_response_bytes_total", "Bytes received from the Live Client API", ("endpoint",))
 
 
 class LiveClientAPI:
@@ -17,55 +27,82 @@ class LiveClientAPI:
     Interface to League of Legends Live Client Data API.
 
     Provides methods to query game state and player information during
-    an active League of Legends match.
+    an active League of Legends match. Every helper can either fetch a fresh
+    `allgamedata` snapshot or read from one passed in, so a poll needs only
+    one request. After cancel(), new requests return immediately without
+    data; a request already in flight is not interrupted and ends within its
+    read timeout.
     """
 
     BASE_URL = "https://127.0.0.1:2999/liveclientdata"
 
-    def __init__(self):
+    def __init__(self, connect_timeout: float = LIVE_CLIENT_CONNECT_TIMEOUT, read_timeout: float = LIVE_CLIENT_READ_TIMEOUT,
+                 gamestats_read_timeout: float = LIVE_CLIENT_GAMESTATS_READ_TIMEOUT):
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         self.session = requests.Session()
         self.session.verify = False
+        self.timeout = (connect_timeout, read_timeout)
+        self.gamestats_timeout = (connect_timeout, gamestats_read_timeout)
+        self._cancelled = threading.Event()
 
-    def is_game_active(self) -> bool:
+    def cancel(self):
+        """Make future requests return None at once; a request already reading runs to its timeout."""
+        self._cancelled.set()
+        self.session.close()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _get(self, endpoint: str, timeout=None):
+        if self._cancelled.is_set():
+            return None
+        REQUESTS.labels(endpoint).inc()
+        start = time.perf_counter()
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/gamestats",
-                timeout=2
-            )
-            return response.status_code == 200
-        except (requests.exceptions.RequestException, Exception):
-            return False
+            response = self.session.get(f"{self.BASE_URL}/{endpoint}", timeout=timeout or self.timeout)
+        except (requests.exceptions.RequestException, ValueError):
+            FAILURES.labels(endpoint).inc()
+            return None
+        finally:
+            LATENCY.labels(endpoint).observe(time.perf_counter() - start)
+        RESPONSE_BYTES.labels(endpoint).inc(len(response.content))
+        if response.status_code != 200:
+            FAILURES.labels(endpoint).inc()
+        return response
+
+    def is_game_active(self) -> bool:
+        response = self._get("gamestats", self.gamestats_timeout)
+        return response is not None and response.status_code == 200
 
     def get_all_game_data(self) -> Optional[Dict[str, Any]]:
-        try:
-            response = self.session.get(
-                f"{self.BASE_URL}/allgamedata",
-                timeout=3
-            )
-            if response.status_code == 200:
-                return response.json()
+        response = self._get("allgamedata")
+        if response is None or response.status_code != 200:
             return None
-        except (requests.exceptions.RequestException, Exception):
+        try:
+            return response.json()
+        except ValueError:
             return None
 
-    def get_all_players(self) -> Optional[List[Dict[str, Any]]]:
-        data = self.get_all_game_data()
+    def get_all_players(self, data: Optional[Dict[str, Any]] = None) -> Optional[List[Dict[str, Any]]]:
+        data = data if data is not None else self.get_all_game_data()
         if data and "allPlayers" in data:
             return data["allPlayers"]
         return None
 
-    def get_active_player(self) -> Optional[Dict[str, Any]]:
-        data = self.get_all_game_data()
+    def get_active_player(self, data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        data = data if data is not None else self.get_all_game_data()
         if data and "activePlayer" in data:
             return data["activePlayer"]
         return None
 
-    def get_player_team(self) -> Optional[str]:
-        players = self.get_all_players()
+    def get_player_team(self, data: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        data = data if data is not None else self.get_all_game_data()
+        players = self.get_all_players(data)
         if not players:
             return None
 
-        active_player_data = self.get_active_player()
+        active_player_data = self.get_active_player(data)
         if not active_player_data:
             return None
 
@@ -79,12 +116,13 @@ class LiveClientAPI:
 
         return None
 
-    def get_enemy_team(self) -> List[Dict[str, Any]]:
-        players = self.get_all_players()
+    def get_enemy_team(self, data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        data = data if data is not None else self.get_all_game_data()
+        players = self.get_all_players(data)
         if not players:
             return []
 
-        player_team = self.get_player_team()
+        player_team = self.get_player_team(data)
         if not player_team:
             return []
 
@@ -95,12 +133,13 @@ class LiveClientAPI:
 
         return enemy_team
 
-    def get_own_player(self) -> List[Dict[str, Any]]:
-        players = self.get_all_players()
+    def get_own_player(self, data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        data = data if data is not None else self.get_all_game_data()
+        players = self.get_all_players(data)
         if not players:
             return []
 
-        active_player_data = self.get_active_player()
+        active_player_data = self.get_active_player(data)
         if not active_player_data:
             return []
 
@@ -115,8 +154,8 @@ class LiveClientAPI:
 
         return own_player
 
-    def get_player_stats(self, summoner_name: str) -> Optional[Dict[str, Any]]:
-        data = self.get_all_game_data()
+    def get_player_stats(self, summoner_name: str, data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        data = data if data is not None else self.get_all_game_data()
         if not data:
             return None
 
@@ -128,8 +167,8 @@ class LiveClientAPI:
 
         return None
 
-    def get_player_items(self, summoner_name: str) -> List[int]:
-        data = self.get_all_game_data()
+    def get_player_items(self, summoner_name: str, data: Optional[Dict[str, Any]] = None) -> List[int]:
+        data = data if data is not None else self.get_all_game_data()
         if not data or "allPlayers" not in data:
             return []
 
@@ -140,8 +179,8 @@ class LiveClientAPI:
 
         return []
 
-    def get_player_runes(self, summoner_name: str) -> List[int]:
-        data = self.get_all_game_data()
+    def get_player_runes(self, summoner_name: str, data: Optional[Dict[str, Any]] = None) -> List[int]:
+        data = data if data is not None else self.get_all_game_data()
         if not data:
             return []
 
@@ -0,0 +1,153 @@
+"""
+Memory footprint tools for the overlay application.
+
+MemoryProfile takes tracemalloc snapshots at labelled points of a session
+(startup, in game, after the game ended) and reports where the live memory
+was allocated, by source line and by module, together with what changed
+since the previous snapshot.
+
+apply_low_memory() switches the in-memory caches and diagnostics buffers to
+the smaller low-memory limits (or back), and release_idle_memory() drops
+data that is only needed during a game, for the `low_memory` setting.
+"""
+
+import json
+import linecache
+import os
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional
+from config import (MEMORY_PROFILE_FRAMES, MEMORY_PROFILE_TOP, ITEM_TOTALS_CACHE_SIZE, LOG_BUFFER_SIZE, TRACE_BUFFER_SIZE,
+                    FRAME_STATS_HISTORY, LOW_MEMORY_ITEM_TOTALS_CACHE_SIZE, LOW_MEMORY_LOG_BUFFER_SIZE,
+                    LOW_MEMORY_TRACE_BUFFER_SIZE, LOW_MEMORY_FRAME_STATS_HISTORY)
+import app_logging
+import haste_calculator
+import tracing
+
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+# Allocations of the measurement itself and of the import machinery.
+_IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>")
+
+
+def module_name(filename: str) -> str:
+    """Short module name for a source file: 'overlay', 'PIL', 'json', ..."""
+    path = os.path.abspath(filename)
+    if path.startswith(SRC_DIR + os.sep):
+        return os.path.splitext(os.path.relpath(path, SRC_DIR))[0].replace(os.sep, ".")
+    parts = path.replace("\\", "/").split("/")
+    if "site-packages" in parts:
+        index = parts.index("site-packages")
+        if index + 1 < len(parts):
+            return os.path.splitext(parts[index + 1])[0]
+    if filename.startswith("<"):
+        return filename
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+class MemoryProfile:
+    """Labelled tracemalloc snapshots and a report of what they hold."""
+
+    def __init__(self, frames: int = MEMORY_PROFILE_FRAMES, top: int = MEMORY_PROFILE_TOP):
+        self.frames = frames
+        self.top = top
+        self.snapshots: List[tuple] = []
+
+    @property
+    def running(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def take(self, label: str):
+        """Snapshot the live allocations now."""
+        if tracemalloc.is_tracing():
+            self.snapshots.append((label, tracemalloc.take_snapshot()))
+
+    @staticmethod
+    def _statistics(stats) -> list:
+        # Filtering the statistics is much cheaper than Snapshot.filter_traces(),
+        # which matches every trace in Python.
+        return [stat for stat in stats if stat.traceback[0].filename not in _IGNORED_FILES]
+
+    def _summarize(self, snapshot, previous=None) -> Dict[str, Any]:
+        line_stats = self._statistics(snapshot.statistics("lineno"))
+        by_module: Dict[str, List[int]] = {}
+        for stat in self._statistics(snapshot.statistics("filename")):
+            totals = by_module.setdefault(module_name(stat.traceback[0].filename), [0, 0])
+            totals[0] += stat.size
+            totals[1] += stat.count
+
+        summary = {
+            "total_bytes": sum(stat.size for stat in line_stats),
+            "blocks": sum(stat.count for stat in line_stats),
+            "top_lines": [self._line_entry(stat.traceback[0], stat.size, stat.count) for stat in line_stats[:self.top]],
+            "top_modules": [{"module": name, "bytes": size, "blocks": count}
+                            for name, (size, count) in sorted(by_module.items(), key=lambda item: -item[1][0])[:self.top]]
+        }
+        if previous is not None:
+            diff = self._statistics(snapshot.compare_to(previous, "lineno"))
+            diff.sort(key=lambda stat: -abs(stat.size_diff))
+            summary["changed_lines"] = [self._line_entry(stat.traceback[0], stat.size_diff, stat.count_diff)
+                                        for stat in diff[:self.top] if stat.size_diff]
+        return summary
+
+    @staticmethod
+    def _line_entry(frame, size: int, count: int) -> Dict[str, Any]:
+        return {
+            "module": module_name(frame.filename),
+            "line": frame.lineno,
+            "code": linecache.getline(frame.filename, frame.lineno).strip(),
+            "bytes": size,
+            "blocks": count
+        }
+
+    def report(self) -> Dict[str, Any]:
+        phases = []
+        previous = None
+        for label, snapshot in self.snapshots:
+            phase = {"label": label}
+            phase.update(self._summarize(snapshot, previous))
+            phases.append(phase)
+            previous = snapshot
+        return {"frames": self.frames, "phases": phases}
+
+    def format_report(self, report: Optional[Dict[str, Any]] = None, lines_per_phase: int = 8) -> str:
+        report = report or self.report()
+        out = []
+        for phase in report["phases"]:
+            out.append(f"{phase['label']}: {phase['total_bytes'] / 1024:.0f} KiB in {phase['blocks']} blocks")
+            modules = ", ".join(f"{entry['module']} {entry['bytes'] / 1024:.0f} KiB" for entry in phase["top_modules"][:5])
+            out.append(f"  modules: {modules}")
+            for entry in phase.get("changed_lines", [])[:lines_per_phase]:
+                out.append(f"  {entry['bytes'] / 1024:+9.1f} KiB  {entry['module']}:{entry['line']}  {entry['code'][:60]}")
+        return "\n".join(out)
+
+    def write(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def apply_low_memory(enabled: bool, frame_stats=None):
+    """Switch caches and diagnostics buffers between the normal and low-memory limits."""
+    haste_calculator.set_item_totals_cache_size(LOW_MEMORY_ITEM_TOTALS_CACHE_SIZE if enabled else ITEM_TOTALS_CACHE_SIZE)
+    app_logging.set_buffer_size(LOW_MEMORY_LOG_BUFFER_SIZE if enabled else LOG_BUFFER_SIZE)
+    tracing.set_buffer_size(LOW_MEMORY_TRACE_BUFFER_SIZE if enabled else TRACE_BUFFER_SIZE)
+    if frame_stats is not None:
+        frame_stats.set_history_size(LOW_MEMORY_FRAME_STATS_HISTORY if enabled else FRAME_STATS_HISTORY)
+
+
+def release_idle_memory(alert_engine=None, keep_cues: Iterable[str] = ()):
+    """
+    Drop data only needed during a game: the decoded item haste table and
+    the voice cues of champions and spells that are no longer on a slot.
+    Both are loaded again on demand.
+    """
+    haste_calculator.release_items_data()
+    if alert_engine is not None:
+        alert_engine.release_voice_cues(keep_cues)
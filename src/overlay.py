@@ -6,20 +6,48 @@ ultimate cooldowns in League of Legends matches.
 """
 
 import tkinter as tk
-from PIL import Image, ImageTk, ImageDraw, ImageFont, ImageEnhance
+import argparse
 import os
-import pygame
+import time
 import random
 import threading
-import pystray
-from pystray import MenuItem as item
 
+from lazy_import import lazy_import
 from config import *
 from config import get_resource_path
-from champion_data import champion_data, summoner_spell_data
+from champion_data import champion_data, summoner_spell_data, load_game_data_async
 from timer import TimerManager
-from settings import load_settings, save_settings
+from clock import TkClock
+from settings import SettingsStore
 from auto_loader import GameAutoLoader
+from data_watcher import GameDataWatcher
+from alert_audio import AlertEngine
+from ui_dispatch import UIDispatcher
+from stall_detector import StallDetector
+from frame_stats import FrameStats
+from quality_governor import QualityGovernor, QUALITY_TIERS
+from sampling_profiler import SamplingProfiler
+from slot_renderer import format_remaining, load_icon, render_champion, render_summoner_spell
+from settings import get_settings_path
+from resources import open_resource, resource_exists
+from app_logging import get_logger, setup_logging, get_log_lines, format_suppressed
+import memory_footprint
+import metrics
+import startup_timing
+import tracing
+
+# Heavy stacks are imported on first use so they stay off the first-paint path.
+Image = lazy_import("PIL.Image")
+ImageTk = lazy_import("PIL.ImageTk")
+ImageDraw = lazy_import("PIL.ImageDraw")
+pystray = lazy_import("pystray")
+
+logger = get_logger("overlay")
+
+FRAMES_RENDERED = metrics.counter("overlay_frames_rendered_total", "Timer update frames rendered")
+FRAME_SECONDS = metrics.histogram("overlay_frame_seconds", "Time spent rendering one timer update frame")
+RENDER_CACHE_HITS = metrics.counter("overlay_render_cache_hits_total", "Slot redraws skipped because the displayed state was unchanged")
+RENDER_CACHE_MISSES = metrics.counter("overlay_render_cache_misses_total", "Slot redraws that rebuilt the slot image")
 
 
 def apply_ui_scale(scale, slot_spacing=None):
@@ -116,6 +144,7 @@ class SummonerSpellSlot(tk.Frame):
         self.on_double_click_callback = None
         self.timer_was_used = False
         self.summoner_haste = 0
+        self._render_key = None
 
         self.canvas = tk.Canvas(
             self,
@@ -137,6 +166,7 @@ class SummonerSpellSlot(tk.Frame):
         self.base_image = None
         self.photo_image = None
         self.timer_was_used = False
+        self._render_key = None
 
         if self.canvas_image_id:
             self.canvas.delete(self.canvas_image_id)
@@ -154,12 +184,13 @@ class SummonerSpellSlot(tk.Frame):
         self.summoner_haste = summoner_haste
 
         icon_path = summoner_spell_data.get_icon_path(spell_name)
-        if icon_path and os.path.exists(icon_path):
+        if icon_path:
             try:
-                img = Image.open(icon_path).convert("RGBA")
-                img = img.resize((SUMMONER_SPELL_SIZE, SUMMONER_SPELL_SIZE), Image.Resampling.LANCZOS)
+                img = load_icon(icon_path, SUMMONER_SPELL_SIZE, stats=self.app.frame_stats)
                 self.base_image = img
                 self.photo_image = ImageTk.PhotoImage(img)
+                self._render_key = None
+                self.app.frame_stats.count_photo_image()
 
                 if self.canvas_image_id:
                     self.canvas.delete(self.canvas_image_id)
@@ -170,7 +201,7 @@ class SummonerSpellSlot(tk.Frame):
 
                 self.canvas.config(highlightthickness=0)
             except Exception as e:
-                print(f"Error loading icon for {spell_name}: {e}")
+                logger.error("Error loading icon for %s: %s", spell_name, e, extra={"key": spell_name})
 
         cooldown = summoner_spell_data.get_cooldown(spell_name)
         if cooldown:
@@ -186,45 +217,21 @@ class SummonerSpellSlot(tk.Frame):
 
         self._update_border(timer)
 
-        img = self.base_image.copy()
-
-        if not timer.is_ready():
-            overlay = Image.new('RGBA', img.size, (0, 0, 0, 150))
-            img = Image.alpha_composite(img, overlay)
-
-            draw = ImageDraw.Draw(img)
-
-            remaining = timer.get_remaining_time()
-            if remaining >= 60:
-                minutes = int(remaining // 60)
-                seconds = int(remaining % 60)
-                text = f"{minutes}:{seconds:02d}"
-            else:
-                text = f"{int(remaining)}"
-
-            try:
-                font = ImageFont.truetype("arial.ttf", 12)
-            except:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 12)
-                except:
-                    font = ImageFont.load_default()
-
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            x = (SUMMONER_SPELL_SIZE - text_width) // 2
-            y = (SUMMONER_SPELL_SIZE - text_height) // 2
-
-            outline_color = TIMER_OUTLINE_COLOR
-            for adj_x in [-1, 0, 1]:
-                for adj_y in [-1, 0, 1]:
-                    draw.text((x + adj_x, y + adj_y), text, font=font, fill=outline_color)
-
-            draw.text((x, y), text, font=font, fill=COOLDOWN_COLOR)
+        quality = self.app.quality_governor.tier
+        if timer.is_ready():
+            text = None
+        else:
+            text = format_remaining(timer.get_remaining_time()) if quality.summoner_text else ""
+        render_key = (id(self.base_image), text, quality.outline_text, quality.dimming)
+        if render_key == self._render_key:
+            RENDER_CACHE_HITS.inc()
+            return
+        self._render_key = render_key
+        RENDER_CACHE_MISSES.inc()
 
+        img = render_summoner_spell(self.base_image, text, stats=self.app.frame_stats, outline=quality.outline_text, dim=quality.dimming)
         self.photo_image = ImageTk.PhotoImage(img)
+        self.app.frame_stats.count_photo_image()
         if self.canvas_image_id:
             self.canvas.itemconfig(self.canvas_image_id, image=self.photo_image)
 
@@ -283,6 +290,7 @@ class ChampionSlot(tk.Frame):
         self.ult_available = True
         self.ability_haste = 0
         self.ultimate_haste = 0
+        self._render_key = None
 
         self._create_widgets()
 
@@ -357,6 +365,7 @@ class ChampionSlot(tk.Frame):
         self.photo_image = None
         self.timer_was_used = False
         self.ult_available = True
+        self._render_key = None
 
         if self.canvas_image_id:
             self.canvas.delete(self.canvas_image_id)
@@ -382,12 +391,13 @@ class ChampionSlot(tk.Frame):
         self.champion = champion_name
 
         icon_path = champion_data.get_icon_path(champion_name)
-        if icon_path and os.path.exists(icon_path):
+        if icon_path:
             try:
-                img = Image.open(icon_path).convert("RGBA")
-                img = img.resize((ICON_SIZE, ICON_SIZE), Image.Resampling.LANCZOS)
+                img = load_icon(icon_path, ICON_SIZE, stats=self.app.frame_stats)
                 self.base_image = img
                 self.photo_image = ImageTk.PhotoImage(img)
+                self._render_key = None
+                self.app.frame_stats.count_photo_image()
 
                 if self.canvas_image_id:
                     self.canvas.delete(self.canvas_image_id)
@@ -398,11 +408,11 @@ class ChampionSlot(tk.Frame):
 
                 self.canvas.config(highlightthickness=0)
             except Exception as e:
-                print(f"Error loading icon for {champion_name}: {e}")
+                logger.error("Error loading icon for %s: %s", champion_name, e, extra={"key": champion_name})
 
         cooldowns = champion_data.get_all_cooldowns(champion_name)
         if cooldowns:
-            self.timer_manager.create_timer(self.slot_id, champion_name, cooldowns, on_ready_callback=self.app._play_ready_sound, alert_threshold=self.app.sound_alert_threshold, ability_haste=self.ability_haste, ultimate_haste=self.ultimate_haste)
+            self.timer_manager.create_timer(self.slot_id, champion_name, cooldowns, alert_threshold=self.app.sound_alert_threshold, ability_haste=self.ability_haste, ultimate_haste=self.ultimate_haste)
 
         self._update_level_display()
 
@@ -416,51 +426,19 @@ class ChampionSlot(tk.Frame):
 
         self._update_border(timer)
 
-        img = self.base_image.copy()
-
-        if not self.ult_available:
-            enhancer = ImageEnhance.Color(img)
-            img = enhancer.enhance(0.2)
-            overlay = Image.new('RGBA', img.size, (0, 0, 0, 180))
-            img = Image.alpha_composite(img, overlay)
-
-        if not timer.is_ready():
-            overlay = Image.new('RGBA', img.size, (0, 0, 0, 150))
-            img = Image.alpha_composite(img, overlay)
-
-            draw = ImageDraw.Draw(img)
-
-            remaining = timer.get_remaining_time()
-            if remaining >= 60:
-                minutes = int(remaining // 60)
-                seconds = int(remaining % 60)
-                text = f"{minutes}:{seconds:02d}"
-            else:
-                text = f"{int(remaining)}"
-
-            try:
-                font = ImageFont.truetype("arial.ttf", 24)
-            except:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-                except:
-                    font = ImageFont.load_default()
-
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            x = (ICON_SIZE - text_width) // 2
-            y = (ICON_SIZE - text_height) // 2
-
-            outline_color = TIMER_OUTLINE_COLOR
-            for adj_x in [-1, 0, 1]:
-                for adj_y in [-1, 0, 1]:
-                    draw.text((x + adj_x, y + adj_y), text, font=font, fill=outline_color)
-
-            draw.text((x, y), text, font=font, fill=COOLDOWN_COLOR)
+        quality = self.app.quality_governor.tier
+        text = None if timer.is_ready() else format_remaining(timer.get_remaining_time())
+        render_key = (id(self.base_image), self.ult_available, text, quality.outline_text, quality.dimming)
+        if render_key == self._render_key:
+            RENDER_CACHE_HITS.inc()
+            return
+        self._render_key = render_key
+        RENDER_CACHE_MISSES.inc()
 
+        img = render_champion(self.base_image, text, self.ult_available, stats=self.app.frame_stats,
+                              outline=quality.outline_text, dim=quality.dimming)
         self.photo_image = ImageTk.PhotoImage(img)
+        self.app.frame_stats.count_photo_image()
         if self.canvas_image_id:
             self.canvas.itemconfig(self.canvas_image_id, image=self.photo_image)
 
@@ -524,8 +502,11 @@ class ChampionSlot(tk.Frame):
             self.on_double_click_callback(self.slot_id)
 
     def update_summoner_spell_displays(self):
+        frame_stats = self.app.frame_stats
         for spell_slot in self.summoner_spell_slots.values():
+            start = time.perf_counter()
             spell_slot.update_timer_display()
+            frame_stats.record("summoner_slot", time.perf_counter() - start)
 
     def _update_border(self, timer):
         if not self.ult_available:
@@ -822,7 +803,7 @@ class SettingsDialog(tk.Toplevel):
         self.app = app
 
         self.title("Settings")
-        self.geometry("320x600")
+        self.geometry("320x700")
         self.attributes("-topmost", True)
         self.resizable(False, False)
         self.configure(bg=OVERLAY_BG_COLOR)
@@ -838,10 +819,12 @@ class SettingsDialog(tk.Toplevel):
         self.auto_load_enabled_var = tk.BooleanVar(value=self.app.auto_load_enabled)
         self.show_champion_names_var = tk.BooleanVar(value=self.app.show_champion_names)
         self.gray_low_level_icons_var = tk.BooleanVar(value=self.app.gray_low_level_icons)
+        self.low_memory_var = tk.BooleanVar(value=self.app.low_memory)
         self.current_volume = int(self.app.sound_volume * 100)
         self.current_alert_threshold = int(self.app.sound_alert_threshold)
         self.current_ui_scale = self.app.ui_scale
         self.current_slot_spacing = int(self.app.slot_spacing)
+        self.current_quality_override = self.app.quality_governor.override
 
         main_frame = tk.Frame(self, bg=OVERLAY_BG_COLOR, padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -910,7 +893,20 @@ class SettingsDialog(tk.Toplevel):
             activeforeground=NAME_COLOR,
             font=("Arial", 10)
         )
-        gray_low_level_check.pack(anchor=tk.W, pady=(0, 15))
+        gray_low_level_check.pack(anchor=tk.W, pady=(0, 10))
+
+        low_memory_check = tk.Checkbutton(
+            main_frame,
+            text="Low memory mode",
+            variable=self.low_memory_var,
+            bg=OVERLAY_BG_COLOR,
+            fg=NAME_COLOR,
+            selectcolor=OVERLAY_BG_COLOR,
+            activebackground=OVERLAY_BG_COLOR,
+            activeforeground=NAME_COLOR,
+            font=("Arial", 10)
+        )
+        low_memory_check.pack(anchor=tk.W, pady=(0, 15))
 
         volume_frame = tk.Frame(main_frame, bg=OVERLAY_BG_COLOR)
         volume_frame.pack(fill=tk.X, pady=(0, 5))
@@ -1126,6 +1122,73 @@ class SettingsDialog(tk.Toplevel):
             width=3
         ).pack(side=tk.LEFT)
 
+        quality_frame = tk.Frame(main_frame, bg=OVERLAY_BG_COLOR)
+        quality_frame.pack(fill=tk.X, pady=(0, 5))
+
+        tk.Label(
+            quality_frame,
+            text="Render Quality:",
+            bg=OVERLAY_BG_COLOR,
+            fg=NAME_COLOR,
+            font=("Arial", 10)
+        ).pack(side=tk.LEFT)
+
+        self.quality_label = tk.Label(
+            quality_frame,
+            width=20,
+            anchor=tk.E,
+            bg=OVERLAY_BG_COLOR,
+            fg=NAME_COLOR,
+            font=("Arial", 10)
+        )
+        self.quality_label.pack(side=tk.RIGHT)
+        self.update_quality_label()
+
+        quality_buttons_frame = tk.Frame(main_frame, bg=OVERLAY_BG_COLOR)
+        quality_buttons_frame.pack(fill=tk.X, pady=(0, 20))
+
+        tk.Button(
+            quality_buttons_frame,
+            text="−",
+            command=self._decrease_quality,
+            bg="#2a2a2a",
+            fg=NAME_COLOR,
+            activebackground="#3a3a3a",
+            activeforeground=NAME_COLOR,
+            relief=tk.FLAT,
+            font=("Arial", 12),
+            cursor="hand2",
+            width=3
+        ).pack(side=tk.LEFT, padx=(0, 5))
+
+        tk.Button(
+            quality_buttons_frame,
+            text="Auto",
+            command=self._auto_quality,
+            bg="#2a2a2a",
+            fg=NAME_COLOR,
+            activebackground="#3a3a3a",
+            activeforeground=NAME_COLOR,
+            relief=tk.FLAT,
+            font=("Arial", 10),
+            cursor="hand2",
+            width=10
+        ).pack(side=tk.LEFT, padx=(0, 5))
+
+        tk.Button(
+            quality_buttons_frame,
+            text="+",
+            command=self._increase_quality,
+            bg="#2a2a2a",
+            fg=NAME_COLOR,
+            activebackground="#3a3a3a",
+            activeforeground=NAME_COLOR,
+            relief=tk.FLAT,
+            font=("Arial", 12),
+            cursor="hand2",
+            width=3
+        ).pack(side=tk.LEFT)
+
         btn_frame = tk.Frame(main_frame, bg=OVERLAY_BG_COLOR)
         btn_frame.pack(fill=tk.X)
 
@@ -1179,10 +1242,7 @@ class SettingsDialog(tk.Toplevel):
         self.alert_label.config(text=f"{self.current_alert_threshold}s")
 
     def _test_sound(self):
-        if self.app.ready_sound:
-            volume = self.current_volume / 100.0
-            self.app.ready_sound.set_volume(volume)
-            self.app.ready_sound.play()
+        self.app.alert_engine.play_now(self.current_volume / 100.0)
 
     def _decrease_scale(self):
         new_scale = round(self.current_ui_scale - UI_SCALE_STEP, 1)
@@ -1247,6 +1307,30 @@ class SettingsDialog(tk.Toplevel):
             self.app._apply_scale_change()
             self.app.root.after(50, lambda: self.app._open_settings((x, y)))
 
+    def update_quality_label(self):
+        if self.current_quality_override is None:
+            text = f"Auto: {self.app.quality_governor.tier.name}"
+        else:
+            text = f"{QUALITY_TIERS[self.current_quality_override].name} (fixed)"
+        self.quality_label.config(text=text)
+
+    def _current_quality_level(self):
+        if self.current_quality_override is None:
+            return self.app.quality_governor.tier.level
+        return self.current_quality_override
+
+    def _decrease_quality(self):
+        self.current_quality_override = min(len(QUALITY_TIERS) - 1, self._current_quality_level() + 1)
+        self.update_quality_label()
+
+    def _increase_quality(self):
+        self.current_quality_override = max(0, self._current_quality_level() - 1)
+        self.update_quality_label()
+
+    def _auto_quality(self):
+        self.current_quality_override = None
+        self.update_quality_label()
+
     def _on_close(self):
         self.app.settings_dialog = None
         self.destroy()
@@ -1269,13 +1353,17 @@ class SettingsDialog(tk.Toplevel):
 
         self.app.gray_low_level_icons = self.gray_low_level_icons_var.get()
 
-        if self.app.ready_sound:
-            self.app.ready_sound.set_volume(self.app.sound_volume)
+        if self.app.quality_governor.override != self.current_quality_override:
+            self.app.quality_governor.set_override(self.current_quality_override)
+            self.app._on_quality_changed()
 
-        for timer in self.app.timer_manager.timers.values():
-            if timer:
-                timer.alert_threshold = self.app.sound_alert_threshold
-                timer.sound_played = False
+        if self.app.low_memory != self.low_memory_var.get():
+            self.app.low_memory = self.low_memory_var.get()
+            self.app._apply_low_memory()
+
+        self.app.alert_engine.set_volume(self.app.sound_volume)
+        self.app.alert_engine.set_enabled(self.app.sound_enabled)
+        self.app.timer_manager.set_alert_threshold(self.app.sound_alert_threshold)
 
         if icon_type_changed:
             champion_data.set_icon_type(self.app.use_champion_icons)
@@ -1288,7 +1376,7 @@ class SettingsDialog(tk.Toplevel):
                 self.app._setup_auto_loader()
             else:
                 if self.app.auto_loader:
-                    self.app.auto_loader.stop()
+                    self.app.auto_loader.stop_async()
                     self.app.auto_loader = None
                 self.app.game_connected = False
 
@@ -1296,17 +1384,82 @@ class SettingsDialog(tk.Toplevel):
             for slot in self.app.slots.values():
                 slot._update_level_display()
 
-        save_settings(LAYOUT, sound_enabled=self.app.sound_enabled, sound_volume=self.app.sound_volume, sound_alert_threshold=self.app.sound_alert_threshold, ui_scale=self.app.ui_scale, use_champion_icons=self.app.use_champion_icons, auto_load_enabled=self.app.auto_load_enabled, show_champion_names=self.app.show_champion_names, gray_low_level_icons=self.app.gray_low_level_icons, slot_spacing=self.app.slot_spacing)
+        self.app._update_frame_stats_context()
+
+        self.app.settings_store.update(sound_enabled=self.app.sound_enabled, sound_volume=self.app.sound_volume, sound_alert_threshold=self.app.sound_alert_threshold, ui_scale=self.app.ui_scale, use_champion_icons=self.app.use_champion_icons, auto_load_enabled=self.app.auto_load_enabled, show_champion_names=self.app.show_champion_names, gray_low_level_icons=self.app.gray_low_level_icons, slot_spacing=self.app.slot_spacing, low_memory=self.app.low_memory, quality_override=self.app.quality_governor.override)
         self.app.settings_dialog = None
         self.destroy()
 
 
+class ReportViewer(tk.Toplevel):
+    """Read-only text window for diagnostics such as the log buffer or stall report."""
+
+    def __init__(self, parent, title, get_text, cleanup_callback=None):
+        super().__init__(parent)
+        self.get_text = get_text
+        self.cleanup_callback = cleanup_callback
+
+        self.title(title)
+        self.geometry("640x360")
+        self.attributes("-topmost", True)
+        self.configure(bg=OVERLAY_BG_COLOR)
+
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        button_frame = tk.Frame(self, bg=OVERLAY_BG_COLOR)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+
+        tk.Button(
+            button_frame,
+            text="Refresh",
+            command=self._refresh,
+            bg="#27ae60",
+            fg="#ffffff",
+            activebackground="#2ecc71",
+            activeforeground="#ffffff",
+            relief=tk.FLAT,
+            font=("Arial", 10),
+            cursor="hand2"
+        ).pack(side=tk.RIGHT)
+
+        scrollbar = tk.Scrollbar(self)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.text = tk.Text(
+            self,
+            bg=OVERLAY_BG_COLOR,
+            fg=NAME_COLOR,
+            font=("Consolas", 9),
+            wrap=tk.NONE,
+            yscrollcommand=scrollbar.set
+        )
+        self.text.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.text.yview)
+
+        self._refresh()
+
+    def _refresh(self):
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, self.get_text())
+        self.text.config(state=tk.DISABLED)
+        self.text.see(tk.END)
+
+    def _on_close(self):
+        if self.cleanup_callback:
+            self.cleanup_callback()
+        self.destroy()
+
+
 class OverlayApp:
     """Main overlay application."""
 
-    def __init__(self):
-        self.root = tk.Tk()
+    def __init__(self, clock=None):
+        with startup_timing.phase("tk_root"):
+            self.root = tk.Tk()
         self.root.title("Spell Tracker")
+        # Timers, alerts, the auto-loader and the update loop share one clock.
+        self.clock = clock or TkClock(self.root)
 
         self.root.overrideredirect(True)
         self.root.attributes("-topmost", True)
@@ -1314,7 +1467,9 @@ class OverlayApp:
         self.root.configure(bg=OVERLAY_BG_COLOR)
         self.root.resizable(False, False)
 
-        settings = load_settings()
+        with startup_timing.phase("load_settings"):
+            self.settings_store = SettingsStore()
+            settings = self.settings_store.snapshot()
         global LAYOUT
         LAYOUT = settings.get("layout", LAYOUT)
 
@@ -1328,38 +1483,50 @@ class OverlayApp:
         self.auto_load_enabled = settings.get("auto_load_enabled", AUTO_LOAD_ENABLED)
         self.show_champion_names = settings.get("show_champion_names", SHOW_CHAMPION_NAMES)
         self.gray_low_level_icons = settings.get("gray_low_level_icons", GRAY_LOW_LEVEL_ICONS)
+        self.low_memory = settings.get("low_memory", LOW_MEMORY_MODE)
 
-        apply_ui_scale(self.ui_scale, self.slot_spacing)
+        with startup_timing.phase("apply_ui_scale"):
+            apply_ui_scale(self.ui_scale, self.slot_spacing)
         champion_data.set_icon_type(self.use_champion_icons)
 
-        pygame.mixer.init()
-        self.ready_sound = None
-        if os.path.exists(SOUND_FILE_PATH):
-            self.ready_sound = pygame.mixer.Sound(SOUND_FILE_PATH)
-            self.ready_sound.set_volume(self.sound_volume)
+        self.alert_engine = AlertEngine(SOUND_FILE_PATH, self.sound_volume, self.sound_enabled, clock=self.clock)
+        self.on_startup_complete = None
+        self._startup_reported = False
 
-        self.timer_manager = TimerManager()
+        self.timer_manager = TimerManager(alert_scheduler=self.alert_engine, clock=self.clock)
         self.timer_manager.register_update_callback(self._update_all_timers)
 
         self.slots = {}
+        self.frame_stats = FrameStats()
+        self.profiler = SamplingProfiler()
+        self.show_perf_hud = SHOW_PERF_HUD
+        self.frame_stats_export_requested = False
+        self._update_frame_stats_recording()
+        self.quality_governor = QualityGovernor(clock=self.clock)
+        self.quality_governor.set_override(settings.get("quality_override", QUALITY_OVERRIDE))
+        self._update_frame_stats_context()
+        self.memory_profile = None
+        self._games_seen = 0
+        if self.low_memory:
+            self._apply_low_memory()
 
         self.drag_start_x = 0
         self.drag_start_y = 0
 
         self.settings_dialog = None
+        self.report_viewers = {}
         self.champion_selector = None
         self.summoner_spell_selector = None
 
         self.tray_icon = None
-        self._setup_tray_icon()
-
         self.auto_loader = None
         self.game_connected = False
-        if self.auto_load_enabled:
-            self._setup_auto_loader()
+        self._traces_awaiting_render = []
+        self.dispatcher = UIDispatcher(self.root)
+        self.stall_detector = StallDetector(self.root) if STALL_DETECTOR_ENABLED else None
 
-        self._create_ui()
-        self._debug_populate_slots()
+        with startup_timing.phase("create_ui"):
+            self._create_ui()
         self._setup_drag_and_drop()
         self._start_update_loop()
 
@@ -1371,6 +1538,82 @@ class OverlayApp:
 
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+        self.game_data_ready = None
+        self.data_watcher = None
+        self._show_window_and_load_data()
+        self.root.after(0, self._init_subsystems)
+
+    def _show_window_and_load_data(self):
+        with startup_timing.phase("first_paint"):
+            self.root.update()
+        startup_timing.mark("first_paint")
+        self.dispatcher.start()
+        if self.stall_detector:
+            self.stall_detector.start()
+
+        self.game_data_ready = load_game_data_async()
+        self.game_data_ready.add_done_callback(self._on_game_data_ready)
+
+    def _init_subsystems(self):
+        """Start audio, tray and auto-load once the window is on screen."""
+        with startup_timing.phase("alert_engine_start"):
+            self.alert_engine.start()
+        with startup_timing.phase("tray_setup"):
+            self._setup_tray_icon()
+        if self.auto_load_enabled:
+            with startup_timing.phase("auto_loader_start"):
+                self._setup_auto_loader()
+        startup_timing.mark("subsystems_ready")
+        self._check_startup_complete()
+
+    def _check_startup_complete(self):
+        if self._startup_reported:
+            return
+        if startup_timing.elapsed_ms("subsystems_ready") is None or startup_timing.elapsed_ms("data_ready") is None:
+            return
+        self._startup_reported = True
+        if self.on_startup_complete:
+            self.on_startup_complete()
+
+    def _on_game_data_ready(self, future):
+        error = future.exception()
+        if error:
+            logger.error("Error loading game data: %s", error)
+            return
+
+        first_paint_ms = startup_timing.elapsed_ms("first_paint")
+        data_ready_ms = startup_timing.elapsed_ms("data_ready")
+        logger.info("Startup: first paint after %.0f ms, game data ready after %.0f ms", first_paint_ms, data_ready_ms)
+        self.dispatcher.post(self._check_startup_complete)
+
+        if DEBUG_MODE:
+            self.dispatcher.post(self._debug_populate_slots)
+
+        if DATA_HOT_RELOAD_ENABLED:
+            self.data_watcher = GameDataWatcher()
+            self.data_watcher.on_change = self._on_game_data_changed
+            self.data_watcher.start()
+
+    def _on_game_data_changed(self, changed_paths):
+        self.dispatcher.post(self._apply_reloaded_data, topic="game_data_reload")
+
+    def _apply_reloaded_data(self):
+        for slot_id, slot in self.slots.items():
+            timer = self.timer_manager.get_timer(slot_id)
+            if slot.champion and timer:
+                cooldowns = champion_data.get_all_cooldowns(slot.champion)
+                if cooldowns and cooldowns != timer.cooldowns:
+                    self.timer_manager.update_cooldowns(slot_id, cooldowns)
+
+            for spell_slot_id, spell_slot in slot.summoner_spell_slots.items():
+                spell_timer = self.timer_manager.get_summoner_spell_timer(slot_id, spell_slot_id)
+                if spell_slot.spell and spell_timer:
+                    cooldown = summoner_spell_data.get_cooldown(spell_slot.spell)
+                    if cooldown and cooldown != spell_timer.cooldown:
+                        self.timer_manager.update_summoner_cooldown(slot_id, spell_slot_id, cooldown)
+
+        self.timer_manager.update()
+
     def _create_ui(self):
         menu_frame = tk.Frame(self.root, bg=OVERLAY_BG_COLOR, bd=0)
         menu_frame.pack(pady=(0, 2))
@@ -1509,6 +1752,10 @@ class OverlayApp:
         self.main_frame = tk.Frame(inner_frame, bg=OVERLAY_BG_COLOR)
         self.main_frame.pack(padx=3, pady=3)
 
+        self.hud_label = tk.Label(self.root, text="", bg=OVERLAY_BG_COLOR, fg=NAME_COLOR, font=("Consolas", 8), anchor=tk.W)
+        if self.show_perf_hud:
+            self.hud_label.pack(fill=tk.X)
+
         self._create_slots()
 
     def _draw_layout_icon(self, canvas, color=None):
@@ -1597,6 +1844,33 @@ class OverlayApp:
 
         self.settings_dialog = SettingsDialog(self.root, self, position)
 
+    def _open_report_viewer(self, title, get_text):
+        viewer = self.report_viewers.get(title)
+        if viewer and viewer.winfo_exists():
+            viewer._refresh()
+            viewer.lift()
+            return
+
+        def on_cleanup():
+            self.report_viewers.pop(title, None)
+
+        self.report_viewers[title] = ReportViewer(self.root, title, get_text, on_cleanup)
+
+    def _open_log_viewer(self):
+        def get_text():
+            lines = get_log_lines()
+            return ("\n".join(lines) if lines else "No log messages.") + "\n\n" + format_suppressed()
+
+        self._open_report_viewer("Spell Tracker Log", get_text)
+
+    def _open_stall_report(self):
+        if self.stall_detector:
+            get_text = self.stall_detector.format_summary
+        else:
+            def get_text():
+                return "Stall detection is disabled (STALL_DETECTOR_ENABLED)."
+        self._open_report_viewer("Spell Tracker Stalls", get_text)
+
     def _quit_app(self):
         self._exit_app()
 
@@ -1637,7 +1911,7 @@ class OverlayApp:
     def _toggle_layout(self):
         global LAYOUT
         LAYOUT = "horizontal" if LAYOUT == "vertical" else "vertical"
-        save_settings(LAYOUT, sound_enabled=self.sound_enabled, sound_volume=self.sound_volume, sound_alert_threshold=self.sound_alert_threshold, ui_scale=self.ui_scale, use_champion_icons=self.use_champion_icons, auto_load_enabled=self.auto_load_enabled, show_champion_names=self.show_champion_names, gray_low_level_icons=self.gray_low_level_icons, slot_spacing=self.slot_spacing)
+        self.settings_store.update(layout=LAYOUT)
 
         slot_states = {}
         for slot_id, slot in self.slots.items():
@@ -1653,7 +1927,8 @@ class OverlayApp:
                 slot_state['timer_state'] = {
                     'level': timer.level,
                     'is_active': timer.is_active,
-                    'start_time': timer.start_time
+                    'start_time': timer.start_time,
+                    'sound_played': timer.sound_played
                 }
 
             for spell_slot_id, spell_slot in slot.summoner_spell_slots.items():
@@ -1679,11 +1954,8 @@ class OverlayApp:
                 self.slots[slot_id].set_champion(slot_state['champion'])
 
                 if slot_state['timer_state']:
-                    timer = self.timer_manager.get_timer(slot_id)
-                    if timer:
-                        timer.level = slot_state['timer_state']['level']
-                        timer.is_active = slot_state['timer_state']['is_active']
-                        timer.start_time = slot_state['timer_state']['start_time']
+                    timer_state = slot_state['timer_state']
+                    self.timer_manager.restore_timer(slot_id, timer_state['level'], timer_state['is_active'], timer_state['start_time'], timer_state['sound_played'])
 
             for spell_slot_id, spell_name in slot_state['summoner_spells'].items():
                 if spell_name and slot_id in self.slots:
@@ -1692,13 +1964,55 @@ class OverlayApp:
                         spell_slot_widget.set_spell(spell_name)
 
                         if spell_slot_id in slot_state['spell_timer_states']:
-                            spell_timer = self.timer_manager.get_summoner_spell_timer(slot_id, spell_slot_id)
-                            if spell_timer:
-                                timer_state = slot_state['spell_timer_states'][spell_slot_id]
-                                spell_timer.is_active = timer_state['is_active']
-                                spell_timer.start_time = timer_state['start_time']
+                            timer_state = slot_state['spell_timer_states'][spell_slot_id]
+                            self.timer_manager.restore_summoner_spell_timer(slot_id, spell_slot_id, timer_state['is_active'], timer_state['start_time'])
 
         self._draw_layout_icon(self.toggle_canvas)
+        self._update_frame_stats_context()
+
+    def _update_frame_stats_context(self):
+        self.frame_stats.set_context(ui_scale=self.ui_scale, icon_type="champion" if self.use_champion_icons else "ult", layout=LAYOUT,
+                                     quality_tier=self.quality_governor.tier.level)
+
+    def _update_frame_stats_recording(self):
+        self.frame_stats.recording = self.show_perf_hud or self.frame_stats_export_requested
+
+    def _toggle_perf_hud(self):
+        self.show_perf_hud = not self.show_perf_hud
+        self._update_frame_stats_recording()
+        if self.show_perf_hud:
+            self.hud_label.config(text=self.frame_stats.format_hud())
+            self.hud_label.pack(fill=tk.X)
+        else:
+            self.hud_label.pack_forget()
+
+    def _export_frame_stats(self, path=None):
+        path = path or str(get_settings_path().parent / "frame_stats.csv")
+        try:
+            self.frame_stats.export_csv(path)
+            logger.info("Frame stats written to %s", path)
+        except OSError as e:
+            logger.error("Error writing frame stats: %s", e)
+        if not self.frame_stats_export_requested:
+            # History is only kept once someone asked for it; the next export has it.
+            self.frame_stats_export_requested = True
+            self._update_frame_stats_recording()
+            logger.info("Recording per-second frame stats for the next export")
+
+    def _toggle_profiling(self):
+        if not self.profiler.running:
+            self.profiler.start()
+            logger.info("Sampling profiler started")
+            return
+
+        self.profiler.stop()
+        extension = "speedscope.json" if PROFILER_OUTPUT_FORMAT == "speedscope" else "collapsed.txt"
+        path = str(get_settings_path().parent / f"profile-{time.strftime('%Y%m%d-%H%M%S')}.{extension}")
+        try:
+            self.profiler.write(path)
+            logger.info("Profile (%s) written to %s", self.profiler.format_summary(), path)
+        except OSError as e:
+            logger.error("Error writing profile: %s", e)
 
     def _apply_scale_change(self):
         slot_states = {}
@@ -1715,7 +2029,8 @@ class OverlayApp:
                 slot_state['timer_state'] = {
                     'level': timer.level,
                     'is_active': timer.is_active,
-                    'start_time': timer.start_time
+                    'start_time': timer.start_time,
+                    'sound_played': timer.sound_played
                 }
 
             for spell_slot_id, spell_slot in slot.summoner_spell_slots.items():
@@ -1743,11 +2058,8 @@ class OverlayApp:
                 self.slots[slot_id].set_champion(slot_state['champion'])
 
                 if slot_state['timer_state']:
-                    timer = self.timer_manager.get_timer(slot_id)
-                    if timer:
-                        timer.level = slot_state['timer_state']['level']
-                        timer.is_active = slot_state['timer_state']['is_active']
-                        timer.start_time = slot_state['timer_state']['start_time']
+                    timer_state = slot_state['timer_state']
+                    self.timer_manager.restore_timer(slot_id, timer_state['level'], timer_state['is_active'], timer_state['start_time'], timer_state['sound_played'])
 
             for spell_slot_id, spell_name in slot_state['summoner_spells'].items():
                 if spell_name and slot_id in self.slots:
@@ -1756,49 +2068,77 @@ class OverlayApp:
                         spell_slot_widget.set_spell(spell_name)
 
                         if spell_slot_id in slot_state['spell_timer_states']:
-                            spell_timer = self.timer_manager.get_summoner_spell_timer(slot_id, spell_slot_id)
-                            if spell_timer:
-                                timer_state = slot_state['spell_timer_states'][spell_slot_id]
-                                spell_timer.is_active = timer_state['is_active']
-                                spell_timer.start_time = timer_state['start_time']
+                            timer_state = slot_state['spell_timer_states'][spell_slot_id]
+                            self.timer_manager.restore_summoner_spell_timer(slot_id, spell_slot_id, timer_state['is_active'], timer_state['start_time'])
+
+        self._update_frame_stats_context()
 
     def _toggle_lock(self):
         self.locked = not self.locked
-        save_settings(LAYOUT, locked=self.locked, sound_enabled=self.sound_enabled, sound_volume=self.sound_volume, sound_alert_threshold=self.sound_alert_threshold, ui_scale=self.ui_scale, use_champion_icons=self.use_champion_icons, auto_load_enabled=self.auto_load_enabled, show_champion_names=self.show_champion_names, gray_low_level_icons=self.gray_low_level_icons, slot_spacing=self.slot_spacing)
+        self.settings_store.update(locked=self.locked)
         self._draw_lock_icon(self.lock_canvas)
 
     def _setup_auto_loader(self):
         if self.auto_loader:
-            self.auto_loader.stop()
+            self.auto_loader.stop_async()
 
-        self.auto_loader = GameAutoLoader(poll_interval=AUTO_LOAD_POLL_INTERVAL)
+        if AUTO_LOAD_OUT_OF_PROCESS:
+            from poll_worker import ProcessGameAutoLoader
+            self.auto_loader = ProcessGameAutoLoader(poll_interval=AUTO_LOAD_POLL_INTERVAL)
+        else:
+            self.auto_loader = GameAutoLoader(poll_interval=AUTO_LOAD_POLL_INTERVAL, clock=self.clock)
         self.auto_loader.set_callbacks(
             on_game_start=self._on_game_start,
             on_game_end=self._on_game_end,
             on_level_update=self._on_level_update
         )
+        self.auto_loader.is_ui_behind = self.dispatcher.is_behind
         self.auto_loader.start()
 
     def _on_game_start(self, enemy_team_data):
         self.game_connected = True
-        self.root.after(0, lambda: self._update_game_status_and_load(enemy_team_data))
+        trace = tracing.current()
+        trace.mark("posted")
+        self.dispatcher.post(self._update_game_status_and_load, enemy_team_data, trace)
 
     def _on_game_end(self):
         self.game_connected = False
-        self.root.after(0, self._clear_all_slots)
+        self.dispatcher.post(self._clear_all_slots)
+        if self.low_memory or self.memory_profile:
+            self.dispatcher.post(self._after_game_end)
 
     def _on_level_update(self, levels_data):
-        self.root.after(0, lambda: self._update_levels(levels_data))
+        trace = tracing.current()
+        trace.mark("posted")
+        self.dispatcher.post(self._update_levels, levels_data, trace, topic="level_update")
 
     def _clear_all_slots(self):
-        print("Game ended - clearing all slots...")
+        logger.info("Game ended - clearing all slots...")
         for slot in self.slots.values():
             slot.clear()
 
-    def _update_game_status_and_load(self, enemy_team_data):
+    def _after_game_end(self):
+        if self.low_memory:
+            memory_footprint.release_idle_memory(self.alert_engine)
+        if self.memory_profile:
+            self.memory_profile.take(f"after_game_end_{self._games_seen}")
+
+    def _apply_low_memory(self):
+        memory_footprint.apply_low_memory(self.low_memory, self.frame_stats)
+        logger.info("Low memory mode %s", "on" if self.low_memory else "off")
+
+    def _update_game_status_and_load(self, enemy_team_data, trace=tracing.NULL_TRACE):
+        trace.mark("applied")
+        self._games_seen += 1
+        if self.memory_profile:
+            label = f"in_game_{self._games_seen}"
+            self.clock.call_later(MEMORY_PROFILE_IN_GAME_DELAY, lambda: self.memory_profile.take(label))
         self._populate_from_game_data(enemy_team_data)
+        trace.mark("timers_updated")
+        self._traces_awaiting_render.append(trace)
 
-    def _update_levels(self, levels_data):
+    def _update_levels(self, levels_data, trace=tracing.NULL_TRACE):
+        trace.mark("applied")
         for i, level_data in enumerate(levels_data[:NUM_SLOTS]):
             ult_level = level_data.get("level", 0)
             summoner_haste = level_data.get("summoner_haste", 0)
@@ -1818,17 +2158,20 @@ class OverlayApp:
                             slot._update_level_display()
 
                         if timer.ability_haste != ability_haste or timer.ultimate_haste != ultimate_haste:
-                            timer.update_haste(ability_haste, ultimate_haste)
+                            self.timer_manager.update_haste(i, ability_haste, ultimate_haste)
 
                 for spell_slot_idx in [0, 1]:
                     if spell_slot_idx in slot.summoner_spell_slots:
                         spell_slot = slot.summoner_spell_slots[spell_slot_idx]
                         spell_timer = self.timer_manager.get_summoner_spell_timer(i, spell_slot_idx)
                         if spell_timer and spell_timer.summoner_haste != summoner_haste:
-                            spell_timer.update_haste(summoner_haste)
+                            self.timer_manager.update_summoner_haste(i, spell_slot_idx, summoner_haste)
+
+        trace.mark("timers_updated")
+        self._traces_awaiting_render.append(trace)
 
     def _populate_from_game_data(self, enemy_team_data):
-        print(f"Auto-loading {len(enemy_team_data)} champions from game...")
+        logger.info("Auto-loading %d champions from game...", len(enemy_team_data))
 
         for i, player_data in enumerate(enemy_team_data[:NUM_SLOTS]):
             champion = player_data.get("champion")
@@ -1858,7 +2201,8 @@ class OverlayApp:
                 if spell2 and 1 in slot.summoner_spell_slots:
                     slot.summoner_spell_slots[1].set_spell(spell2, summoner_haste)
 
-                print(f"Loaded slot {i}: {champion} lvl{ult_level} ({spell1}/{spell2}) [AH:{ability_haste} UH:{ultimate_haste} SH:{summoner_haste}]")
+                logger.debug("Loaded slot %d: %s lvl%d (%s/%s) [AH:%d UH:%d SH:%d]", i, champion, ult_level, spell1, spell2,
+                             ability_haste, ultimate_haste, summoner_haste, extra={"key": i})
 
     def _setup_drag_and_drop(self):
         self.dragging = False
@@ -1884,10 +2228,6 @@ class OverlayApp:
         self.root.bind("<B1-Motion>", do_drag, add="+")
         self.root.bind("<ButtonRelease-1>", stop_drag, add="+")
 
-    def _play_ready_sound(self):
-        if self.ready_sound and self.sound_enabled:
-            self.ready_sound.play()
-
     def _select_champion(self, slot_id: int):
         if self.champion_selector and self.champion_selector.winfo_exists():
             self.champion_selector.lift()
@@ -1922,33 +2262,60 @@ class OverlayApp:
         self.summoner_spell_selector = SummonerSpellSelector(self.root, on_selected, on_cleanup, position)
 
     def _update_all_timers(self):
+        frame_start = time.perf_counter()
         for slot in self.slots.values():
+            slot_start = time.perf_counter()
             slot.update_timer_display()
             slot._update_level_display()
+            self.frame_stats.record("champion_slot", time.perf_counter() - slot_start)
             slot.update_summoner_spell_displays()
+        frame_time = time.perf_counter() - frame_start
+        FRAME_SECONDS.observe(frame_time)
+        FRAMES_RENDERED.inc()
+        self.frame_stats.record("frame", frame_time)
+        if self.quality_governor.record_frame(frame_time):
+            self._on_quality_changed()
+        if self.frame_stats.end_frame() and self.show_perf_hud:
+            self.hud_label.config(text=self.frame_stats.format_hud())
+        if self._traces_awaiting_render:
+            for trace in self._traces_awaiting_render:
+                trace.finish("rendered")
+            self._traces_awaiting_render = []
 
     def _start_update_loop(self):
         self._update_all_timers()
-        self.root.after(100, self._start_update_loop)
+        self.clock.call_later(self.quality_governor.tier.redraw_interval, self._start_update_loop)
+
+    def _on_quality_changed(self):
+        """The render quality tier changed; slots pick it up on the next frame."""
+        self._update_frame_stats_context()
+        if self.settings_dialog and self.settings_dialog.winfo_exists():
+            self.settings_dialog.update_quality_label()
 
     def _save_position(self):
         x = self.root.winfo_x()
         y = self.root.winfo_y()
         position = {"x": x, "y": y}
-        save_settings(LAYOUT, position, sound_enabled=self.sound_enabled, sound_volume=self.sound_volume, sound_alert_threshold=self.sound_alert_threshold, ui_scale=self.ui_scale, use_champion_icons=self.use_champion_icons, auto_load_enabled=self.auto_load_enabled, show_champion_names=self.show_champion_names, gray_low_level_icons=self.gray_low_level_icons, slot_spacing=self.slot_spacing)
+        self.settings_store.update(position=position)
 
     def _setup_tray_icon(self):
         logo_path = get_resource_path("data/assets/logo.ico")
-        if os.path.exists(logo_path):
-            tray_image = Image.open(logo_path)
+        if resource_exists(logo_path):
+            tray_image = Image.open(open_resource(logo_path))
         else:
             tray_image = Image.new('RGB', (64, 64), color='#0a0a0a')
             draw = ImageDraw.Draw(tray_image)
             draw.rectangle([16, 16, 48, 48], fill='#27ae60')
 
         menu = pystray.Menu(
-            item('Show/Hide', self._toggle_window_visibility),
-            item('Exit', self._exit_app)
+            pystray.MenuItem('Show/Hide', lambda: self.dispatcher.post(self._toggle_window_visibility)),
+            pystray.MenuItem('Show Log', lambda: self.dispatcher.post(self._open_log_viewer)),
+            pystray.MenuItem('Show Stalls', lambda: self.dispatcher.post(self._open_stall_report)),
+            pystray.MenuItem('Performance HUD', lambda: self.dispatcher.post(self._toggle_perf_hud), checked=lambda item: self.show_perf_hud),
+            pystray.MenuItem('Export Frame Stats', lambda: self.dispatcher.post(self._export_frame_stats)),
+            pystray.MenuItem(lambda item: 'Stop Profiling' if self.profiler.running else 'Start Profiling',
+                             lambda: self.dispatcher.post(self._toggle_profiling)),
+            pystray.MenuItem('Exit', lambda: self.dispatcher.post(self._exit_app))
         )
 
         self.tray_icon = pystray.Icon("spell_tracker", tray_image, "Spell Tracker", menu)
@@ -1971,21 +2338,129 @@ class OverlayApp:
         x = self.root.winfo_x()
         y = self.root.winfo_y()
         position = {"x": x, "y": y}
-        save_settings(LAYOUT, position, sound_enabled=self.sound_enabled, sound_volume=self.sound_volume, sound_alert_threshold=self.sound_alert_threshold, ui_scale=self.ui_scale, use_champion_icons=self.use_champion_icons, auto_load_enabled=self.auto_load_enabled, show_champion_names=self.show_champion_names, gray_low_level_icons=self.gray_low_level_icons, slot_spacing=self.slot_spacing)
+        self.settings_store.update(position=position)
         if self.auto_loader:
-            self.auto_loader.stop()
+            self.auto_loader.stop_async()
+        if self.data_watcher:
+            self.data_watcher.stop()
+        self.alert_engine.stop()
         if self.tray_icon:
             self.tray_icon.stop()
+        self.settings_store.close()
+        self.dispatcher.stop()
+        if self.stall_detector:
+            self.stall_detector.stop()
+        if self.profiler.running:
+            self._toggle_profiling()
+        if DEBUG_MODE:
+            logger.debug(self.dispatcher.format_stats())
         self.root.destroy()
 
     def run(self):
         self.root.mainloop()
 
 
-def main():
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="League of Legends spell tracker overlay")
+    parser.add_argument("--profile-startup", nargs="?", const="startup_profile.json", metavar="PATH",
+                        help="print a startup phase report and write it as JSON (default: startup_profile.json)")
+    parser.add_argument("--profile-imports", action="store_true",
+                        help="include an -X importtime breakdown in the startup report")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="quit once startup has completed (useful with --profile-startup)")
+    parser.add_argument("--trace-export", metavar="PATH",
+                        help="write staleness traces in Chrome trace format to PATH on exit")
+    parser.add_argument("--frame-stats-csv", metavar="PATH",
+                        help="write per-second frame time statistics as CSV to PATH on exit")
+    parser.add_argument("--memory-profile", metavar="PATH",
+                        help="take tracemalloc snapshots at startup, in game and after each game; write the report to PATH on exit")
+    parser.add_argument("--log-level", default="DEBUG" if DEBUG_MODE else LOG_LEVEL,
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="minimum level for console and tray log messages")
+    parser.add_argument("--metrics-port", type=int, default=METRICS_PORT, metavar="PORT",
+                        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-dump", default=METRICS_DUMP_PATH, metavar="PATH",
+                        help="write all metrics as JSON to PATH on exit")
+    return parser.parse_args(argv)
+
+
+def _report_startup(app, args):
+    import_times = None
+    if args.profile_imports:
+        import_times = startup_timing.collect_import_times("overlay", os.path.dirname(os.path.abspath(__file__)))
+
+    report = startup_timing.build_report(import_times)
+    print(startup_timing.format_report(report))
+    try:
+        startup_timing.write_report(report, args.profile_startup)
+        print(f"Startup report written to {args.profile_startup}")
+    except OSError as e:
+        print(f"Error writing startup report: {e}")
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    setup_logging(args.log_level)
+    if args.profile_startup:
+        startup_timing.enable_profiling()
+    memory_profile = None
+    if args.memory_profile:
+        memory_profile = memory_footprint.MemoryProfile()
+        memory_profile.start()
+
+    metrics_server = None
+    if args.metrics_port:
+        try:
+            metrics_server = metrics.start_http_server(args.metrics_port)
+            print(f"Serving metrics on http://127.0.0.1:{args.metrics_port}/metrics")
+        except OSError as e:
+            print(f"Error starting metrics server: {e}")
+
     app = OverlayApp()
+    app.memory_profile = memory_profile
+    if args.frame_stats_csv:
+        app.frame_stats_export_requested = True
+        app._update_frame_stats_recording()
+
+    def on_startup_complete():
+        if memory_profile:
+            memory_profile.take("startup")
+        if args.profile_startup:
+            _report_startup(app, args)
+        if args.exit_after_startup:
+            app._on_closing()
+
+    app.on_startup_complete = on_startup_complete
     app.run()
 
+    if args.frame_stats_csv:
+        app._export_frame_stats(args.frame_stats_csv)
+
+    if memory_profile:
+        memory_profile.take("exit")
+        print(memory_profile.format_report())
+        try:
+            memory_profile.write(args.memory_profile)
+            print(f"Memory report written to {args.memory_profile}")
+        except OSError as e:
+            print(f"Error writing memory report: {e}")
+        memory_profile.stop()
+
+    if metrics_server:
+        metrics_server.shutdown()
+    if args.metrics_dump:
+        try:
+            metrics.REGISTRY.dump_json(args.metrics_dump)
+            print(f"Metrics written to {args.metrics_dump}")
+        except OSError as e:
+            print(f"Error writing metrics: {e}")
+    if args.trace_export:
+        try:
+            tracing.export_chrome_trace(args.trace_export)
+            print(f"Traces written to {args.trace_export}")
+        except OSError as e:
+            print(f"Error writing traces: {e}")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,345 @@
+"""
+Out-of-process auto-loader for the overlay application.
+
+When AUTO_LOAD_OUT_OF_PROCESS is enabled, polling the Live Client API, JSON
+parsing and haste calculations run in a separate worker process so they do
+not compete with Tk rendering for the GIL. The worker runs a regular
+GameAutoLoader and publishes compact per-enemy records into a shared memory
+ring buffer. ProcessGameAutoLoader reads the latest snapshot in the overlay
+process, turns changes into the usual loader callbacks, and restarts the
+worker if it dies or stops sending heartbeats.
+
+Shared memory layout (little-endian):
+    header   HEADER_FORMAT: latest sequence number, worker heartbeat time
+    slots    RING_SLOTS * (SLOT_FORMAT + NUM_SLOTS * RECORD_FORMAT)
+
+Each slot is guarded by a seqlock: the writer sets its lock word to an odd
+value while writing and to 2 * seq + 2 when done, so readers can detect
+torn reads and retry without taking a lock.
+"""
+
+import multiprocessing
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app_logging import get_logger, setup_logging
+from config import NUM_SLOTS, POLL_WORKER_RING_SLOTS, POLL_WORKER_HEARTBEAT_TIMEOUT, POLL_WORKER_READ_INTERVAL, POLL_WORKER_RESTART_BACKOFF_MAX
+
+
+HEADER_FORMAT = "<Qd"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SLOT_FORMAT = "<QIBB2x"
+SLOT_SIZE = struct.calcsize(SLOT_FORMAT)
+RECORD_FORMAT = "<32s32s32sbhhh"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+SLOT_STRIDE = SLOT_SIZE + NUM_SLOTS * RECORD_SIZE
+
+
+def ring_size(ring_slots: int = POLL_WORKER_RING_SLOTS) -> int:
+    return HEADER_SIZE + ring_slots * SLOT_STRIDE
+
+
+def _encode(text: Optional[str], size: int) -> bytes:
+    return (text or "").encode('utf-8')[:size]
+
+
+def _decode(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode('utf-8', errors='ignore')
+
+
+class SnapshotRing:
+    """
+    Single-writer, multi-reader ring of enemy team snapshots in shared memory.
+
+    A snapshot is (seq, game_active, generation, records); `generation`
+    increases with every game start so readers can tell a new game from a
+    level update.
+    """
+
+    def __init__(self, buffer, ring_slots: int = POLL_WORKER_RING_SLOTS):
+        self.buffer = buffer
+        self.ring_slots = ring_slots
+
+    def _slot_offset(self, seq: int) -> int:
+        return HEADER_SIZE + (seq % self.ring_slots) * SLOT_STRIDE
+
+    def latest_seq(self) -> int:
+        return struct.unpack_from("<Q", self.buffer, 0)[0]
+
+    def heartbeat(self) -> float:
+        return struct.unpack_from("<d", self.buffer, 8)[0]
+
+    def write_heartbeat(self):
+        struct.pack_into("<d", self.buffer, 8, time.time())
+
+    def publish(self, game_active: bool, generation: int, records: List[Dict[str, Any]]) -> int:
+        seq = self.latest_seq() + 1
+        offset = self._slot_offset(seq)
+        records = records[:NUM_SLOTS]
+
+        struct.pack_into("<Q", self.buffer, offset, 2 * seq + 1)
+        for i, record in enumerate(records):
+            struct.pack_into(
+                RECORD_FORMAT, self.buffer, offset + SLOT_SIZE + i * RECORD_SIZE,
+                _encode(record.get("champion"), 32),
+                _encode(record.get("spell1"), 32),
+                _encode(record.get("spell2"), 32),
+                record.get("level", 0),
+                record.get("summoner_haste", 0),
+                record.get("ability_haste", 0),
+                record.get("ultimate_haste", 0)
+            )
+        struct.pack_into(SLOT_FORMAT, self.buffer, offset, 2 * seq + 1, generation, int(game_active), len(records))
+        struct.pack_into("<Q", self.buffer, offset, 2 * seq + 2)
+        struct.pack_into("<Q", self.buffer, 0, seq)
+        return seq
+
+    def read_latest(self, retries: int = 10) -> Optional[Tuple[int, bool, int, List[Dict[str, Any]]]]:
+        """Read the newest complete snapshot, or None if nothing was published yet."""
+        for _ in range(retries):
+            seq = self.latest_seq()
+            if seq == 0:
+                return None
+            offset = self._slot_offset(seq)
+
+            lock, generation, game_active, count = struct.unpack_from(SLOT_FORMAT, self.buffer, offset)
+            if lock != 2 * seq + 2:
+                continue
+
+            records = []
+            for i in range(min(count, NUM_SLOTS)):
+                champion, spell1, spell2, level, summoner_haste, ability_haste, ultimate_haste = struct.unpack_from(
+                    RECORD_FORMAT, self.buffer, offset + SLOT_SIZE + i * RECORD_SIZE
+                )
+                records.append({
+                    "champion": _decode(champion),
+                    "spell1": _decode(spell1),
+                    "spell2": _decode(spell2),
+                    "level": level,
+                    "summoner_haste": summoner_haste,
+                    "ability_haste": ability_haste,
+                    "ultimate_haste": ultimate_haste
+                })
+
+            if struct.unpack_from("<Q", self.buffer, offset)[0] == lock:
+                return seq, bool(game_active), generation, records
+        return None
+
+
+WORKER_TICK = 0.1
+
+logger = get_logger("poll_worker")
+
+
+def _worker_main(shm_name: str, poll_interval, stop_flag, ring_slots: int):
+    """
+    Entry point of the worker process.
+
+    poll_interval and stop_flag are lock-free shared values: a
+    multiprocessing.Event could be left locked forever if the worker is
+    killed while holding it.
+    """
+    from auto_loader import GameAutoLoader
+
+    setup_logging()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = SnapshotRing(shm.buf, ring_slots)
+
+    # A restarted worker picks up the game in progress from the ring, so its
+    # polls publish level updates under the same generation instead of
+    # starting the game over (which would reset the overlay's timers).
+    latest = ring.read_latest()
+    resumed = latest is not None and latest[1]
+    state = {"generation": latest[2] if latest else 0, "team": latest[3] if resumed else []}
+
+    def on_game_start(parsed):
+        state["generation"] += 1
+        state["team"] = parsed
+        ring.publish(True, state["generation"], parsed)
+
+    def on_game_end():
+        state["team"] = []
+        ring.publish(False, state["generation"], [])
+
+    def on_level_update(levels):
+        team = [dict(player, **level) for player, level in zip(state["team"], levels)]
+        state["team"] = team
+        ring.publish(True, state["generation"], team)
+
+    loader = GameAutoLoader(poll_interval=poll_interval.value)
+    loader.game_active = resumed
+    loader.set_callbacks(on_game_start=on_game_start, on_game_end=on_game_end, on_level_update=on_level_update)
+    loader.start()
+
+    try:
+        current_interval = poll_interval.value
+        while not stop_flag.value:
+            ring.write_heartbeat()
+            if poll_interval.value != current_interval:
+                current_interval = poll_interval.value
+                loader.reconfigure(poll_interval=current_interval)
+            time.sleep(WORKER_TICK)
+    finally:
+        loader.stop()
+        ring.buffer = None
+        shm.close()
+
+
+class ProcessGameAutoLoader:
+    """
+    GameAutoLoader stand-in that runs the loader in a worker process.
+
+    Exposes the same callbacks and control methods as GameAutoLoader. A
+    reader thread in the overlay process turns new snapshots into
+    on_game_start / on_level_update / on_game_end calls.
+    """
+
+    def __init__(self, poll_interval: float = 3.0, ring_slots: int = POLL_WORKER_RING_SLOTS):
+        self.ring_slots = ring_slots
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+        self.process = None
+        self.restarts = 0
+        self.on_game_start: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self.on_game_end: Optional[Callable[[], None]] = None
+        self.on_level_update: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self.is_ui_behind: Optional[Callable[[], bool]] = None
+        self.game_active = False
+
+        self._context = multiprocessing.get_context("spawn")
+        self._poll_interval = self._context.Value('d', poll_interval, lock=False)
+        self._worker_stop = None
+        self._stop_event = threading.Event()
+        self._shm = None
+        self._ring = None
+        self._last_seq = 0
+        self._generation = None
+        self._restart_at = None
+        self._started_at = 0.0
+
+    @property
+    def poll_interval(self) -> float:
+        return self._poll_interval.value
+
+    def set_callbacks(self,
+                      on_game_start: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                      on_game_end: Optional[Callable[[], None]] = None,
+                      on_level_update: Optional[Callable[[List[Dict[str, Any]]], None]] = None):
+        self.on_game_start = on_game_start
+        self.on_game_end = on_game_end
+        self.on_level_update = on_level_update
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._stop_event.clear()
+        self._shm = shared_memory.SharedMemory(create=True, size=ring_size(self.ring_slots))
+        self._shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        self._ring = SnapshotRing(self._shm.buf, self.ring_slots)
+        self._start_worker()
+        self.thread = threading.Thread(target=self._read_loop, name="poll-worker-reader", daemon=True)
+        self.thread.start()
+
+    def _start_worker(self):
+        self._started_at = time.time()
+        self._ring.write_heartbeat()
+        self._worker_stop = self._context.Value('b', 0, lock=False)
+        self.process = self._context.Process(
+            target=_worker_main,
+            args=(self._shm.name, self._poll_interval, self._worker_stop, self.ring_slots),
+            name="spell-tracker-poll-worker",
+            daemon=True
+        )
+        self.process.start()
+
+    def _stop_worker(self, timeout: float = 1.0):
+        if self.process is None:
+            return
+        self._worker_stop.value = 1
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.process = None
+
+    def _worker_healthy(self) -> bool:
+        if self.process is None or not self.process.is_alive():
+            return False
+        return time.time() - self._ring.heartbeat() < POLL_WORKER_HEARTBEAT_TIMEOUT
+
+    def stop_async(self):
+        """Signal shutdown; the reader thread stops the worker and frees shared memory."""
+        self.running = False
+        self._stop_event.set()
+
+    def stop(self, timeout: float = 2.0):
+        self.stop_async()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+
+    def reconfigure(self, poll_interval: Optional[float] = None):
+        if poll_interval is not None:
+            self._poll_interval.value = poll_interval
+
+    def _read_loop(self):
+        try:
+            while not self._stop_event.wait(POLL_WORKER_READ_INTERVAL):
+                if self.process is not None and not self._worker_healthy():
+                    exit_code = self.process.exitcode
+                    self._stop_worker(timeout=0.2)
+                    if time.time() - self._started_at > POLL_WORKER_RESTART_BACKOFF_MAX:
+                        # The previous worker ran long enough; forget earlier crashes.
+                        self.restarts = 0
+                    delay = min(POLL_WORKER_RESTART_BACKOFF_MAX, 2 ** self.restarts - 1)
+                    self.restarts += 1
+                    self._restart_at = time.time() + delay
+                    logger.warning("Poll worker stopped responding (exit code %s), restarting in %.0fs", exit_code, delay)
+                if self.process is None:
+                    if time.time() >= self._restart_at:
+                        self._start_worker()
+                    continue
+
+                try:
+                    self._dispatch_latest()
+                except Exception as e:
+                    logger.warning("Auto-loader error: %s", e, extra={"key": type(e).__name__})
+        finally:
+            self._stop_worker()
+            self._ring = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _dispatch_latest(self):
+        seq = self._ring.latest_seq()
+        if seq == self._last_seq:
+            return
+        snapshot = self._ring.read_latest()
+        if snapshot is None:
+            return
+
+        seq, game_active, generation, records = snapshot
+        self._last_seq = seq
+
+        if game_active and generation != self._generation:
+            self._generation = generation
+            self.game_active = True
+            if records and self.on_game_start:
+                self.on_game_start(records)
+        elif not game_active and self.game_active:
+            self.game_active = False
+            if self.on_game_end:
+                self.on_game_end()
+        elif game_active and records and self.on_level_update:
+            if not (self.is_ui_behind and self.is_ui_behind()):
+                levels = [
+                    {key: record[key] for key in ("level", "summoner_haste", "ability_haste", "ultimate_haste")}
+                    for record in records
+                ]
+                self.on_level_update(levels)
+            else:
+                # Re-read this snapshot next time instead of dropping it.
+                self._last_seq = seq - 1
@@ -0,0 +1,201 @@
+"""
+Adaptive render quality for the overlay application.
+
+When the game is CPU-bound, the overlay's redraws compete with it. The
+QualityGovernor watches the overlay's own frame times and the process CPU
+use and steps down through QUALITY_TIERS when either is over budget:
+
+0. Full quality
+1. Lower redraw rate
+2. Timer text without outline
+3. No dimming of icons on cooldown or without an ultimate
+4. Summoner spell countdowns hidden (the red border still marks the cooldown)
+
+Each tier keeps the savings of the tiers before it. Once frame times and
+CPU use have stayed under budget for a while, it steps back up one tier at
+a time. To avoid flapping between two tiers, each step down records how
+much the lower tier saved (the frame p95 and CPU measured before and after
+the step); stepping back up waits until the current cost plus those
+savings fits the budget. Since the savings may have been measured while
+the game was starving the overlay, the tier is tried again anyway once
+they are older than a retry hold, which doubles every time a step up has
+to be undone right away. A tier can also be fixed by the user (override),
+which stops the automatic stepping.
+
+Frame times are wall-clock times of the Tk update loop, so they also grow
+when the overlay is starved of CPU by the game, not only when its own work
+grows.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from config import (QUALITY_EVAL_INTERVAL, QUALITY_FRAME_BUDGET_MS, QUALITY_CPU_BUDGET, QUALITY_HEADROOM,
+                    QUALITY_STEP_UP_HOLD, QUALITY_RETRY_HOLD, QUALITY_RETRY_HOLD_MAX)
+from clock import SYSTEM_CLOCK
+from frame_stats import percentile
+from app_logging import get_logger
+import metrics
+
+logger = get_logger(__name__)
+
+QUALITY_TIER_GAUGE = metrics.gauge("overlay_quality_tier", "Render quality tier in use (0 = full quality)")
+QUALITY_CHANGES = metrics.counter("overlay_quality_changes_total", "Automatic render quality tier changes", ("direction",))
+
+
+class QualityTier:
+    """Render settings for one quality tier."""
+
+    __slots__ = ("level", "name", "redraw_interval", "outline_text", "dimming", "summoner_text")
+
+    def __init__(self, level: int, name: str, redraw_interval: float, outline_text: bool, dimming: bool, summoner_text: bool):
+        self.level = level
+        self.name = name
+        self.redraw_interval = redraw_interval
+        self.outline_text = outline_text
+        self.dimming = dimming
+        self.summoner_text = summoner_text
+
+
+QUALITY_TIERS = (
+    QualityTier(0, "Full", 0.1, True, True, True),
+    QualityTier(1, "Reduced rate", 0.25, True, True, True),
+    QualityTier(2, "No outlines", 0.25, False, True, True),
+    QualityTier(3, "No dimming", 0.5, False, False, True),
+    QualityTier(4, "Minimal", 0.5, False, False, False),
+)
+
+
+class QualityGovernor:
+    """
+    Picks the render quality tier from recent frame times and CPU use.
+
+    record_frame() is called by the update loop after every frame; every
+    `interval` seconds it evaluates the frames since the last evaluation.
+
+    Stepping up to a tier whose savings were measured needs its predicted
+    cost (current cost plus savings) to fit the budget, or the measurement
+    to be older than `retry_hold`; without a measurement, frames and CPU
+    must be under `headroom` times the budget.
+    """
+
+    def __init__(self, frame_budget_ms: float = QUALITY_FRAME_BUDGET_MS, cpu_budget: float = QUALITY_CPU_BUDGET,
+                 headroom: float = QUALITY_HEADROOM, step_up_hold: float = QUALITY_STEP_UP_HOLD,
+                 interval: float = QUALITY_EVAL_INTERVAL, retry_hold: float = QUALITY_RETRY_HOLD,
+                 retry_hold_max: float = QUALITY_RETRY_HOLD_MAX, clock=SYSTEM_CLOCK,
+                 cpu_time: Callable[[], float] = time.process_time):
+        self.frame_budget = frame_budget_ms / 1000
+        self.cpu_budget = cpu_budget
+        self.headroom = headroom
+        self.step_up_hold = step_up_hold
+        self.interval = interval
+        self.base_retry_hold = retry_hold
+        self.retry_hold = retry_hold
+        self.retry_hold_max = retry_hold_max
+        self.clock = clock
+        self.cpu_time = cpu_time
+
+        self.auto_level = 0
+        self.override: Optional[int] = None
+        self.frame_p95_ms = 0.0
+        self.cpu_percent = 0.0
+
+        self._frames: List[float] = []
+        self._last_eval = clock.now()
+        self._last_cpu = cpu_time()
+        self._headroom_since: Optional[float] = None
+        # Upper tier level -> (frame p95 saved, CPU percent saved, time measured)
+        self._savings: Dict[int, Tuple[float, float, float]] = {}
+        # (level stepped down from, its frame p95, its CPU percent) until measured at the new tier
+        self._stepped_down_from: Optional[Tuple[int, float, float]] = None
+        self._stepped_up_at: Optional[float] = None
+        QUALITY_TIER_GAUGE.set(0)
+
+    @property
+    def tier(self) -> QualityTier:
+        return QUALITY_TIERS[self.override if self.override is not None else self.auto_level]
+
+    def set_override(self, level: Optional[int]):
+        """Fix the tier at `level`, or None to let the governor choose."""
+        if level is not None:
+            level = max(0, min(len(QUALITY_TIERS) - 1, level))
+        self.override = level
+        self._headroom_since = None
+        self._stepped_down_from = None
+        self._stepped_up_at = None
+        QUALITY_TIER_GAUGE.set(self.tier.level)
+
+    def record_frame(self, seconds: float) -> bool:
+        """
+        Add a frame time and evaluate when the interval is up.
+
+        Returns:
+            True if the tier in use changed
+        """
+        self._frames.append(seconds)
+        now = self.clock.now()
+        if now - self._last_eval < self.interval:
+            return False
+        return self._evaluate(now)
+
+    def _evaluate(self, now: float) -> bool:
+        cpu = self.cpu_time()
+        self.cpu_percent = (cpu - self._last_cpu) / max(now - self._last_eval, 1e-6) * 100
+        self.frame_p95_ms = percentile(sorted(self._frames), 95) * 1000
+        self._last_cpu = cpu
+        self._last_eval = now
+        self._frames = []
+
+        if self.override is not None:
+            return False
+
+        frame_p95 = self.frame_p95_ms / 1000
+        if self._stepped_down_from is not None:
+            upper, upper_p95, upper_cpu = self._stepped_down_from
+            self._savings[upper] = (upper_p95 - frame_p95, upper_cpu - self.cpu_percent, now)
+            self._stepped_down_from = None
+        if self._stepped_up_at is not None and now - self._stepped_up_at > self.step_up_hold:
+            # The last step up held; retry quickly again after the next step down.
+            self.retry_hold = self.base_retry_hold
+            self._stepped_up_at = None
+
+        if frame_p95 > self.frame_budget or self.cpu_percent > self.cpu_budget:
+            self._headroom_since = None
+            if self.auto_level < len(QUALITY_TIERS) - 1:
+                if self._stepped_up_at is not None:
+                    # The step up was undone right away; wait longer before trying again.
+                    self.retry_hold = min(self.retry_hold * 2, self.retry_hold_max)
+                    self._stepped_up_at = None
+                self._stepped_down_from = (self.auto_level, frame_p95, self.cpu_percent)
+                return self._step(1)
+            return False
+
+        if self.auto_level > 0 and self._upper_tier_fits(frame_p95, now):
+            if self._headroom_since is None:
+                self._headroom_since = now
+            elif now - self._headroom_since >= self.step_up_hold:
+                self._headroom_since = None
+                self._stepped_up_at = now
+                return self._step(-1)
+        else:
+            self._headroom_since = None
+        return False
+
+    def _upper_tier_fits(self, frame_p95: float, now: float) -> bool:
+        """Whether the tier above the current one is expected to stay within budget."""
+        savings = self._savings.get(self.auto_level - 1)
+        if savings is None:
+            return frame_p95 < self.frame_budget * self.headroom and self.cpu_percent < self.cpu_budget * self.headroom
+        frame_saved, cpu_saved, measured_at = savings
+        if now - measured_at >= self.retry_hold:
+            # Try the tier again; stepping back down re-measures its savings.
+            return True
+        return frame_p95 + frame_saved <= self.frame_budget and self.cpu_percent + cpu_saved <= self.cpu_budget
+
+    def _step(self, direction: int) -> bool:
+        self.auto_level += direction
+        QUALITY_TIER_GAUGE.set(self.auto_level)
+        QUALITY_CHANGES.labels("down" if direction > 0 else "up").inc()
+        logger.info("Render quality %s to tier %d (%s): frame p95 %.1f ms, CPU %.1f%%",
+                    "lowered" if direction > 0 else "raised", self.auto_level, self.tier.name,
+                    self.frame_p95_ms, self.cpu_percent)
+        return True
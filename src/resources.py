@@ -0,0 +1,198 @@
+"""
+Resource access layer for the overlay application.
+
+This module reads icons, sounds and game data either from the filesystem
+(running from source) or from a single indexed ZIP archive that is appended
+to the packaged executable or shipped next to it. The archive is opened once
+and members are read on demand, so the packaged build does not need to
+extract every asset to a temporary directory at launch.
+
+Paths passed in may be relative resource paths ("data/icons/...") or the
+absolute paths produced by config.get_resource_path().
+"""
+
+import io
+import os
+import sys
+import threading
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+from config import RESOURCE_BASE_PATH, RESOURCE_ARCHIVE_NAME
+
+
+RESOURCE_ARCHIVE_ENV = "SPELL_TRACKER_RESOURCES"
+
+
+class ResourceArchive:
+    """
+    Read-only index over a ZIP archive of resources.
+
+    The central directory is read once on open; member data is read on
+    demand. Archives with data prepended to them (for example appended to an
+    executable) are supported.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip = zipfile.ZipFile(path, 'r')
+        self._index = {info.filename: info for info in self._zip.infolist() if not info.is_dir()}
+        self._lock = threading.Lock()
+
+    def exists(self, name: str) -> bool:
+        return name in self._index
+
+    def size(self, name: str) -> Optional[int]:
+        info = self._index.get(name)
+        return info.file_size if info else None
+
+    def read(self, name: str) -> bytes:
+        with self._lock:
+            return self._zip.read(self._index[name])
+
+    def names(self):
+        return list(self._index)
+
+    def close(self):
+        self._zip.close()
+
+
+def pack_resources(output: BinaryIO, files: Iterable[str], base_path: str = RESOURCE_BASE_PATH) -> int:
+    """
+    Write resources into a ZIP archive.
+
+    Members are stored uncompressed: icons and sounds are already compressed,
+    and stored members can be read without inflating.
+
+    Args:
+        output: Writable binary file; the archive is written at its current
+            position, so it may be appended to an existing file
+        files: Relative resource paths to include
+        base_path: Directory the relative paths are resolved against
+
+    Returns:
+        Number of members written
+    """
+    count = 0
+    with zipfile.ZipFile(output, 'a' if output.tell() else 'w', compression=zipfile.ZIP_STORED) as archive:
+        for name in files:
+            archive.write(os.path.join(base_path, name), arcname=name.replace(os.sep, "/"))
+            count += 1
+    return count
+
+
+def collect_resource_files(directories: Iterable[str], base_path: str = RESOURCE_BASE_PATH) -> list:
+    """List relative paths of all files below the given resource directories or files."""
+    files = []
+    for relative in directories:
+        absolute = Path(base_path) / relative
+        if absolute.is_file():
+            files.append(relative)
+        elif absolute.is_dir():
+            files += sorted(path.relative_to(base_path).as_posix() for path in absolute.rglob("*") if path.is_file())
+    return files
+
+
+def _find_archive() -> Optional[ResourceArchive]:
+    candidates = []
+    override = os.environ.get(RESOURCE_ARCHIVE_ENV)
+    if override:
+        candidates.append(override)
+    if getattr(sys, 'frozen', False):
+        candidates.append(sys.executable)
+        candidates.append(os.path.join(os.path.dirname(sys.executable), RESOURCE_ARCHIVE_NAME))
+
+    for candidate in candidates:
+        if os.path.isfile(candidate) and zipfile.is_zipfile(candidate):
+            try:
+                return ResourceArchive(candidate)
+            except (OSError, zipfile.BadZipFile) as e:
+                print(f"Ignoring resource archive {candidate}: {e}")
+    return None
+
+
+_archive: Optional[ResourceArchive] = None
+_archive_checked = False
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> Optional[ResourceArchive]:
+    """Open the resource archive once per process, or return None when using the filesystem."""
+    global _archive, _archive_checked
+    if _archive_checked:
+        return _archive
+    with _archive_lock:
+        if not _archive_checked:
+            _archive = _find_archive()
+            _archive_checked = True
+    return _archive
+
+
+def to_resource_name(path: str) -> str:
+    """Convert an absolute resource path to its relative archive member name."""
+    path = os.fspath(path)
+    if os.path.isabs(path):
+        try:
+            path = os.path.relpath(path, RESOURCE_BASE_PATH)
+        except ValueError:
+            return path.replace(os.sep, "/")
+    return path.replace(os.sep, "/")
+
+
+def _filesystem_path(path: str) -> str:
+    path = os.fspath(path)
+    return path if os.path.isabs(path) else os.path.join(RESOURCE_BASE_PATH, path)
+
+
+def resource_exists(path: str) -> bool:
+    archive = get_archive()
+    if archive and archive.exists(to_resource_name(path)):
+        return True
+    return os.path.exists(_filesystem_path(path))
+
+
+def resource_size(path: str) -> Optional[int]:
+    archive = get_archive()
+    if archive:
+        size = archive.size(to_resource_name(path))
+        if size is not None:
+            return size
+    try:
+        return os.path.getsize(_filesystem_path(path))
+    except OSError:
+        return None
+
+
+def read_resource(path: str) -> bytes:
+    """
+    Read a resource's bytes from the archive, falling back to the filesystem.
+
+    Raises:
+        FileNotFoundError: If the resource exists in neither place
+    """
+    archive = get_archive()
+    if archive:
+        name = to_resource_name(path)
+        if archive.exists(name):
+            return archive.read(name)
+    with open(_filesystem_path(path), 'rb') as f:
+        return f.read()
+
+
+def open_resource(path: str) -> BinaryIO:
+    """Open a resource as a binary file object (for Image.open, json.load, mixer sounds)."""
+    archive = get_archive()
+    if archive:
+        name = to_resource_name(path)
+        if archive.exists(name):
+            return io.BytesIO(archive.read(name))
+    return open(_filesystem_path(path), 'rb')
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "list":
+        archive = ResourceArchive(sys.argv[2])
+        for name in sorted(archive.names()):
+            print(f"{archive.size(name):>9}  {name}")
+    else:
+        print("Usage: python src/resources.py list ARCHIVE")
@@ -0,0 +1,149 @@
+"""
+Low-overhead sampling profiler for the overlay application.
+
+A background thread wakes every `interval` seconds, reads the current
+stack of every other thread through sys._current_frames() and counts
+identical stacks. Nothing is installed in the profiled threads, so the
+profiler can be started and stopped in a running session (from the tray
+menu) without restarting and losing timers.
+
+Profiles are written as speedscope JSON (https://www.speedscope.app) or as
+collapsed stacks ("thread;outer;...;inner count" lines) for flamegraph.pl
+and similar tools.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from config import PROFILER_SAMPLE_INTERVAL
+
+
+FrameKey = Tuple[str, str, int]
+
+
+class SamplingProfiler:
+    """
+    Periodic all-thread stack sampler.
+
+    Frames are identified by (file, function, first line), so samples
+    aggregate per function rather than per line.
+    """
+
+    def __init__(self, interval: float = PROFILER_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.frames: List[FrameKey] = []
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at = 0.0
+        self.duration = 0.0
+
+        self._frame_index: Dict[FrameKey, int] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.frames = []
+        self.stacks = Counter()
+        self.samples = 0
+        self._frame_index = {}
+        self._stop_event.clear()
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+        self.duration = time.perf_counter() - self.started_at
+
+    def _frame_id(self, code) -> int:
+        key = (code.co_filename, code.co_name, code.co_firstlineno)
+        index = self._frame_index.get(key)
+        if index is None:
+            index = len(self.frames)
+            self._frame_index[key] = index
+            self.frames.append(key)
+        return index
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            self._thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._frame_id(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                thread_name = self._thread_names.get(thread_id, str(thread_id))
+                self.stacks[(thread_name, tuple(stack))] += 1
+            self.samples += 1
+
+    def _frame_label(self, index: int) -> str:
+        filename, name, line = self.frames[index]
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def collapsed(self) -> List[str]:
+        """Collapsed stack lines, one per distinct (thread, stack)."""
+        lines = []
+        for (thread_name, stack), count in self.stacks.most_common():
+            frames = ";".join(self._frame_label(index) for index in stack)
+            lines.append(f"{thread_name};{frames} {count}")
+        return lines
+
+    def to_speedscope(self, name: str = "Spell Tracker") -> dict:
+        """Speedscope file with one sampled profile per thread; weights are seconds."""
+        by_thread: Dict[str, List[Tuple[Tuple[int, ...], int]]] = {}
+        for (thread_name, stack), count in self.stacks.items():
+            by_thread.setdefault(thread_name, []).append((stack, count))
+
+        profiles = []
+        for thread_name, entries in sorted(by_thread.items()):
+            weights = [count * self.interval for _, count in entries]
+            profiles.append({
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": [list(stack) for stack, _ in entries],
+                "weights": weights
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "spell-tracker sampling_profiler",
+            "shared": {
+                "frames": [{"name": frame_name, "file": filename, "line": line} for filename, frame_name, line in self.frames]
+            },
+            "profiles": profiles
+        }
+
+    def write(self, path: str):
+        """Write speedscope JSON for .json paths, collapsed stacks otherwise."""
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith(".json"):
+                json.dump(self.to_speedscope(), f)
+            else:
+                f.write("\n".join(self.collapsed()) + "\n")
+
+    def format_summary(self) -> str:
+        return f"{self.samples} samples over {self.duration:.1f} s across {len({thread for thread, _ in self.stacks})} threads"
@@ -1,13 +1,18 @@
 """
 Settings management for the overlay application.
 
-This module handles saving and loading user preferences.
+This module handles saving and loading user preferences. The overlay keeps
+settings in a SettingsStore, which applies updates in memory and writes
+them to disk from a background thread.
 """
 
 import json
 import os
+import tempfile
+import threading
 from pathlib import Path
-from config import LAYOUT, SOUND_ENABLED, SOUND_VOLUME, SOUND_ALERT_THRESHOLD, UI_SCALE, DEFAULT_LOCKED, DEFAULT_POSITION, USE_CHAMPION_ICONS, AUTO_LOAD_ENABLED, SHOW_CHAMPION_NAMES, GRAY_LOW_LEVEL_ICONS, DEFAULT_SLOT_SPACING
+from typing import Any, Dict
+from config import SETTINGS_WRITE_DELAY, LAYOUT, SOUND_ENABLED, SOUND_VOLUME, SOUND_ALERT_THRESHOLD, UI_SCALE, DEFAULT_LOCKED, DEFAULT_POSITION, USE_CHAMPION_ICONS, AUTO_LOAD_ENABLED, SHOW_CHAMPION_NAMES, GRAY_LOW_LEVEL_ICONS, DEFAULT_SLOT_SPACING, LOW_MEMORY_MODE, QUALITY_OVERRIDE
 
 
 def get_settings_path():
@@ -22,9 +27,9 @@ def get_settings_path():
     return settings_dir / 'settings.json'
 
 
-def load_settings():
+def load_settings(settings_file=None):
     """Load user settings from JSON file."""
-    settings_file = get_settings_path()
+    settings_file = Path(settings_file) if settings_file else get_settings_path()
 
     if not settings_file.exists():
         return {
@@ -39,7 +44,9 @@ def load_settings():
             "auto_load_enabled": AUTO_LOAD_ENABLED,
             "show_champion_names": SHOW_CHAMPION_NAMES,
             "gray_low_level_icons": GRAY_LOW_LEVEL_ICONS,
-            "slot_spacing": DEFAULT_SLOT_SPACING
+            "slot_spacing": DEFAULT_SLOT_SPACING,
+            "low_memory": LOW_MEMORY_MODE,
+            "quality_override": QUALITY_OVERRIDE
         }
 
     try:
@@ -67,6 +74,10 @@ def load_settings():
                 settings["gray_low_level_icons"] = GRAY_LOW_LEVEL_ICONS
             if "slot_spacing" not in settings:
                 settings["slot_spacing"] = DEFAULT_SLOT_SPACING
+            if "low_memory" not in settings:
+                settings["low_memory"] = LOW_MEMORY_MODE
+            if "quality_override" not in settings:
+                settings["quality_override"] = QUALITY_OVERRIDE
             return settings
     except (json.JSONDecodeError, IOError):
         return {
@@ -81,11 +92,13 @@ def load_settings():
             "auto_load_enabled": AUTO_LOAD_ENABLED,
             "show_champion_names": SHOW_CHAMPION_NAMES,
             "gray_low_level_icons": GRAY_LOW_LEVEL_ICONS,
-            "slot_spacing": DEFAULT_SLOT_SPACING
+            "slot_spacing": DEFAULT_SLOT_SPACING,
+            "low_memory": LOW_MEMORY_MODE,
+            "quality_override": QUALITY_OVERRIDE
         }
 
 
-def save_settings(layout, position=None, locked=None, sound_enabled=None, sound_volume=None, sound_alert_threshold=None, ui_scale=None, use_champion_icons=None, auto_load_enabled=None, show_champion_names=None, gray_low_level_icons=None, slot_spacing=None):
+def save_settings(layout, position=None, locked=None, sound_enabled=None, sound_volume=None, sound_alert_threshold=None, ui_scale=None, use_champion_icons=None, auto_load_enabled=None, show_champion_names=None, gray_low_level_icons=None, slot_spacing=None, low_memory=None):
     """Save user settings to JSON file."""
     settings_file = get_settings_path()
     current_settings = load_settings()
@@ -112,9 +125,126 @@ def save_settings(layout, position=None, locked=None, sound_enabled=None, sound_
         current_settings["gray_low_level_icons"] = gray_low_level_icons
     if slot_spacing is not None:
         current_settings["slot_spacing"] = slot_spacing
+    if low_memory is not None:
+        current_settings["low_memory"] = low_memory
 
     try:
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            json.dump(current_settings, f, indent=2)
+        write_settings_file(settings_file, current_settings)
     except IOError as e:
         print(f"Error saving settings: {e}")
+
+
+def write_settings_file(settings_file, settings: Dict[str, Any]):
+    """Write settings atomically so a crash mid-write cannot leave a truncated file."""
+    settings_file = Path(settings_file)
+    fd, tmp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=settings_file.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(settings, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, settings_file)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SettingsStore:
+    """
+    In-memory user settings with write-behind persistence.
+
+    Updates are applied as patches to the in-memory settings and return
+    immediately. A background writer waits until updates have been quiet for
+    `write_delay` seconds and then writes the latest settings once, so a
+    burst of updates costs a single write. Call close() on exit to flush
+    pending changes.
+    """
+
+    def __init__(self, settings_file=None, write_delay: float = SETTINGS_WRITE_DELAY):
+        self.settings_file = Path(settings_file) if settings_file else get_settings_path()
+        self.write_delay = write_delay
+        self._settings = load_settings(self.settings_file)
+        self._version = 0
+        self._written_version = 0
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._condition:
+            return self._settings.get(key, default)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._condition:
+            return dict(self._settings)
+
+    def update(self, **patch):
+        """
+        Apply a patch to the settings and schedule a write.
+
+        None is stored like any other value; quality_override=None means
+        automatic quality, so it must replace a previously saved tier.
+        """
+        if not patch:
+            return
+        with self._condition:
+            if all(self._settings.get(key) == value for key, value in patch.items()):
+                return
+            self._settings.update(patch)
+            self._version += 1
+            if self._closed:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self):
+        """Write pending changes now, on the calling thread."""
+        with self._write_lock:
+            with self._condition:
+                if self._version == self._written_version:
+                    return
+                version = self._version
+                settings = dict(self._settings)
+            try:
+                write_settings_file(self.settings_file, settings)
+            except OSError as e:
+                print(f"Error saving settings: {e}")
+                return
+            with self._condition:
+                self._written_version = max(self._written_version, version)
+
+    def close(self):
+        """Stop the background writer and write any pending changes."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._version == self._written_version and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+
+                # Coalesce: wait until updates stop arriving for write_delay.
+                version = self._version
+                while not self._closed:
+                    self._condition.wait(self.write_delay)
+                    if self._version == version:
+                        break
+                    version = self._version
+                if self._closed:
+                    return
+
+            self.flush()
@@ -0,0 +1,148 @@
+"""
+Display-independent rendering of overlay slot images.
+
+The functions here turn slot state (base icon, remaining time, availability)
+into a PIL image without touching Tk, so frames can be rendered, measured
+and snapshot-tested on a headless machine. ChampionSlot and
+SummonerSpellSlot only convert the result to a PhotoImage and put it on
+their canvas.
+
+`stats`, where accepted, is anything with a count_pil_images(n) method
+(normally the overlay's FrameStats) and is told how many PIL images a call
+created. `outline` and `dim` turn off the text outline and the dimming
+overlays for the lower render quality tiers (see quality_governor).
+"""
+
+import functools
+from typing import Optional
+from lazy_import import lazy_import
+from config import TIMER_OUTLINE_COLOR, COOLDOWN_COLOR
+from resources import open_resource
+
+Image = lazy_import("PIL.Image")
+ImageDraw = lazy_import("PIL.ImageDraw")
+ImageFont = lazy_import("PIL.ImageFont")
+ImageEnhance = lazy_import("PIL.ImageEnhance")
+
+
+CHAMPION_TIMER_FONT_SIZE = 24
+SUMMONER_TIMER_FONT_SIZE = 12
+
+COOLDOWN_DIM = (0, 0, 0, 150)
+UNAVAILABLE_DIM = (0, 0, 0, 180)
+UNAVAILABLE_SATURATION = 0.2
+
+
+@functools.lru_cache(maxsize=None)
+def get_timer_font(size: int):
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except:
+        try:
+            return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
+        except:
+            return ImageFont.load_default()
+
+
+def format_remaining(remaining: float) -> str:
+    if remaining >= 60:
+        minutes = int(remaining // 60)
+        seconds = int(remaining % 60)
+        return f"{minutes}:{seconds:02d}"
+    return f"{int(remaining)}"
+
+
+def load_icon(icon_path: str, size: int, stats=None):
+    """Open an icon resource as an RGBA image of size x size."""
+    img = Image.open(open_resource(icon_path)).convert("RGBA")
+    img = img.resize((size, size), Image.Resampling.LANCZOS)
+    if stats:
+        # open, convert and resize
+        stats.count_pil_images(3)
+    return img
+
+
+def _draw_timer_text(img, text: str, font_size: int, outline: bool = True, dim: bool = True):
+    if dim:
+        overlay = Image.new('RGBA', img.size, COOLDOWN_DIM)
+        img = Image.alpha_composite(img, overlay)
+    if not text:
+        return img
+
+    draw = ImageDraw.Draw(img)
+    font = get_timer_font(font_size)
+
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    x = (img.width - text_width) // 2
+    y = (img.height - text_height) // 2
+
+    if outline:
+        for adj_x in [-1, 0, 1]:
+            for adj_y in [-1, 0, 1]:
+                draw.text((x + adj_x, y + adj_y), text, font=font, fill=TIMER_OUTLINE_COLOR)
+
+    draw.text((x, y), text, font=font, fill=COOLDOWN_COLOR)
+    return img
+
+
+def render_champion(base_image, text: Optional[str], ult_available: bool = True, stats=None, outline: bool = True, dim: bool = True):
+    """
+    Render a champion slot frame.
+
+    Args:
+        base_image: RGBA icon at slot size
+        text: Remaining time to draw, or None when the ultimate is ready
+        ult_available: False dims and desaturates the icon (ultimate not learned yet)
+        stats: Optional allocation counter
+        outline: Draw the timer text outline
+        dim: Dim the icon while on cooldown or without an ultimate
+
+    Returns:
+        A new RGBA image; base_image is not modified
+    """
+    img = base_image.copy()
+    created = 1
+
+    if not ult_available and dim:
+        enhancer = ImageEnhance.Color(img)
+        img = enhancer.enhance(UNAVAILABLE_SATURATION)
+        overlay = Image.new('RGBA', img.size, UNAVAILABLE_DIM)
+        img = Image.alpha_composite(img, overlay)
+        created += 3
+
+    if text is not None:
+        img = _draw_timer_text(img, text, CHAMPION_TIMER_FONT_SIZE, outline, dim)
+        created += 2 if dim else 1
+
+    if stats:
+        stats.count_pil_images(created)
+    return img
+
+
+def render_summoner_spell(base_image, text: Optional[str], stats=None, outline: bool = True, dim: bool = True):
+    """
+    Render a summoner spell slot frame.
+
+    Args:
+        base_image: RGBA icon at slot size
+        text: Remaining time to draw, "" for a cooldown without countdown, or None when the spell is ready
+        stats: Optional allocation counter
+        outline: Draw the timer text outline
+        dim: Dim the icon while on cooldown
+
+    Returns:
+        A new RGBA image; base_image is not modified
+    """
+    img = base_image.copy()
+    created = 1
+
+    if text is not None:
+        img = _draw_timer_text(img, text, SUMMONER_TIMER_FONT_SIZE, outline, dim)
+        created += 2 if dim else 1
+
+    if stats:
+        stats.count_pil_images(created)
+    return img
@@ -0,0 +1,165 @@
+"""
+Main-thread stall detector for the overlay application.
+
+The Tk loop posts a heartbeat every `heartbeat_ms` via root.after. A
+watchdog thread checks how long ago the last heartbeat ran; once the gap
+exceeds `threshold` seconds it captures the main thread's stack through
+sys._current_frames(), keeps sampling it while the stall lasts, and records
+the stall duration and the most frequent stacks in a bounded log when the
+loop recovers.
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Deque, List, Optional, Tuple
+from config import STALL_THRESHOLD, STALL_HEARTBEAT_MS, STALL_LOG_SIZE
+from app_logging import get_logger
+import metrics
+
+
+logger = get_logger("stall_detector")
+
+STALLS = metrics.counter("main_thread_stalls_total", "Tk loop stalls longer than the stall threshold")
+STALL_SECONDS = metrics.histogram("main_thread_stall_seconds", "Duration of Tk loop stalls",
+                                  buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+
+MAX_STACK_DEPTH = 12
+
+
+class StallRecord:
+    """One stall: when it started, how long it lasted and where the main thread was."""
+
+    __slots__ = ("started_at", "duration", "stacks", "samples")
+
+    def __init__(self, started_at: float, duration: float, stacks: List[Tuple[Tuple[str, ...], int]], samples: int):
+        self.started_at = started_at
+        self.duration = duration
+        self.stacks = stacks
+        self.samples = samples
+
+    def format(self) -> str:
+        when = time.strftime("%H:%M:%S", time.localtime(self.started_at))
+        lines = [f"{when}  stalled {self.duration * 1000:.0f} ms ({self.samples} samples)"]
+        for stack, count in self.stacks:
+            lines.append(f"  {count}x")
+            lines += [f"    {frame}" for frame in stack]
+        return "\n".join(lines)
+
+
+def _format_stack(frame) -> Tuple[str, ...]:
+    """Innermost-last stack of a frame as 'file:line in function' strings."""
+    summary = traceback.extract_stack(frame)[-MAX_STACK_DEPTH:]
+    return tuple(f"{os.path.basename(entry.filename)}:{entry.lineno} in {entry.name}" for entry in summary)
+
+
+class StallDetector:
+    """
+    Watchdog that reports when the Tk main loop stops processing events.
+
+    start() must be called on the Tk thread; stop() may be called from any
+    thread.
+    """
+
+    def __init__(self, root, threshold: float = STALL_THRESHOLD, heartbeat_ms: int = STALL_HEARTBEAT_MS,
+                 max_records: int = STALL_LOG_SIZE):
+        self.root = root
+        self.threshold = threshold
+        self.heartbeat_ms = heartbeat_ms
+        self.records: Deque[StallRecord] = deque(maxlen=max_records)
+        self.total_stalls = 0
+        self.worst_stall = 0.0
+
+        self._main_thread_id: Optional[int] = None
+        self._last_beat = time.perf_counter()
+        self._after_id = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop_event.clear()
+        self._after_id = self.root.after(self.heartbeat_ms, self._heartbeat)
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self._thread = None
+
+    def _heartbeat(self):
+        self._last_beat = time.perf_counter()
+        try:
+            self._after_id = self.root.after(self.heartbeat_ms, self._heartbeat)
+        except Exception:
+            # The root window is being destroyed.
+            self._after_id = None
+
+    def _gap(self) -> float:
+        """Seconds the current heartbeat is overdue."""
+        return time.perf_counter() - self._last_beat - self.heartbeat_ms / 1000
+
+    def _sample_stack(self) -> Optional[Tuple[str, ...]]:
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return None
+        return _format_stack(frame)
+
+    def _watch(self):
+        check_interval = min(self.threshold / 4, 0.1)
+        while not self._stop_event.wait(check_interval):
+            if self._gap() < self.threshold:
+                continue
+
+            stall_beat = self._last_beat
+            started_at = time.time() - (time.perf_counter() - stall_beat)
+            stacks = Counter()
+            samples = 0
+            # Keep sampling until the loop recovers so the record shows where time went.
+            while self._last_beat == stall_beat and not self._stop_event.is_set():
+                stack = self._sample_stack()
+                if stack:
+                    stacks[stack] += 1
+                    samples += 1
+                self._stop_event.wait(check_interval)
+
+            if self._stop_event.is_set():
+                return
+            duration = self._last_beat - stall_beat - self.heartbeat_ms / 1000
+            self._record(StallRecord(started_at, duration, stacks.most_common(3), samples))
+
+    def _record(self, record: StallRecord):
+        with self._lock:
+            self.records.append(record)
+            self.total_stalls += 1
+            self.worst_stall = max(self.worst_stall, record.duration)
+        STALLS.inc()
+        STALL_SECONDS.observe(record.duration)
+        top = record.stacks[0][0][-1] if record.stacks else "unknown"
+        logger.warning("Main thread stalled for %.0f ms in %s", record.duration * 1000, top, extra={"key": top})
+
+    def format_summary(self) -> str:
+        with self._lock:
+            records = list(self.records)
+            total = self.total_stalls
+            worst = self.worst_stall
+        if not total:
+            return f"No main thread stalls over {self.threshold * 1000:.0f} ms."
+        lines = [f"{total} stalls over {self.threshold * 1000:.0f} ms, worst {worst * 1000:.0f} ms. Most recent first:", ""]
+        for record in reversed(records):
+            lines.append(record.format())
+            lines.append("")
+        return "\n".join(lines)
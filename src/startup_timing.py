@@ -0,0 +1,193 @@
+"""
+Startup timing marks and phase profiling for the overlay application.
+
+This module records named timestamps relative to process start so that
+milestones such as first paint and game data readiness can be reported
+separately. Startup phases are timed with `phase()`; when profiling is
+enabled, the growth of tracemalloc's traced memory over each phase is
+recorded too, and a report can be printed or written as JSON.
+
+Traced memory is process-wide: phases on the Tk thread and the loader
+thread overlap, so a phase's growth includes whatever the other thread
+allocated (or freed) meanwhile.
+"""
+
+import json
+import re
+import subprocess
+import sys
+import time
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+
+PROCESS_START = time.perf_counter()
+
+_marks: Dict[str, float] = {}
+_phases: List[Dict[str, Any]] = []
+_lock = threading.Lock()
+_profiling = False
+
+
+def mark(name: str) -> float:
+    """
+    Record a named startup milestone.
+
+    Only the first occurrence of a name is kept, so repeated calls from
+    update loops do not move the milestone.
+
+    Args:
+        name: Milestone name
+
+    Returns:
+        Milliseconds elapsed since process start for this milestone
+    """
+    now_ms = (time.perf_counter() - PROCESS_START) * 1000
+    with _lock:
+        return _marks.setdefault(name, now_ms)
+
+
+def elapsed_ms(name: str) -> Optional[float]:
+    """Get milliseconds since process start for a recorded milestone."""
+    with _lock:
+        return _marks.get(name)
+
+
+def get_marks() -> Dict[str, float]:
+    """Get a copy of all recorded milestones."""
+    with _lock:
+        return dict(_marks)
+
+
+def enable_profiling():
+    """Start tracing memory growth per phase. Call as early as possible."""
+    global _profiling
+    _profiling = True
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def is_profiling() -> bool:
+    return _profiling
+
+
+@contextmanager
+def phase(name: str):
+    """
+    Time a startup phase.
+
+    Wall time is always recorded; the net growth of traced memory (process
+    wide, see the module docstring) only while profiling is enabled. Only
+    the traced total is read, so a phase does not pause other threads the
+    way a tracemalloc snapshot would.
+
+    Args:
+        name: Phase name shown in the report
+    """
+    tracing = _profiling and tracemalloc.is_tracing()
+    if tracing:
+        traced_before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        record = {
+            "name": name,
+            "thread": threading.current_thread().name,
+            "start_ms": round((start - PROCESS_START) * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3),
+        }
+        if tracing:
+            record["traced_growth_kb"] = round((tracemalloc.get_traced_memory()[0] - traced_before) / 1024, 1)
+        with _lock:
+            _phases.append(record)
+
+
+def get_phases() -> List[Dict[str, Any]]:
+    """Get a copy of all recorded phases in completion order."""
+    with _lock:
+        return [dict(record) for record in _phases]
+
+
+_IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def collect_import_times(module: str, src_path: str, limit: int = 25) -> List[Dict[str, Any]]:
+    """
+    Measure import times of a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Module to import, e.g. "overlay"
+        src_path: Directory to put on sys.path
+        limit: Number of slowest imports (by cumulative time) to return
+
+    Returns:
+        Import records with module name, nesting depth, self and cumulative ms
+    """
+    if getattr(sys, 'frozen', False):
+        # A frozen executable cannot be re-run as a plain interpreter.
+        return []
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, {src_path!r}); import {module}"],
+        capture_output=True,
+        text=True
+    )
+
+    records = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append({
+                "module": name,
+                "depth": len(indent) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            })
+
+    records.sort(key=lambda record: record["cumulative_ms"], reverse=True)
+    return records[:limit]
+
+
+def build_report(import_times: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Assemble milestones, phases and optional import times into a report."""
+    report = {
+        "milestones_ms": {name: round(value, 3) for name, value in get_marks().items()},
+        "phases": get_phases(),
+    }
+    if _profiling and tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report["traced_memory_kb"] = {"current": round(current / 1024, 1), "peak": round(peak / 1024, 1)}
+    if import_times is not None:
+        report["imports"] = import_times
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a startup report as a plain-text table."""
+    lines = ["Startup profile", "", f"{'phase':<28} {'thread':<18} {'start':>9} {'wall':>9} {'mem KB':>9}"]
+    for record in sorted(report["phases"], key=lambda record: record["start_ms"]):
+        growth = record.get("traced_growth_kb", "")
+        lines.append(f"{record['name']:<28} {record['thread'][:18]:<18} {record['start_ms']:>7.1f}ms {record['duration_ms']:>7.1f}ms {growth:>9}")
+    if any("traced_growth_kb" in record for record in report["phases"]):
+        lines.append("mem KB: net growth of traced memory during the phase, process-wide (includes other threads)")
+
+    lines.append("")
+    for name, value in sorted(report["milestones_ms"].items(), key=lambda entry: entry[1]):
+        lines.append(f"{name:<28} {value:>7.1f}ms")
+
+    if "imports" in report:
+        lines += ["", f"{'import':<40} {'self':>9} {'cumulative':>11}"]
+        for record in report["imports"]:
+            lines.append(f"{record['module']:<40} {record['self_ms']:>7.1f}ms {record['cumulative_ms']:>9.1f}ms")
+
+    return "\n".join(lines)
+
+
+def write_report(report: Dict[str, Any], path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
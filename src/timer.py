@@ -2,11 +2,17 @@
 Timer logic for tracking champion ultimate cooldowns.
 
 This module provides timer classes for managing cooldown tracking
-of champion ultimate abilities at different levels.
+of champion ultimate abilities at different levels. Ready alerts are
+scheduled with an alert scheduler (see alert_audio.AlertEngine) whenever a
+timer's deadline changes, rather than polled from the render loop.
+
+Timers read the time from an injectable clock (see clock.py), so start
+times and ready times are on that clock's timeline rather than wall-clock
+time.
 """
 
-import time
 from typing import Optional, Callable
+from clock import SYSTEM_CLOCK
 from haste_calculator import apply_haste
 
 
@@ -18,7 +24,7 @@ class CooldownTimer:
     for a champion's ultimate ability.
     """
 
-    def __init__(self, champion: str, cooldowns: list[float], level: int = 0, on_ready_callback: Optional[Callable] = None, alert_threshold: int = 4, ability_haste: int = 0, ultimate_haste: int = 0):
+    def __init__(self, champion: str, cooldowns: list[float], level: int = 0, alert_threshold: int = 4, ability_haste: int = 0, ultimate_haste: int = 0, clock=SYSTEM_CLOCK):
         self.champion = champion
         self.cooldowns = cooldowns
         self.level = level
@@ -26,14 +32,14 @@ class CooldownTimer:
         self.is_active = False
         self.was_ready = True
         self.sound_played = False
-        self.on_ready_callback = on_ready_callback
         self.alert_threshold = alert_threshold
         self.ability_haste = ability_haste
         self.ultimate_haste = ultimate_haste
+        self.clock = clock
 
     def start(self):
         if not self.is_active and self.cooldowns:
-            self.start_time = time.time()
+            self.start_time = self.clock.now()
             self.is_active = True
             self.was_ready = False
             self.sound_played = False
@@ -51,18 +57,20 @@ class CooldownTimer:
         effective_cd = apply_haste(base_cd, total_haste)
         return effective_cd
 
+    def get_ready_at(self) -> Optional[float]:
+        """Get the clock time at which the active cooldown ends, or None if inactive."""
+        if not self.is_active or self.start_time is None:
+            return None
+        return self.start_time + self.get_current_cooldown()
+
     def get_remaining_time(self) -> float:
         if not self.is_active or self.start_time is None:
             return 0.0
 
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock.now() - self.start_time
         cooldown = self.get_current_cooldown()
         remaining = cooldown - elapsed
 
-        if remaining <= self.alert_threshold and not self.sound_played and self.on_ready_callback:
-            self.on_ready_callback()
-            self.sound_played = True
-
         if remaining <= 0:
             self.reset()
             self.was_ready = True
@@ -81,26 +89,29 @@ class CooldownTimer:
         self.level = (self.level + 1) % min(3, len(self.cooldowns))
 
     def update_haste(self, ability_haste: int, ultimate_haste: int):
-        if not self.is_active or self.start_time is None:
-            self.ability_haste = ability_haste
-            self.ultimate_haste = ultimate_haste
-            return
+        old_cooldown = self.get_current_cooldown()
+        self.ability_haste = ability_haste
+        self.ultimate_haste = ultimate_haste
+        self._preserve_progress(old_cooldown)
 
+    def update_cooldowns(self, cooldowns: list[float]):
         old_cooldown = self.get_current_cooldown()
-        if old_cooldown <= 0:
-            self.ability_haste = ability_haste
-            self.ultimate_haste = ultimate_haste
+        self.cooldowns = cooldowns
+        if cooldowns and self.level >= len(cooldowns):
+            self.level = len(cooldowns) - 1
+        self._preserve_progress(old_cooldown)
+
+    def _preserve_progress(self, old_cooldown: float):
+        """Shift start_time so an active timer keeps its relative progress under a new cooldown."""
+        if not self.is_active or self.start_time is None or old_cooldown <= 0:
             return
 
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock.now() - self.start_time
         progress = elapsed / old_cooldown
 
-        self.ability_haste = ability_haste
-        self.ultimate_haste = ultimate_haste
-
         new_cooldown = self.get_current_cooldown()
         new_elapsed = new_cooldown * progress
-        self.start_time = time.time() - new_elapsed
+        self.start_time = self.clock.now() - new_elapsed
 
     def format_time(self) -> str:
         if self.is_ready():
@@ -123,27 +134,34 @@ class SummonerSpellTimer:
     Tracks cooldown state and remaining time for a summoner spell.
     """
 
-    def __init__(self, spell: str, cooldown: float, summoner_haste: int = 0):
+    def __init__(self, spell: str, cooldown: float, summoner_haste: int = 0, clock=SYSTEM_CLOCK):
         self.spell = spell
         self.cooldown = cooldown
         self.summoner_haste = summoner_haste
         self.start_time: Optional[float] = None
         self.is_active = False
+        self.clock = clock
 
     def start(self):
         if not self.is_active:
-            self.start_time = time.time()
+            self.start_time = self.clock.now()
             self.is_active = True
 
     def reset(self):
         self.start_time = None
         self.is_active = False
 
+    def get_ready_at(self) -> Optional[float]:
+        """Get the clock time at which the active cooldown ends, or None if inactive."""
+        if not self.is_active or self.start_time is None:
+            return None
+        return self.start_time + apply_haste(self.cooldown, self.summoner_haste)
+
     def get_remaining_time(self) -> float:
         if not self.is_active or self.start_time is None:
             return 0.0
 
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock.now() - self.start_time
         effective_cd = apply_haste(self.cooldown, self.summoner_haste)
         remaining = effective_cd - elapsed
 
@@ -157,23 +175,26 @@ class SummonerSpellTimer:
         return not self.is_active or self.get_remaining_time() <= 0
 
     def update_haste(self, summoner_haste: int):
-        if not self.is_active or self.start_time is None:
-            self.summoner_haste = summoner_haste
-            return
+        old_cooldown = apply_haste(self.cooldown, self.summoner_haste)
+        self.summoner_haste = summoner_haste
+        self._preserve_progress(old_cooldown)
 
+    def update_cooldown(self, cooldown: float):
         old_cooldown = apply_haste(self.cooldown, self.summoner_haste)
-        if old_cooldown <= 0:
-            self.summoner_haste = summoner_haste
+        self.cooldown = cooldown
+        self._preserve_progress(old_cooldown)
+
+    def _preserve_progress(self, old_cooldown: float):
+        """Shift start_time so an active timer keeps its relative progress under a new cooldown."""
+        if not self.is_active or self.start_time is None or old_cooldown <= 0:
             return
 
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock.now() - self.start_time
         progress = elapsed / old_cooldown
 
-        self.summoner_haste = summoner_haste
-
         new_cooldown = apply_haste(self.cooldown, self.summoner_haste)
         new_elapsed = new_cooldown * progress
-        self.start_time = time.time() - new_elapsed
+        self.start_time = self.clock.now() - new_elapsed
 
     def format_time(self) -> str:
         if self.is_ready():
@@ -190,19 +211,30 @@ class SummonerSpellTimer:
 
 
 class TimerManager:
-    """Manages multiple champion timers."""
+    """
+    Manages multiple champion timers.
 
-    def __init__(self):
+    When an alert scheduler is given, ultimate alerts are scheduled
+    `alert_threshold` seconds before each ultimate is ready and rescheduled
+    whenever the timer's deadline changes. Summoner spells only alert when
+    the scheduler has a voice cue for the spell.
+    """
+
+    def __init__(self, alert_scheduler=None, clock=SYSTEM_CLOCK):
         self.timers: dict[int, Optional[CooldownTimer]] = {}
         self.summoner_spell_timers: dict[tuple[int, int], Optional[SummonerSpellTimer]] = {}
         self.update_callbacks: list[Callable] = []
+        self.alert_scheduler = alert_scheduler
+        self.clock = clock
 
-    def create_timer(self, slot: int, champion: str, cooldowns: list[float], level: int = 0, on_ready_callback: Optional[Callable] = None, alert_threshold: int = 4, ability_haste: int = 0, ultimate_haste: int = 0):
-        self.timers[slot] = CooldownTimer(champion, cooldowns, level, on_ready_callback, alert_threshold, ability_haste, ultimate_haste)
+    def create_timer(self, slot: int, champion: str, cooldowns: list[float], level: int = 0, alert_threshold: int = 4, ability_haste: int = 0, ultimate_haste: int = 0):
+        self.timers[slot] = CooldownTimer(champion, cooldowns, level, alert_threshold, ability_haste, ultimate_haste, self.clock)
+        self._schedule_alert(slot)
 
     def remove_timer(self, slot: int):
         if slot in self.timers:
             del self.timers[slot]
+        self._schedule_alert(slot)
 
     def get_timer(self, slot: int) -> Optional[CooldownTimer]:
         return self.timers.get(slot)
@@ -211,26 +243,60 @@ class TimerManager:
         timer = self.get_timer(slot)
         if timer:
             timer.start()
+            self._schedule_alert(slot)
             self._notify_update()
 
     def reset_timer(self, slot: int):
         timer = self.get_timer(slot)
         if timer:
             timer.reset()
+            self._schedule_alert(slot)
             self._notify_update()
 
     def set_level(self, slot: int, level: int):
         timer = self.get_timer(slot)
         if timer:
             timer.set_level(level)
+            self._schedule_alert(slot)
             self._notify_update()
 
     def increment_level(self, slot: int):
         timer = self.get_timer(slot)
         if timer:
             timer.increment_level()
+            self._schedule_alert(slot)
             self._notify_update()
 
+    def update_haste(self, slot: int, ability_haste: int, ultimate_haste: int):
+        timer = self.get_timer(slot)
+        if timer:
+            timer.update_haste(ability_haste, ultimate_haste)
+            self._schedule_alert(slot)
+
+    def update_cooldowns(self, slot: int, cooldowns: list[float]):
+        timer = self.get_timer(slot)
+        if timer:
+            timer.update_cooldowns(cooldowns)
+            self._schedule_alert(slot)
+
+    def restore_timer(self, slot: int, level: int, is_active: bool, start_time: Optional[float], sound_played: bool = False):
+        """Restore a timer's saved state, e.g. after its slot widget was rebuilt."""
+        timer = self.get_timer(slot)
+        if timer:
+            timer.level = level
+            timer.is_active = is_active
+            timer.start_time = start_time
+            timer.sound_played = sound_played
+            self._schedule_alert(slot)
+
+    def set_alert_threshold(self, alert_threshold: int):
+        """Change the alert lead time; timers that have not alerted yet are rescheduled."""
+        for slot, timer in self.timers.items():
+            if timer and timer.alert_threshold != alert_threshold:
+                timer.alert_threshold = alert_threshold
+                if not timer.sound_played:
+                    self._schedule_alert(slot)
+
     def register_update_callback(self, callback: Callable):
         self.update_callbacks.append(callback)
 
@@ -241,13 +307,41 @@ class TimerManager:
     def update(self):
         self._notify_update()
 
+    def _schedule_alert(self, slot: int):
+        if not self.alert_scheduler:
+            return
+        key = ("ult", slot)
+        timer = self.get_timer(slot)
+        ready_at = timer.get_ready_at() if timer else None
+        if ready_at is None or timer.sound_played or ready_at <= self.clock.now():
+            self.alert_scheduler.cancel(key)
+            return
+
+        def on_fire():
+            timer.sound_played = True
+
+        self.alert_scheduler.schedule(key, ready_at - timer.alert_threshold, cue=timer.champion, on_fire=on_fire)
+
+    def _schedule_summoner_spell_alert(self, slot: int, spell_slot: int):
+        if not self.alert_scheduler:
+            return
+        key = ("spell", slot, spell_slot)
+        timer = self.get_summoner_spell_timer(slot, spell_slot)
+        ready_at = timer.get_ready_at() if timer else None
+        if ready_at is None or ready_at <= self.clock.now():
+            self.alert_scheduler.cancel(key)
+            return
+        self.alert_scheduler.schedule(key, ready_at, cue=timer.spell, fallback=False)
+
     def create_summoner_spell_timer(self, slot: int, spell_slot: int, spell: str, cooldown: float, summoner_haste: int = 0):
-        self.summoner_spell_timers[(slot, spell_slot)] = SummonerSpellTimer(spell, cooldown, summoner_haste)
+        self.summoner_spell_timers[(slot, spell_slot)] = SummonerSpellTimer(spell, cooldown, summoner_haste, self.clock)
+        self._schedule_summoner_spell_alert(slot, spell_slot)
 
     def remove_summoner_spell_timer(self, slot: int, spell_slot: int):
         key = (slot, spell_slot)
         if key in self.summoner_spell_timers:
             del self.summoner_spell_timers[key]
+        self._schedule_summoner_spell_alert(slot, spell_slot)
 
     def get_summoner_spell_timer(self, slot: int, spell_slot: int) -> Optional[SummonerSpellTimer]:
         return self.summoner_spell_timers.get((slot, spell_slot))
@@ -256,10 +350,31 @@ class TimerManager:
         timer = self.get_summoner_spell_timer(slot, spell_slot)
         if timer:
             timer.start()
+            self._schedule_summoner_spell_alert(slot, spell_slot)
             self._notify_update()
 
     def reset_summoner_spell_timer(self, slot: int, spell_slot: int):
         timer = self.get_summoner_spell_timer(slot, spell_slot)
         if timer:
             timer.reset()
-            self._notify_update()
\ No newline at end of file
+            self._schedule_summoner_spell_alert(slot, spell_slot)
+            self._notify_update()
+
+    def restore_summoner_spell_timer(self, slot: int, spell_slot: int, is_active: bool, start_time: Optional[float]):
+        timer = self.get_summoner_spell_timer(slot, spell_slot)
+        if timer:
+            timer.is_active = is_active
+            timer.start_time = start_time
+            self._schedule_summoner_spell_alert(slot, spell_slot)
+
+    def update_summoner_haste(self, slot: int, spell_slot: int, summoner_haste: int):
+        timer = self.get_summoner_spell_timer(slot, spell_slot)
+        if timer:
+            timer.update_haste(summoner_haste)
+            self._schedule_summoner_spell_alert(slot, spell_slot)
+
+    def update_summoner_cooldown(self, slot: int, spell_slot: int, cooldown: float):
+        timer = self.get_summoner_spell_timer(slot, spell_slot)
+        if timer:
+            timer.update_cooldown(cooldown)
+            self._schedule_summoner_spell_alert(slot, spell_slot)
@@ -0,0 +1,166 @@
+"""
+Staleness tracing for the overlay application.
+
+A trace follows one piece of game data from the Live Client API request to
+the frame that shows it:
+
+    start -> api_response -> parsed -> posted -> applied -> timers_updated -> rendered
+
+Each stage records a monotonic timestamp. Finished traces feed per-stage
+latency histograms in the metrics registry and a bounded buffer that can be
+exported in Chrome trace format (open in chrome://tracing or Perfetto).
+
+The trace being built on a thread is kept in a thread-local, so the
+auto-loader can start one and the overlay callback running on the same
+thread can pick it up and hand it to the UI dispatcher.
+
+Usage:
+    trace = tracing.start("level_update")
+    trace.mark("api_response")
+    ...
+    trace.finish("rendered")
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+from config import TRACING_ENABLED, TRACE_BUFFER_SIZE
+import metrics
+
+
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+STAGE_SECONDS = metrics.histogram("trace_stage_seconds", "Time from the previous stage to this one", ("kind", "stage"), STAGE_BUCKETS)
+STALENESS_SECONDS = metrics.histogram("trace_staleness_seconds", "Time from the API response to the frame showing it", ("kind",), STAGE_BUCKETS)
+
+
+class Trace:
+    """Timestamps of one update moving through the pipeline."""
+
+    __slots__ = ("trace_id", "kind", "marks", "finished")
+
+    def __init__(self, trace_id: int, kind: str):
+        self.trace_id = trace_id
+        self.kind = kind
+        self.marks: List[Tuple[str, float]] = [("start", time.perf_counter())]
+        self.finished = False
+
+    def set_kind(self, kind: str):
+        self.kind = kind
+
+    def mark(self, stage: str):
+        self.marks.append((stage, time.perf_counter()))
+
+    def finish(self, stage: str = "rendered"):
+        if self.finished:
+            return
+        self.mark(stage)
+        self.finished = True
+        _record(self)
+
+    def stage_durations(self) -> List[Tuple[str, float]]:
+        return [(stage, end - start) for (_, start), (stage, end) in zip(self.marks, self.marks[1:])]
+
+
+class _NullTrace:
+    """Stand-in used when tracing is disabled; every method is a no-op."""
+
+    __slots__ = ()
+    kind = ""
+    finished = True
+
+    def set_kind(self, kind: str):
+        pass
+
+    def mark(self, stage: str):
+        pass
+
+    def finish(self, stage: str = "rendered"):
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+_enabled = TRACING_ENABLED
+_local = threading.local()
+_id_lock = threading.Lock()
+_next_id = 0
+_finished: Deque[Trace] = deque(maxlen=TRACE_BUFFER_SIZE)
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = enabled
+
+
+def set_buffer_size(size: int):
+    """Keep at most `size` finished traces, dropping the oldest."""
+    global _finished
+    _finished = deque(_finished, maxlen=size)
+
+
+def start(kind: str):
+    """Begin a trace and make it the current trace of this thread."""
+    global _next_id
+    if not _enabled:
+        return NULL_TRACE
+    with _id_lock:
+        _next_id += 1
+        trace = Trace(_next_id, kind)
+    _local.trace = trace
+    return trace
+
+
+def current():
+    """The trace most recently started on this thread, or the null trace."""
+    return getattr(_local, "trace", None) or NULL_TRACE
+
+
+def _record(trace: Trace):
+    for stage, duration in trace.stage_durations():
+        STAGE_SECONDS.labels(trace.kind, stage).observe(duration)
+
+    stamps = dict(trace.marks)
+    if "api_response" in stamps:
+        STALENESS_SECONDS.labels(trace.kind).observe(trace.marks[-1][1] - stamps["api_response"])
+    _finished.append(trace)
+
+
+def finished_traces() -> List[Trace]:
+    return list(_finished)
+
+
+def to_chrome_trace(traces: Optional[List[Trace]] = None) -> dict:
+    """
+    Build a Chrome trace (JSON object format) with one row per trace kind.
+
+    Each stage is a complete ("X") event spanning from the previous mark.
+    """
+    traces = finished_traces() if traces is None else traces
+    pid = os.getpid()
+    kinds = {}
+    events = []
+    for trace in traces:
+        tid = kinds.setdefault(trace.kind, len(kinds) + 1)
+        for (_, start), (stage, end) in zip(trace.marks, trace.marks[1:]):
+            events.append({
+                "name": stage,
+                "cat": trace.kind,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {"trace_id": trace.trace_id}
+            })
+    for kind, tid in kinds.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": kind}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(to_chrome_trace(), f)
@@ -0,0 +1,174 @@
+"""
+Main-thread dispatch queue for the overlay application.
+
+Background threads (auto-loader, tray icon, data watcher) must not touch Tk
+directly. They post callables to a UIDispatcher, which the Tk loop drains
+in bounded batches. Posts with a topic are coalesced so only the newest
+pending event per topic is applied, and the dispatcher reports when the UI
+is falling behind so producers can back off. Queue depth and dispatch
+latency are exported as metrics.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+from app_logging import get_logger
+from config import UI_DISPATCH_INTERVAL_MS, UI_DISPATCH_MAX_BATCH, UI_DISPATCH_HIGH_WATER, UI_DISPATCH_MAX_LATENCY
+import metrics
+
+
+logger = get_logger("ui_dispatch")
+
+QUEUE_DEPTH = metrics.gauge("ui_dispatch_queue_depth", "Events waiting to run on the Tk thread")
+DISPATCH_LATENCY = metrics.histogram("ui_dispatch_latency_seconds", "Time from post() until the event runs on the Tk thread")
+
+
+class _Event:
+    __slots__ = ("callback", "args", "topic", "posted_at", "cancelled")
+
+    def __init__(self, callback: Callable, args: tuple, topic: Optional[str], posted_at: float):
+        self.callback = callback
+        self.args = args
+        self.topic = topic
+        self.posted_at = posted_at
+        self.cancelled = False
+
+
+class UIDispatcher:
+    """
+    Thread-safe queue of callables run on the Tk thread.
+
+    post() may be called from any thread; the queue is drained every
+    `interval_ms` milliseconds on the Tk thread, at most `max_batch` events
+    per drain.
+    """
+
+    def __init__(self, root, interval_ms: int = UI_DISPATCH_INTERVAL_MS, max_batch: int = UI_DISPATCH_MAX_BATCH,
+                 high_water: int = UI_DISPATCH_HIGH_WATER, max_latency: float = UI_DISPATCH_MAX_LATENCY):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.max_batch = max_batch
+        self.high_water = high_water
+        self.max_latency = max_latency
+
+        self._queue: Deque[_Event] = deque()
+        self._topics: Dict[str, _Event] = {}
+        self._depth = 0
+        self._lock = threading.Lock()
+        self._after_id = None
+
+        self.posted = 0
+        self.dispatched = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.max_latency_seen = 0.0
+        self._latencies: Deque[float] = deque(maxlen=256)
+
+    def start(self):
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def post(self, callback: Callable, *args, topic: Optional[str] = None):
+        """
+        Queue a callable to run on the Tk thread.
+
+        Args:
+            callback: Function to call
+            *args: Arguments passed to the callback
+            topic: If given, replaces any pending event with the same topic
+        """
+        event = _Event(callback, args, topic, time.perf_counter())
+        with self._lock:
+            if topic is not None:
+                pending = self._topics.get(topic)
+                if pending is not None:
+                    pending.cancelled = True
+                    self._depth -= 1
+                    self.coalesced += 1
+                self._topics[topic] = event
+            self._queue.append(event)
+            self._depth += 1
+            self.posted += 1
+            self.max_depth = max(self.max_depth, self._depth)
+            QUEUE_DEPTH.set(self._depth)
+
+    def depth(self) -> int:
+        with self._lock:
+            return self._depth
+
+    def is_behind(self) -> bool:
+        """True when events are piling up or waiting longer than `max_latency`."""
+        with self._lock:
+            if self._depth >= self.high_water:
+                return True
+            for event in self._queue:
+                if not event.cancelled:
+                    return time.perf_counter() - event.posted_at > self.max_latency
+        return False
+
+    def run_pending(self, limit: Optional[int] = None) -> int:
+        """Run up to `limit` queued events on the calling (Tk) thread and return how many ran."""
+        limit = self.max_batch if limit is None else limit
+        ran = 0
+        while ran < limit:
+            with self._lock:
+                if not self._queue:
+                    break
+                event = self._queue.popleft()
+                if event.cancelled:
+                    continue
+                self._depth -= 1
+                QUEUE_DEPTH.set(self._depth)
+                if event.topic is not None and self._topics.get(event.topic) is event:
+                    del self._topics[event.topic]
+
+            latency = time.perf_counter() - event.posted_at
+            DISPATCH_LATENCY.observe(latency)
+            self._latencies.append(latency)
+            self.max_latency_seen = max(self.max_latency_seen, latency)
+            try:
+                event.callback(*event.args)
+            except Exception as e:
+                self.errors += 1
+                logger.error("Error in UI dispatch (%s): %s", getattr(event.callback, '__name__', event.callback), e)
+            self.dispatched += 1
+            ran += 1
+        return ran
+
+    def _drain(self):
+        self._after_id = None
+        self.run_pending()
+        try:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+        except Exception:
+            # The root window is being destroyed.
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+        return {
+            "depth": self.depth(),
+            "max_depth": self.max_depth,
+            "posted": self.posted,
+            "dispatched": self.dispatched,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "latency_p95_ms": round(p95 * 1000, 2),
+            "latency_max_ms": round(self.max_latency_seen * 1000, 2),
+        }
+
+    def format_stats(self) -> str:
+        stats = self.stats()
+        return (f"UI dispatch: {stats['dispatched']} dispatched, {stats['coalesced']} coalesced, "
+                f"max depth {stats['max_depth']}, latency p95 {stats['latency_p95_ms']} ms, max {stats['latency_max_ms']} ms")
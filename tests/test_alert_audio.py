@@ -0,0 +1,60 @@
+"""
+AlertEngine on a VirtualClock: alerts fire when the clock is advanced past
+their deadline, not after the same number of real seconds.
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from alert_audio import AlertEngine
+from clock import VirtualClock
+
+
+@pytest.fixture
+def engine():
+    clock = VirtualClock()
+    engine = AlertEngine(enabled=False, voice_cue_dir=None, clock=clock)
+    engine.fired = []
+    engine.start()
+    yield engine
+    engine.stop()
+
+
+def schedule(engine, key, deadline):
+    fired = threading.Event()
+
+    def on_fire():
+        engine.fired.append((key, engine.clock.now()))
+        fired.set()
+
+    engine.schedule(key, deadline, on_fire=on_fire)
+    return fired
+
+
+def test_alert_fires_when_clock_advances(engine):
+    fired = schedule(engine, "ult", 30.0)
+    assert not fired.wait(0.2)
+    engine.clock.advance(29.0)
+    assert not fired.wait(0.2)
+    engine.clock.advance(1.0)
+    assert fired.wait(2)
+    assert engine.fired == [("ult", 30.0)]
+
+
+def test_rescheduled_alert_uses_new_deadline(engine):
+    first = schedule(engine, "ult", 30.0)
+    assert not first.wait(0.1)
+    second = schedule(engine, "ult", 10.0)
+    engine.clock.advance(10.0)
+    assert second.wait(2)
+    engine.clock.advance(30.0)
+    assert not first.wait(0.2)
+    assert engine.fired == [("ult", 10.0)]
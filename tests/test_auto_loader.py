@@ -0,0 +1,78 @@
+"""
+Game end detection in GameAutoLoader: polls without a snapshot end the game
+only after GAME_END_CONFIRM_POLLS of them in a row and only when gamestats
+does not answer either.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from auto_loader import GameAutoLoader
+from live_client_api import LiveClientAPI
+from live_client_standin import GameScript
+
+
+class FakeLiveClient(LiveClientAPI):
+    """LiveClientAPI serving a fixed snapshot; no requests are made."""
+
+    def __init__(self):
+        super().__init__()
+        self.snapshot = GameScript(0).snapshot(0, 0.5)
+        self.game_running = True
+        self.gamestats_requests = 0
+
+    def get_all_game_data(self):
+        return self.snapshot
+
+    def is_game_active(self):
+        self.gamestats_requests += 1
+        return self.game_running
+
+
+@pytest.fixture
+def loader():
+    loader = GameAutoLoader(game_end_polls=2)
+    loader.api = FakeLiveClient()
+    loader.events = []
+    loader.set_callbacks(lambda team: loader.events.append("start"), lambda: loader.events.append("end"),
+                         lambda levels: loader.events.append("levels"))
+    loader._poll()
+    assert loader.events == ["start"]
+    return loader
+
+
+def test_single_missed_snapshot_keeps_game(loader):
+    loader.api.snapshot, snapshot = None, loader.api.snapshot
+    loader._poll()
+    loader.api.snapshot = snapshot
+    loader._poll()
+    assert loader.events == ["start", "levels"]
+    assert loader.game_active
+    assert loader.missed_polls == 0
+    assert loader.api.gamestats_requests == 0
+
+
+def test_missed_snapshots_with_running_game_keep_game(loader):
+    loader.api.snapshot = None
+    for _ in range(4):
+        loader._poll()
+    assert loader.events == ["start"]
+    assert loader.game_active
+    assert loader.api.gamestats_requests == 3
+
+
+def test_game_ends_after_confirmed_misses(loader):
+    loader.api.snapshot = None
+    loader.api.game_running = False
+    loader._poll()
+    assert loader.events == ["start"]
+    loader._poll()
+    assert loader.events == ["start", "end"]
+    assert not loader.game_active
+    assert loader.missed_polls == 0
@@ -0,0 +1,33 @@
+"""
+FrameStats history: per-second rows are only built while recording.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from frame_stats import FrameStats
+
+
+def end_second(stats: FrameStats) -> bool:
+    stats.record("frame", 0.004)
+    stats._period_start -= 1.0
+    return stats.end_frame()
+
+
+def test_rates_without_history_when_not_recording():
+    stats = FrameStats()
+    assert end_second(stats)
+    assert stats.rates["fps"] > 0
+    assert len(stats.history) == 0
+
+
+def test_history_rows_while_recording():
+    stats = FrameStats()
+    stats.recording = True
+    end_second(stats)
+    end_second(stats)
+    assert len(stats.history) == 2
+    assert stats.history[-1]["frame_p95_ms"] == 4.0
@@ -0,0 +1,31 @@
+"""
+diff_items: entries of an older table without "modes" only report haste and
+name changes.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from item_data_compiler import diff_items
+
+OLD = {"3158": {"name": "Ionian Boots of Lucidity", "ability_haste": 0, "summoner_haste": 12, "ultimate_haste": 0},
+       "3110": {"name": "Frozen Heart", "ability_haste": 20, "summoner_haste": 0, "ultimate_haste": 0},
+       "6653": {"name": "Liandry's Torment", "ability_haste": 15, "summoner_haste": 0, "ultimate_haste": 0}}
+
+
+def new_entry(entry, **changes):
+    return dict(entry, modes=["CLASSIC"], **changes)
+
+
+def test_missing_modes_are_not_a_change():
+    new = {"3158": new_entry(OLD["3158"], summoner_haste=10), "3110": new_entry(OLD["3110"])}
+    assert diff_items(OLD, new) == ["~ 3158 Ionian Boots of Lucidity: summoner_haste 12 -> 10", "- 6653 Liandry's Torment"]
+
+
+def test_mode_changes_are_reported_when_recorded():
+    old = {"3110": new_entry(OLD["3110"])}
+    new = {"3110": dict(old["3110"], modes=["ARAM", "CLASSIC"])}
+    assert diff_items(old, new) == ["~ 3110 Frozen Heart: modes ['CLASSIC'] -> ['ARAM', 'CLASSIC']"]
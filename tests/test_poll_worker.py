@@ -0,0 +1,76 @@
+"""
+Poll worker restarts: a worker started while the ring holds a game in
+progress publishes level updates for that game instead of starting it over.
+"""
+
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import auto_loader
+from live_client_api import LiveClientAPI
+from live_client_standin import GameScript
+from poll_worker import SnapshotRing, _worker_main, ring_size
+
+RING_SLOTS = 4
+TEAM = [{"champion": "Ahri", "spell1": "Flash", "spell2": "Ignite", "level": 0,
+         "summoner_haste": 0, "ability_haste": 0, "ultimate_haste": 0}]
+
+
+class ScriptedLiveClient(LiveClientAPI):
+    """LiveClientAPI serving one GameScript snapshot; no requests are made."""
+
+    def get_all_game_data(self):
+        return GameScript(0).snapshot(0, 0.5)
+
+
+@pytest.fixture
+def ring():
+    shm = shared_memory.SharedMemory(create=True, size=ring_size(RING_SLOTS))
+    shm.buf[:] = bytes(shm.size)
+    ring = SnapshotRing(shm.buf, RING_SLOTS)
+    yield shm.name, ring
+    ring.buffer = None
+    shm.close()
+    shm.unlink()
+
+
+def run_worker(monkeypatch, shm_name, ring, after_seq):
+    """Run _worker_main in a thread until it published past `after_seq`; returns that snapshot."""
+    monkeypatch.setattr(auto_loader, "LiveClientAPI", ScriptedLiveClient)
+    stop_flag = SimpleNamespace(value=0)
+    worker = threading.Thread(target=_worker_main, args=(shm_name, SimpleNamespace(value=60.0), stop_flag, RING_SLOTS))
+    worker.start()
+    try:
+        deadline = time.time() + 5
+        while ring.latest_seq() <= after_seq and time.time() < deadline:
+            time.sleep(0.01)
+        return ring.read_latest()
+    finally:
+        stop_flag.value = 1
+        worker.join(5)
+
+
+def test_fresh_worker_starts_new_generation(monkeypatch, ring):
+    shm_name, ring = ring
+    ring.publish(False, 4, [])
+    seq, game_active, generation, records = run_worker(monkeypatch, shm_name, ring, 1)
+    assert (seq, game_active, generation) == (2, True, 5)
+    assert len(records) == 5
+
+
+def test_restarted_worker_resumes_game(monkeypatch, ring):
+    shm_name, ring = ring
+    ring.publish(True, 4, TEAM)
+    seq, game_active, generation, records = run_worker(monkeypatch, shm_name, ring, 1)
+    assert (seq, game_active, generation) == (2, True, 4)
+    assert records[0]["champion"] == "Ahri"
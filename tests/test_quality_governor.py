@@ -0,0 +1,78 @@
+"""
+QualityGovernor on a VirtualClock with a scripted frame cost per tier.
+
+Frame costs follow measurements of the overlay: at full quality and at the
+reduced rate a frame costs ~12 ms when the timer text changes (once a
+second) and ~1 ms otherwise; without outlines it is ~2 ms.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from clock import VirtualClock
+from quality_governor import QualityGovernor
+
+# Tier level -> (seconds when the text changes, seconds otherwise)
+FRAME_COSTS = {0: (0.012, 0.001), 1: (0.012, 0.001), 2: (0.002, 0.0005), 3: (0.0015, 0.0004), 4: (0.0008, 0.0003)}
+
+
+class Overlay:
+    """Drives a governor like the update loop does, charging each frame's cost as CPU time."""
+
+    def __init__(self, **kwargs):
+        self.clock = VirtualClock()
+        self.cpu = 0.0
+        self.slowdown = 1.0
+        self.governor = QualityGovernor(clock=self.clock, cpu_time=lambda: self.cpu, **kwargs)
+        self.changes = []
+        self._second = -1
+
+    def run(self, seconds: float):
+        end = self.clock.now() + seconds
+        while self.clock.now() < end:
+            self.clock.advance(self.governor.tier.redraw_interval)
+            second = int(self.clock.now())
+            changed, self._second = second != self._second, second
+            frame = FRAME_COSTS[self.governor.tier.level][0 if changed else 1] * self.slowdown
+            self.cpu += frame
+            if self.governor.record_frame(frame):
+                self.changes.append((self.clock.now(), self.governor.tier.level))
+
+
+def test_default_budget_keeps_full_quality():
+    overlay = Overlay()
+    overlay.run(600)
+    assert overlay.changes == []
+    assert overlay.governor.tier.level == 0
+
+
+def test_tight_budget_does_not_flap():
+    overlay = Overlay(frame_budget_ms=8.0)
+    overlay.run(747)
+    # Without hysteresis this switched between tiers 1 and 2 every ~14 s.
+    assert len(overlay.changes) <= 8
+    assert overlay.governor.tier.level == 2
+    retries = [at for at, level in overlay.changes if level == 1][1:]
+    gaps = [later - earlier for earlier, later in zip(retries, retries[1:])]
+    assert gaps == sorted(gaps)
+
+
+def test_returns_to_full_quality_after_pressure():
+    overlay = Overlay()
+    overlay.slowdown = 3.0
+    overlay.run(120)
+    assert overlay.governor.tier.level >= 2
+    overlay.slowdown = 1.0
+    overlay.run(600)
+    assert overlay.governor.tier.level == 0
+
+
+def test_override_fixes_tier():
+    overlay = Overlay(frame_budget_ms=8.0)
+    overlay.governor.set_override(0)
+    overlay.run(120)
+    assert overlay.changes == []
+    assert overlay.governor.tier.level == 0
@@ -0,0 +1,82 @@
+"""
+Round trip of the packaged resource archive: files packed with
+pack_resources() behind an executable-like prefix are read back unchanged
+through ResourceArchive and through open_resource()/read_resource().
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import resources
+from config import RESOURCE_BASE_PATH
+from resources import RESOURCE_ARCHIVE_ENV, ResourceArchive, collect_resource_files, open_resource, pack_resources, read_resource
+
+EXE_PREFIX = b"\x7fELF" + b"\0" * 4092
+PACKED = ["data/sounds/ult_ready.wav", "data/icons/summoner_spells"]
+
+
+@pytest.fixture
+def fake_exe(tmp_path):
+    """An executable stand-in with the real resources and one archive-only file appended."""
+    extra = tmp_path / "base" / "data" / "archive_only" / "note.txt"
+    extra.parent.mkdir(parents=True)
+    extra.write_bytes(b"only in the archive")
+
+    exe = tmp_path / "Spell-Tracker"
+    exe.write_bytes(EXE_PREFIX)
+    files = collect_resource_files(PACKED, RESOURCE_BASE_PATH)
+    with open(exe, 'r+b') as f:
+        f.seek(0, 2)
+        pack_resources(f, files, RESOURCE_BASE_PATH)
+    with open(exe, 'r+b') as f:
+        f.seek(0, 2)
+        pack_resources(f, ["data/archive_only/note.txt"], str(tmp_path / "base"))
+    return exe, files
+
+
+@pytest.fixture
+def use_archive(fake_exe, monkeypatch):
+    exe, files = fake_exe
+    monkeypatch.setenv(RESOURCE_ARCHIVE_ENV, str(exe))
+    monkeypatch.setattr(resources, "_archive", None)
+    monkeypatch.setattr(resources, "_archive_checked", False)
+    yield exe, files
+    if resources._archive:
+        resources._archive.close()
+
+
+def test_archive_round_trip(fake_exe):
+    exe, files = fake_exe
+    assert exe.read_bytes().startswith(EXE_PREFIX)
+
+    archive = ResourceArchive(str(exe))
+    try:
+        assert set(archive.names()) == set(files) | {"data/archive_only/note.txt"}
+        for name in files:
+            original = (Path(RESOURCE_BASE_PATH) / name).read_bytes()
+            assert archive.size(name) == len(original)
+            assert archive.read(name) == original
+    finally:
+        archive.close()
+
+
+def test_open_resource_reads_from_archive(use_archive):
+    exe, files = use_archive
+    assert resources.get_archive().path == str(exe)
+
+    with open_resource("data/archive_only/note.txt") as f:
+        assert f.read() == b"only in the archive"
+
+    sound = Path(RESOURCE_BASE_PATH) / "data/sounds/ult_ready.wav"
+    assert read_resource(str(sound)) == sound.read_bytes()
+    assert resources.resource_size("data/archive_only/note.txt") == len(b"only in the archive")
+
+
+def test_missing_resource_raises(use_archive):
+    with pytest.raises(FileNotFoundError):
+        read_resource("data/archive_only/missing.txt")
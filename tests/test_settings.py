@@ -0,0 +1,117 @@
+"""
+SettingsStore: patches apply in memory at once, bursts of updates coalesce
+into one atomic write, and flush()/close() write pending changes.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import settings
+from config import SOUND_VOLUME
+from settings import SettingsStore, load_settings
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Count settings file writes."""
+    calls = []
+    write = settings.write_settings_file
+
+    def counting_write(settings_file, values):
+        calls.append(dict(values))
+        write(settings_file, values)
+
+    monkeypatch.setattr(settings, "write_settings_file", counting_write)
+    return calls
+
+
+def read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_patch_applies_in_memory_and_keeps_other_keys(tmp_path, writes):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"layout": "horizontal", "locked": True}), encoding="utf-8")
+    store = SettingsStore(path, write_delay=60)
+    store.update(ui_scale=1.3)
+    assert store.get("ui_scale") == 1.3
+    assert store.get("locked") is True
+    assert store.get("sound_volume") == SOUND_VOLUME
+    store.close()
+    assert read(path)["ui_scale"] == 1.3
+    assert read(path)["locked"] is True
+
+
+def test_unchanged_patch_does_not_write(tmp_path, writes):
+    store = SettingsStore(tmp_path / "settings.json", write_delay=60)
+    store.update(sound_volume=store.get("sound_volume"))
+    store.close()
+    assert writes == []
+    assert not (tmp_path / "settings.json").exists()
+
+
+def test_burst_of_updates_coalesces_into_one_write(tmp_path, writes):
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path, write_delay=0.2)
+    for x in range(10):
+        store.update(position=[x, x])
+    deadline = time.time() + 3
+    while not writes and time.time() < deadline:
+        time.sleep(0.05)
+    time.sleep(0.3)
+    assert len(writes) == 1
+    assert read(path)["position"] == [9, 9]
+    store.close()
+    assert len(writes) == 1
+
+
+def test_close_flushes_pending_changes(tmp_path, writes):
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path, write_delay=60)
+    store.update(locked=True)
+    assert writes == []
+    store.close()
+    assert read(path)["locked"] is True
+    assert load_settings(path)["locked"] is True
+
+
+def test_failed_write_keeps_old_file_and_retries(tmp_path, writes, monkeypatch):
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path, write_delay=60)
+    store.update(ui_scale=1.2)
+    store.flush()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    store.update(ui_scale=1.5)
+    store.flush()
+    assert read(path)["ui_scale"] == 1.2
+    assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+    monkeypatch.undo()
+    store.close()
+    assert read(path)["ui_scale"] == 1.5
+
+
+def test_explicit_none_replaces_saved_value(tmp_path):
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path, write_delay=60)
+    store.update(quality_override=3)
+    store.flush()
+    assert read(path)["quality_override"] == 3
+
+    store.update(quality_override=None)
+    store.close()
+    assert read(path)["quality_override"] is None
+    assert load_settings(path)["quality_override"] is None
+    assert SettingsStore(path).get("quality_override", "unset") is None
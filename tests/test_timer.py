@@ -0,0 +1,67 @@
+"""
+TimerManager alert scheduling on a VirtualClock: saving settings must not
+play an ultimate alert a second time.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from clock import VirtualClock
+from timer import TimerManager
+
+
+class RecordingScheduler:
+    """Alert scheduler on the virtual clock that records (key, deadline, fired at)."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.pending = {}
+        self.fired = []
+
+    def schedule(self, key, deadline, cue=None, fallback=True, volume=None, on_fire=None):
+        self.cancel(key)
+
+        def fire():
+            del self.pending[key]
+            self.fired.append((key, deadline, self.clock.now()))
+            if on_fire:
+                on_fire()
+
+        self.pending[key] = self.clock.call_at(deadline, fire)
+
+    def cancel(self, key):
+        handle = self.pending.pop(key, None)
+        if handle:
+            handle.cancel()
+
+
+def make_manager():
+    clock = VirtualClock()
+    alerts = RecordingScheduler(clock)
+    manager = TimerManager(alert_scheduler=alerts, clock=clock)
+    manager.create_timer(0, "Ahri", [80.0, 60.0, 40.0], alert_threshold=3)
+    manager.start_timer(0)
+    return clock, alerts, manager
+
+
+def test_alerted_timer_is_not_rearmed_on_settings_save():
+    clock, alerts, manager = make_manager()
+    clock.advance(77.5)
+    assert alerts.fired == [(("ult", 0), 77.0, 77.0)]
+
+    manager.set_alert_threshold(3)
+    manager.set_alert_threshold(4)
+    clock.advance(5.0)
+    assert len(alerts.fired) == 1
+    assert manager.get_timer(0).sound_played
+
+
+def test_threshold_change_reschedules_pending_alert():
+    clock, alerts, manager = make_manager()
+    clock.advance(10.0)
+    manager.set_alert_threshold(10)
+    clock.advance(65.0)
+    assert alerts.fired == [(("ult", 0), 70.0, 70.0)]
@@ -0,0 +1,32 @@
+"""
+UIDispatcher metrics: queue depth and dispatch latency are in the metrics
+registry served on the Prometheus endpoint.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import metrics
+from ui_dispatch import UIDispatcher
+
+
+def test_queue_depth_and_latency_metrics():
+    latency = metrics.REGISTRY.get("ui_dispatch_latency_seconds")
+    observed = latency.count
+    dispatcher = UIDispatcher(root=None)
+    dispatcher.post(lambda: None)
+    dispatcher.post(lambda: None)
+    dispatcher.post(lambda: None, topic="levels")
+    dispatcher.post(lambda: None, topic="levels")
+    assert metrics.REGISTRY.get("ui_dispatch_queue_depth").value == 3
+
+    assert dispatcher.run_pending(limit=2) == 2
+    assert metrics.REGISTRY.get("ui_dispatch_queue_depth").value == 1
+    assert latency.count == observed + 2
+
+    text = metrics.REGISTRY.render_prometheus()
+    assert "ui_dispatch_queue_depth 1" in text
+    assert "ui_dispatch_latency_seconds_count" in text